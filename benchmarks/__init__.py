@@ -0,0 +1 @@
+"""Performance benchmarks for Lokus, run on generated specs."""
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+import contextlib
+import json
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+import click
+
+from benchmarks.compare import (
+    DEFAULT_MAD_FACTOR,
+    DEFAULT_MEMORY_TOLERANCE,
+    DEFAULT_MIN_DELTA,
+    DEFAULT_TOLERANCE,
+    compare_results,
+    format_comparisons,
+)
+from benchmarks.suite import (
+    DEFAULT_CONFIG,
+    DEFAULT_SIZES,
+    DEFAULT_SPEC_DIR,
+    PHASES,
+    run_suite,
+)
+from lokus.config_loader import load_config
+
+
+# Committed results that `compare` checks against
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+
+@click.group()
+def main() -> None:
+    """Lokus benchmarks: time each pipeline phase on generated specs."""
+
+
+def _load_results(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            results = json.load(f)
+    except FileNotFoundError:
+        print(f"Error: Benchmark results file not found at {path}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read benchmark results {path}: {e}")
+        return None
+    if not isinstance(results, dict) or not isinstance(results.get("scenarios"), list):
+        print(f"Error: {path} is not a benchmark results file.")
+        return None
+    return results
+
+
+def _load_benchmark_config(config: str) -> Dict[str, Any]:
+    # Configuration messages go to stderr, so stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        config_data = load_config(config)
+    if config_data is None:
+        sys.exit(2)  # Configuration error
+    return config_data
+
+
+@main.command("run")
+@click.option(
+    "--size",
+    "sizes",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help=f"Operations in a generated spec; repeatable. (default: {', '.join(map(str, DEFAULT_SIZES))})",
+)
+@click.option(
+    "--phase",
+    "phases",
+    type=click.Choice(PHASES),
+    multiple=True,
+    help="Measure only these phases; repeatable. (default: all)",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Timed runs per phase.",
+)
+@click.option(
+    "--no-memory",
+    is_flag=True,
+    help="Skip the extra traced run per phase that measures peak memory.",
+)
+@click.option(
+    "--config",
+    type=str,
+    default=DEFAULT_CONFIG,
+    help="Lokus configuration to scan with. (default: templates/configs/enterprise.yaml)",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Generator seed.")
+@click.option(
+    "--spec-dir",
+    type=str,
+    default=DEFAULT_SPEC_DIR,
+    show_default=True,
+    help="Directory where generated specs are kept between runs.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=str,
+    default=None,
+    help="Write the JSON results to this file instead of stdout.",
+)
+def run(
+    sizes: Tuple[int, ...],
+    phases: Tuple[str, ...],
+    repeat: int,
+    no_memory: bool,
+    config: str,
+    seed: int,
+    spec_dir: str,
+    output: Optional[str],
+) -> None:
+    """Run the benchmark scenarios and print throughput and peak memory as JSON."""
+    results = run_suite(
+        _load_benchmark_config(config),
+        sizes or DEFAULT_SIZES,
+        phases or PHASES,
+        repeat,
+        not no_memory,
+        seed,
+        spec_dir,
+        progress=lambda message: click.echo(message, err=True),
+        config_name=os.path.basename(config),
+    )
+    text = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        click.echo(f"Results written to {output}", err=True)
+    else:
+        click.echo(text)
+
+
+@main.command("compare")
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=str,
+    default=DEFAULT_BASELINE,
+    help="Results to compare against. (default: benchmarks/baseline.json)",
+)
+@click.option(
+    "--results",
+    "results_path",
+    type=str,
+    default=None,
+    help="Compare these saved results instead of running the scenarios again.",
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Timed runs per phase. (default: as in the baseline)",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TOLERANCE,
+    show_default=True,
+    help="Relative slowdown of a phase median tolerated in any case.",
+)
+@click.option(
+    "--mad-factor",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_MAD_FACTOR,
+    show_default=True,
+    help="Slowdowns within this many (scaled) MADs of either run are noise.",
+)
+@click.option(
+    "--min-delta",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_MIN_DELTA,
+    show_default=True,
+    help="Slowdowns below this many seconds are noise.",
+)
+@click.option(
+    "--memory-tolerance",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_MEMORY_TOLERANCE,
+    show_default=True,
+    help="Relative growth of a phase's peak memory tolerated.",
+)
+@click.option(
+    "--config",
+    type=str,
+    default=DEFAULT_CONFIG,
+    help="Lokus configuration to scan with. (default: templates/configs/enterprise.yaml)",
+)
+@click.option(
+    "--spec-dir",
+    type=str,
+    default=DEFAULT_SPEC_DIR,
+    show_default=True,
+    help="Directory where generated specs are kept between runs.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=str,
+    default=None,
+    help="Also write the results of this run to this file.",
+)
+def compare(
+    baseline_path: str,
+    results_path: Optional[str],
+    repeat: Optional[int],
+    tolerance: float,
+    mad_factor: float,
+    min_delta: float,
+    memory_tolerance: float,
+    config: str,
+    spec_dir: str,
+    output: Optional[str],
+) -> None:
+    """
+    Run the baseline's scenarios and fail on a significant regression.
+
+    Exits with 0 when no phase got slower or bigger beyond the thresholds,
+    1 on a regression and 2 when results cannot be read.
+    """
+    baseline = _load_results(baseline_path)
+    if baseline is None:
+        sys.exit(2)  # Baseline error
+
+    if results_path:
+        current = _load_results(results_path)
+        if current is None:
+            sys.exit(2)  # Results error
+    else:
+        # Same scenarios, phases, seed and settings as the baseline
+        scenarios = baseline["scenarios"]
+        phases = tuple(
+            phase
+            for phase in PHASES
+            if any(phase in scenario["phases"] for scenario in scenarios)
+        )
+        memory = any(
+            "peak_memory_bytes" in measurement
+            for scenario in scenarios
+            for measurement in scenario["phases"].values()
+        )
+        if baseline.get("config") and baseline["config"] != os.path.basename(config):
+            print(
+                f"Warning: the baseline was measured with {baseline['config']}, not {os.path.basename(config)}."
+            )
+        current = run_suite(
+            _load_benchmark_config(config),
+            tuple(scenario["operations"] for scenario in scenarios),
+            phases,
+            repeat or baseline.get("repeat", 1),
+            memory,
+            baseline.get("seed", 0),
+            spec_dir,
+            progress=lambda message: click.echo(message, err=True),
+            config_name=os.path.basename(config),
+        )
+        if output:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(json.dumps(current, indent=2) + "\n")
+
+    comparisons = compare_results(
+        baseline, current, tolerance, mad_factor, min_delta, memory_tolerance
+    )
+    if not comparisons:
+        print(
+            "Error: The results have no scenario and phase in common with the baseline."
+        )
+        sys.exit(2)  # Nothing to compare
+    click.echo(format_comparisons(comparisons))
+
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        click.echo(f"\n{len(regressions)} regression(s) beyond the noise thresholds.")
+        sys.exit(1)  # Regression
+    click.echo("\nNo regressions beyond the noise thresholds.")
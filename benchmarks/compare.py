@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import statistics
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+# Scales the median absolute deviation to the standard deviation of
+# normally distributed timings
+MAD_SCALE = 1.4826
+
+# A phase regresses when its median grows by more than all of these
+DEFAULT_TOLERANCE = 0.10  # relative to the baseline median
+DEFAULT_MAD_FACTOR = 3.0  # times the (scaled) MAD of either run
+DEFAULT_MIN_DELTA = 0.005  # seconds; below this, differences are timer noise
+
+# Peak memory is nearly deterministic, so a relative bound is enough
+DEFAULT_MEMORY_TOLERANCE = 0.20
+
+
+def mad(values: Sequence[float]) -> float:
+    """Median absolute deviation, scaled to be comparable to a standard deviation."""
+    if len(values) < 2:
+        return 0.0
+    median = statistics.median(values)
+    return MAD_SCALE * statistics.median(abs(value - median) for value in values)
+
+
+@dataclass
+class Comparison:
+    """One phase and metric of one scenario, baseline against current run."""
+
+    operations: int
+    phase: str
+    metric: str  # "seconds" or "memory"
+    baseline: float
+    current: float
+    allowed: float  # largest increase not counted as a regression
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return (self.current - self.baseline) / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        return self.current - self.baseline > self.allowed
+
+
+def _scenarios(results: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    return {
+        scenario["operations"]: scenario["phases"]
+        for scenario in results.get("scenarios", [])
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    mad_factor: float = DEFAULT_MAD_FACTOR,
+    min_delta: float = DEFAULT_MIN_DELTA,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> List[Comparison]:
+    """
+    Compares the phases measured in both results.
+
+    A phase is slower only when its median time grows by more than the
+    tolerance, by more than `mad_factor` times the noise (MAD) of either
+    run, and by more than `min_delta` seconds. Peak memory is compared
+    when both runs traced it.
+    """
+    comparisons = []
+    current_scenarios = _scenarios(current)
+    for operations, baseline_phases in _scenarios(baseline).items():
+        current_phases = current_scenarios.get(operations, {})
+        for phase, before in baseline_phases.items():
+            after = current_phases.get(phase)
+            if after is None:
+                continue
+            noise = max(mad(before["seconds"]), mad(after["seconds"]))
+            comparisons.append(
+                Comparison(
+                    operations,
+                    phase,
+                    "seconds",
+                    before["median_seconds"],
+                    after["median_seconds"],
+                    max(
+                        tolerance * before["median_seconds"],
+                        mad_factor * noise,
+                        min_delta,
+                    ),
+                )
+            )
+            if before.get("peak_memory_bytes") and after.get("peak_memory_bytes"):
+                comparisons.append(
+                    Comparison(
+                        operations,
+                        phase,
+                        "memory",
+                        before["peak_memory_bytes"],
+                        after["peak_memory_bytes"],
+                        memory_tolerance * before["peak_memory_bytes"],
+                    )
+                )
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """Renders the comparisons as an aligned text table."""
+
+    def value(comparison: Comparison, amount: float) -> str:
+        if comparison.metric == "memory":
+            return f"{amount / (1024 * 1024):.1f} MiB"
+        return f"{amount * 1000:.1f} ms"
+
+    rows = [
+        ("OPERATIONS", "PHASE", "METRIC", "BASELINE", "CURRENT", "CHANGE", "STATUS")
+    ]
+    for comparison in comparisons:
+        change = comparison.change
+        rows.append(
+            (
+                str(comparison.operations),
+                comparison.phase,
+                comparison.metric,
+                value(comparison, comparison.baseline),
+                value(comparison, comparison.current),
+                f"{change:+.1%}" if change is not None else "-",
+                "REGRESSION" if comparison.regressed else "ok",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+import math
+import random
+from typing import Any, Dict
+
+import yaml
+
+# Operations per path item, in order
+METHODS = ("get", "put", "delete", "post")
+
+# Property names drawn for schemas; some are personal data (LGPD-003/005)
+# or forbidden keys (deep search), so every rule has something to report
+PROPERTY_NAMES = (
+    "id",
+    "status",
+    "created_at",
+    "updated_at",
+    "amount",
+    "currency",
+    "quantity",
+    "title",
+    "reference",
+    "tags",
+    "email",
+    "cpf",
+    "phone",
+    "name",
+    "birth_date",
+    "address",
+    "password",
+    "access_token",
+    "internal_notes",
+)
+
+WORDS = (
+    "returns",
+    "the",
+    "resource",
+    "for",
+    "a",
+    "customer",
+    "account",
+    "order",
+    "with",
+    "pagination",
+    "and",
+    "filters",
+    "applied",
+    "by",
+    "identifier",
+    "when",
+    "available",
+)
+
+# Sensitive samples mixed into descriptions and examples (LGPD-001/002)
+SENSITIVE_SAMPLES = ("123.456.789-09", "maria@example.com", "+55 11 91234-5678")
+
+
+class SpecGenerator:
+    """
+    Generates synthetic OpenAPI 3 specs of a given size.
+
+    Output only depends on the parameters and the seed, so the same
+    scenario gives the same spec on every machine and commit.
+
+    Args:
+        operations: Number of operations, spread over path items.
+        schemas: Number of component schemas (default: one per 4 operations).
+        depth: Nesting depth of object properties in schemas.
+        anchor_reuse: Fraction of operations sharing one response object,
+            written as a YAML anchor and aliases.
+        description_words: Words per description.
+        seed: Random seed.
+    """
+
+    def __init__(
+        self,
+        operations: int,
+        schemas: int = 0,
+        depth: int = 3,
+        anchor_reuse: float = 0.1,
+        description_words: int = 20,
+        seed: int = 0,
+    ):
+        self.operations = operations
+        self.schemas = schemas or max(1, operations // 4)
+        self.depth = depth
+        self.anchor_reuse = anchor_reuse
+        self.description_words = description_words
+        self.seed = seed
+
+    def _description(self, rng: random.Random) -> str:
+        words = [rng.choice(WORDS) for _ in range(self.description_words)]
+        if words and rng.random() < 0.05:
+            words[-1] = rng.choice(SENSITIVE_SAMPLES)
+        return " ".join(words)
+
+    def _properties(self, rng: random.Random, depth: int) -> Dict[str, Any]:
+        properties: Dict[str, Any] = {}
+        for name in rng.sample(PROPERTY_NAMES, 4):
+            properties[name] = {"type": "string", "example": f"{name}-value"}
+            if name in ("email", "cpf", "phone") and rng.random() < 0.2:
+                properties[name]["example"] = rng.choice(SENSITIVE_SAMPLES)
+        if depth > 1:
+            properties["details"] = {
+                "type": "object",
+                "properties": self._properties(rng, depth - 1),
+            }
+        return properties
+
+    def _schema(self, rng: random.Random) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "description": self._description(rng),
+            "properties": self._properties(rng, self.depth),
+        }
+
+    def _operation(
+        self,
+        rng: random.Random,
+        index: int,
+        method: str,
+        shared_responses: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        schema_ref = f"#/components/schemas/Schema{rng.randrange(self.schemas)}"
+        operation: Dict[str, Any] = {
+            "operationId": f"{method}Resource{index}",
+            "summary": f"{method.upper()} resource {index}",
+            "description": self._description(rng),
+            "parameters": [
+                {
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                }
+            ],
+        }
+        if rng.random() < 0.05:
+            operation["parameters"].append(
+                {"name": "cpf", "in": "query", "schema": {"type": "string"}}
+            )
+        # Some operations are left open, so the security rules report them
+        if rng.random() < 0.7:
+            operation["security"] = [{"bearerAuth": []}]
+        if method in ("put", "post"):
+            operation["requestBody"] = {
+                "content": {"application/json": {"schema": {"$ref": schema_ref}}}
+            }
+        if rng.random() < self.anchor_reuse:
+            # The same object everywhere: the dumper writes an anchor and aliases
+            operation["responses"] = shared_responses
+        else:
+            operation["responses"] = {
+                "200": {
+                    "description": "OK",
+                    "content": {"application/json": {"schema": {"$ref": schema_ref}}},
+                },
+                "404": {"description": "Not found"},
+            }
+        return operation
+
+    def generate(self) -> Dict[str, Any]:
+        """Returns the spec as a dict; shared objects stay shared."""
+        rng = random.Random(self.seed)
+        shared_responses = {
+            "200": {"description": "OK"},
+            "default": {"description": "Unexpected error"},
+        }
+        paths: Dict[str, Any] = {}
+        path_count = math.ceil(self.operations / len(METHODS))
+        remaining = self.operations
+        for index in range(path_count):
+            path_item: Dict[str, Any] = {}
+            for method in METHODS[: min(len(METHODS), remaining)]:
+                path_item[method] = self._operation(
+                    rng, index, method, shared_responses
+                )
+            remaining -= len(path_item)
+            paths[f"/resources{index}/{{id}}"] = path_item
+
+        schemas = {f"Schema{index}": self._schema(rng) for index in range(self.schemas)}
+        return {
+            "openapi": "3.0.3",
+            "info": {
+                "title": "Synthetic API",
+                "version": "1.0.0",
+                "description": self._description(rng),
+                "contact": {"email": "api@example.com"},
+            },
+            "paths": paths,
+            "components": {
+                "schemas": schemas,
+                "securitySchemes": {"bearerAuth": {"type": "http", "scheme": "bearer"}},
+            },
+        }
+
+    def to_yaml(self) -> str:
+        """Returns the spec as YAML text, with anchors for shared objects."""
+        dumper: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        return yaml.dump(
+            self.generate(), Dumper=dumper, sort_keys=False, allow_unicode=True
+        )
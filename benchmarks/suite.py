@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+import contextlib
+import gc
+import hashlib
+import io
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.generator import SpecGenerator
+from lokus import __version__
+from lokus.api import Ruleset
+from lokus.deep_search import deep_search_forbidden_keys
+from lokus.html_reporter import write_html
+from lokus.reporter import report_findings
+from lokus.scanner import ScanResult
+from lokus.yaml_parser import load_swagger_spec
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Pipeline phases, in the order they run; later phases use earlier results
+PHASES = ("load", "deep_search", "security", "lgpd", "report", "html", "pdf")
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_CONFIG = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "templates",
+    "configs",
+    "enterprise.yaml",
+)
+DEFAULT_SPEC_DIR = ".lokus-bench"
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(
+    run: Callable[[], Any], repeat: int = 1, memory: bool = True
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Times `run` `repeat` times, then runs it once more under tracemalloc.
+
+    Timed runs are not traced, since tracing slows allocations down.
+    Returns the value of the last run and its measurements.
+    """
+    seconds = []
+    value = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        value = run()
+        seconds.append(time.perf_counter() - start)
+    measurement: Dict[str, Any] = {
+        "seconds": seconds,
+        "median_seconds": statistics.median(seconds),
+    }
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            value = run()
+            measurement["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return value, measurement
+
+
+def spec_file(operations: int, seed: int, spec_dir: str) -> str:
+    """Generates the spec of a scenario, or reuses it from an earlier run."""
+    generator = SpecGenerator(operations, seed=seed)
+    key = hashlib.sha256(
+        repr(sorted(vars(generator).items())).encode("utf-8")
+    ).hexdigest()[:12]
+    path = os.path.join(spec_dir, f"spec-{operations}-{key}.yaml")
+    if not os.path.exists(path):
+        os.makedirs(spec_dir, exist_ok=True)
+        partial = f"{path}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            f.write(generator.to_yaml())
+        os.replace(partial, path)
+    return path
+
+
+def run_scenario(
+    operations: int,
+    ruleset: Ruleset,
+    phases: Tuple[str, ...] = PHASES,
+    repeat: int = 1,
+    memory: bool = True,
+    seed: int = 0,
+    spec_dir: str = DEFAULT_SPEC_DIR,
+) -> Dict[str, Any]:
+    """Runs the pipeline on one generated spec, measuring the chosen phases."""
+    path = spec_file(operations, seed, spec_dir)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def phase(name: str, run: Callable[[], Any]) -> Any:
+        if name not in phases:
+            return run()
+        value, measurement = measure(run, repeat, memory)
+        median = measurement["median_seconds"]
+        measurement["operations_per_second"] = operations / median if median else None
+        results[name] = measurement
+        return value
+
+    spec = phase("load", lambda: load_swagger_spec(path, ruleset.limits))
+    if spec is None:
+        raise RuntimeError(f"Could not load generated spec {path}")
+    if "load" in results and results["load"]["median_seconds"]:
+        results["load"]["bytes_per_second"] = (
+            os.path.getsize(path) / results["load"]["median_seconds"]
+        )
+
+    result = ScanResult()
+    if {"deep_search", "report", "html", "pdf"} & set(phases):
+        result.findings = phase(
+            "deep_search",
+            lambda: deep_search_forbidden_keys(
+                spec, "", ruleset.config_data, rules=ruleset.deep_search_rules
+            ),
+        )
+    if {"security", "report", "html", "pdf"} & set(phases):
+        result.security_issues = phase(
+            "security", lambda: ruleset.security_validator.validate_spec(spec)
+        )
+    if {"lgpd", "report", "html", "pdf"} & set(phases):
+        result.lgpd_issues = phase(
+            "lgpd", lambda: ruleset.lgpd_validator.validate_spec(spec)
+        )
+
+    if "report" in phases:
+
+        def report() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                report_findings(
+                    result.findings,
+                    path,
+                    "benchmark",
+                    output_json=True,
+                    security_issues=result.security_issues,
+                    lgpd_issues=result.lgpd_issues,
+                )
+
+        phase("report", report)
+    if "html" in phases:
+
+        def html() -> None:
+            with open(os.devnull, "w", encoding="utf-8") as out:
+                write_html(
+                    out,
+                    path,
+                    result.findings,
+                    result.security_issues,
+                    result.lgpd_issues,
+                )
+
+        phase("html", html)
+    if "pdf" in phases:
+        # Imported here so runs without the pdf phase do not load reportlab
+        from lokus.pdf_reporter import write_pdf
+
+        def pdf() -> None:
+            with open(os.devnull, "wb") as stream:
+                write_pdf(result, stream, path)
+
+        phase("pdf", pdf)
+
+    return {
+        "operations": operations,
+        "spec_bytes": os.path.getsize(path),
+        "entries": {
+            "findings": len(result.findings),
+            "security_issues": len(result.security_issues),
+            "lgpd_issues": len(result.lgpd_issues),
+        },
+        "phases": results,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def run_suite(
+    config_data: Dict[str, Any],
+    sizes: Tuple[int, ...] = DEFAULT_SIZES,
+    phases: Tuple[str, ...] = PHASES,
+    repeat: int = 1,
+    memory: bool = True,
+    seed: int = 0,
+    spec_dir: str = DEFAULT_SPEC_DIR,
+    progress: Optional[Callable[[str], None]] = None,
+    config_name: str = "",
+) -> Dict[str, Any]:
+    """Runs every scenario and returns the JSON-ready report."""
+    ruleset = Ruleset(config_data)
+
+    scenarios: List[Dict[str, Any]] = []
+    for operations in sizes:
+        if progress:
+            progress(f"Running scenario with {operations} operation(s)...")
+        scenarios.append(
+            run_scenario(operations, ruleset, phases, repeat, memory, seed, spec_dir)
+        )
+    return {
+        "lokus_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config_name,
+        "seed": seed,
+        "repeat": repeat,
+        "scenarios": scenarios,
+    }
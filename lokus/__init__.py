@@ -11,3 +11,9 @@ import_error_var = None
 __shortname__ = "Lokus"
 __longname__ = "Lokus: Find issues in your APIs from the docs"
 __version__ = "1.0.1"
+
+from lokus.aio import AsyncScanner, ascan  # noqa: E402
+from lokus.api import Ruleset, ScanError, scan  # noqa: E402
+from lokus.scanner import ScanResult  # noqa: E402
+
+__all__ = ["AsyncScanner", "Ruleset", "ScanError", "ScanResult", "ascan", "scan"]
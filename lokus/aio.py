@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from lokus.api import Ruleset, ScanError, SpecSource, resolve_ruleset
+from lokus.limits import LimitExceeded, ScanLimits
+from lokus.scanner import ScanResult
+from lokus.yaml_parser import parse_swagger_spec
+
+# Scans allowed in flight at once when no limit is given
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def _read_file(source: str, limits: ScanLimits) -> bytes:
+    try:
+        with open(source, "rb") as f:
+            limits.check_size(os.fstat(f.fileno()).st_size, source)
+            return f.read()
+    except OSError as e:
+        raise ScanError(f"Could not read Swagger/OpenAPI file {source}: {e}")
+    except LimitExceeded as e:
+        raise ScanError(str(e))
+
+
+def _parse_and_scan(
+    ruleset: Ruleset, content: Union[Dict[str, Any], bytes], source: str
+) -> ScanResult:
+    """Runs on the CPU executor: parses the document and scans it."""
+    if isinstance(content, dict):
+        spec_data = content
+    else:
+        try:
+            spec_data = parse_swagger_spec(content, source, ruleset.limits)
+        except ValueError as e:
+            raise ScanError(str(e))
+    return ruleset.scan(spec_data)
+
+
+class AsyncScanner:
+    """
+    Scans specs from asyncio code without blocking the event loop.
+
+    Files are read on the loop's default thread pool, while parsing and
+    scanning run on `executor` (a ThreadPoolExecutor or ProcessPoolExecutor;
+    the loop's default executor when None). At most `max_concurrency` scans
+    are in flight; further callers wait for a slot.
+    """
+
+    def __init__(
+        self,
+        ruleset: Ruleset,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.ruleset = ruleset
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _slots(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def scan(self, spec_or_path: SpecSource) -> ScanResult:
+        """
+        Scans one spec (parsed dict, bytes or file path).
+
+        Raises:
+            ScanError: If the spec cannot be read or parsed.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._slots():
+            if isinstance(spec_or_path, (dict, bytes)):
+                content, source = spec_or_path, "<bytes>"
+            else:
+                source = os.fspath(spec_or_path)
+                content = await loop.run_in_executor(
+                    None, _read_file, source, self.ruleset.limits
+                )
+            return await loop.run_in_executor(
+                self.executor, _parse_and_scan, self.ruleset, content, source
+            )
+
+    async def _scan_tagged(
+        self, spec_or_path: SpecSource
+    ) -> Tuple[SpecSource, Union[ScanResult, ScanError]]:
+        try:
+            return spec_or_path, await self.scan(spec_or_path)
+        except ScanError as e:
+            return spec_or_path, e
+
+    async def scan_many(
+        self, specs: Union[Iterable[SpecSource], AsyncIterable[SpecSource]]
+    ) -> AsyncIterator[Tuple[SpecSource, Union[ScanResult, ScanError]]]:
+        """
+        Scans many specs, yielding (spec, result or ScanError) as they finish.
+
+        Only `max_concurrency` specs are taken from `specs` at a time, so a
+        slow consumer or an unbounded (async) iterable never piles up work.
+        """
+        pending: Set["asyncio.Future[Any]"] = set()
+
+        async def sources() -> AsyncIterator[SpecSource]:
+            if hasattr(specs, "__aiter__"):
+                async for spec in specs:
+                    yield spec
+            else:
+                for spec in specs:
+                    yield spec
+
+        iterator = sources()
+        while True:
+            # Make room before taking the next spec, so nothing waits unscheduled
+            while len(pending) >= self.max_concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            try:
+                spec = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            pending.add(asyncio.ensure_future(self._scan_tagged(spec)))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+
+
+async def ascan(
+    spec_or_path: SpecSource,
+    config_or_ruleset: Union[Ruleset, Dict[str, Any], str, None] = None,
+    rules: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None,
+    min_severity: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> ScanResult:
+    """
+    Async counterpart of lokus.scan.
+
+    For many specs, build one AsyncScanner and reuse it, so its concurrency
+    limit applies across calls.
+
+    Raises:
+        ScanError: If the spec or the configuration cannot be loaded.
+    """
+    ruleset = resolve_ruleset(config_or_ruleset, rules, skip, min_severity)
+    return await AsyncScanner(ruleset, executor).scan(spec_or_path)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import os
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from lokus.baseline import SEVERITY_LEVELS, FindingFilter
+from lokus.config_loader import load_config
+from lokus.deep_search import DEEP_SEARCH_RULES, DeepSearchRules
+from lokus.incremental import scan_settings_key
+from lokus.lgpd_validator import LGPDValidator
+from lokus.limits import ScanLimits
+from lokus.metrics import RunMetrics
+from lokus.rules import RuleSelection
+from lokus.scanner import ScanResult, run_scan
+from lokus.security_validator import SecurityValidator
+from lokus.yaml_parser import parse_swagger_spec
+
+# Every rule Lokus knows, by validator name
+KNOWN_RULES = {
+    "deep_search": DEEP_SEARCH_RULES,
+    SecurityValidator.name: SecurityValidator.RULES,
+    LGPDValidator.name: LGPDValidator.RULES,
+}
+
+SpecSource = Union[Dict[str, Any], bytes, str, "os.PathLike[str]"]
+
+# Rulesets rebuilt from pickles (e.g. in worker processes), by settings key
+_UNPICKLED_RULESETS: Dict[str, "Ruleset"] = {}
+
+
+class ScanError(ValueError):
+    """Raised by the public API when a spec or configuration cannot be loaded."""
+
+
+class Ruleset:
+    """
+    A configuration compiled once and reused for any number of scans.
+
+    Holds the rule selection, the severity threshold, the baseline, the
+    guardrail limits, the compiled deep search rules and the validator
+    instances. Scans never
+    modify it, so one instance can be shared, including between threads.
+    """
+
+    def __init__(
+        self,
+        config_data: Dict[str, Any],
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        min_severity: Optional[str] = None,
+        baseline: Optional[Iterable[str]] = None,
+    ):
+        if min_severity is not None and min_severity.upper() not in SEVERITY_LEVELS:
+            raise ScanError(f"Invalid min_severity '{min_severity}'")
+        self.config_data = config_data
+        # Selectors as given, before merging with the config `rules` section
+        self.only = list(only or ())
+        self.skip = list(skip or ())
+        self.selection = RuleSelection.from_options(config_data, only, skip)
+        self.min_severity = min_severity.upper() if min_severity else None
+        self.baseline = frozenset(baseline or ())
+        self.limits = ScanLimits.from_config(config_data)
+        self.deep_search_rules = DeepSearchRules.compile(config_data, self.selection)
+        # Validators only keep compiled rules, so one instance serves every scan
+        severity_filter = FindingFilter(self.min_severity)
+        self.security_validator = SecurityValidator(self.selection, severity_filter)
+        self.lgpd_validator = LGPDValidator(self.selection, severity_filter)
+        self.warnings: List[str] = list(self.deep_search_rules.warnings) + [
+            f"Rule selector '{selector}' does not match any rule."
+            for selector in self.selection.unmatched(KNOWN_RULES)
+        ]
+        self.settings_key = scan_settings_key(
+            config_data,
+            self.selection.only,
+            self.selection.skip,
+            self.min_severity,
+            self.baseline,
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        config_path: Union[str, "os.PathLike[str]"],
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+        min_severity: Optional[str] = None,
+        baseline: Optional[Iterable[str]] = None,
+    ) -> "Ruleset":
+        """
+        Loads and compiles a configuration file without printing.
+
+        Raises:
+            ScanError: If the configuration cannot be loaded.
+        """
+        messages = io.StringIO()
+        # load_config reports problems on stdout; keep them for the exception
+        with contextlib.redirect_stdout(messages):
+            config_data = load_config(os.fspath(config_path))
+        if config_data is None:
+            raise ScanError(
+                messages.getvalue().strip() or f"Invalid configuration {config_path}"
+            )
+        return cls(config_data, only, skip, min_severity, baseline)
+
+    def __reduce__(self):
+        # Ship the settings, not the compiled state; each process compiles once
+        return (
+            _restore_ruleset,
+            (
+                self.settings_key,
+                self.config_data,
+                self.only,
+                self.skip,
+                self.min_severity,
+                sorted(self.baseline),
+            ),
+        )
+
+    def finding_filter(self) -> FindingFilter:
+        """Returns a fresh filter, so suppression counts are per scan."""
+        return FindingFilter(self.min_severity, self.baseline)
+
+    def scan(
+        self, spec_data: Dict[str, Any], metrics: Optional[RunMetrics] = None
+    ) -> ScanResult:
+        """Scans an already parsed spec, adding its cost to `metrics` if given."""
+        return run_scan(
+            spec_data,
+            self.config_data,
+            self.selection,
+            self.finding_filter(),
+            deep_search_rules=self.deep_search_rules,
+            security_validator=self.security_validator,
+            lgpd_validator=self.lgpd_validator,
+            limits=self.limits,
+            metrics=metrics,
+        )
+
+
+def _restore_ruleset(
+    settings_key: str,
+    config_data: Dict[str, Any],
+    only: List[str],
+    skip: List[str],
+    min_severity: Optional[str],
+    baseline: List[str],
+) -> Ruleset:
+    ruleset = _UNPICKLED_RULESETS.get(settings_key)
+    if ruleset is None:
+        ruleset = Ruleset(config_data, only, skip, min_severity, baseline)
+        _UNPICKLED_RULESETS[settings_key] = ruleset
+    return ruleset
+
+
+def read_spec(
+    spec_or_path: SpecSource, limits: Optional[ScanLimits] = None
+) -> Dict[str, Any]:
+    """
+    Turns a parsed spec, document content (bytes) or a file path into spec data.
+
+    Raises:
+        ScanError: If the file cannot be read, is over one of the `limits`
+            or is not a valid spec.
+    """
+    if isinstance(spec_or_path, dict):
+        return spec_or_path
+    limits = limits or ScanLimits()
+    try:
+        if isinstance(spec_or_path, bytes):
+            content, source = spec_or_path, "<bytes>"
+        else:
+            source = os.fspath(spec_or_path)
+            try:
+                with open(source, "rb") as f:
+                    limits.check_size(os.fstat(f.fileno()).st_size, source)
+                    content = f.read()
+            except OSError as e:
+                raise ScanError(f"Could not read Swagger/OpenAPI file {source}: {e}")
+        return parse_swagger_spec(content, source, limits)
+    except ScanError:
+        raise
+    except ValueError as e:
+        raise ScanError(str(e))
+
+
+def resolve_ruleset(
+    config_or_ruleset: Union[Ruleset, Dict[str, Any], str, None] = None,
+    rules: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None,
+    min_severity: Optional[str] = None,
+) -> Ruleset:
+    """Returns the given Ruleset, or compiles one from a config dict or file."""
+    if isinstance(config_or_ruleset, Ruleset):
+        if rules is not None or skip is not None or min_severity is not None:
+            raise ScanError(
+                "Rule options must be given when building the Ruleset, not per scan"
+            )
+        ruleset = config_or_ruleset
+    elif isinstance(config_or_ruleset, dict):
+        ruleset = Ruleset(config_or_ruleset, rules, skip, min_severity)
+    elif config_or_ruleset is None:
+        ruleset = Ruleset({}, rules, skip, min_severity)
+    else:
+        ruleset = Ruleset.from_file(config_or_ruleset, rules, skip, min_severity)
+
+    return ruleset
+
+
+def scan(
+    spec_or_path: SpecSource,
+    config_or_ruleset: Union[Ruleset, Dict[str, Any], str, None] = None,
+    rules: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None,
+    min_severity: Optional[str] = None,
+) -> ScanResult:
+    """
+    Scans one spec in-process and returns its structured result.
+
+    Args:
+        spec_or_path: A parsed spec (dict), document content (bytes) or a
+            path to a YAML/JSON file.
+        config_or_ruleset: A compiled Ruleset (fastest when scanning many
+            specs), a configuration dict or a configuration file path. With
+            None, only the security and LGPD validators apply.
+        rules: Selectors of the only rules to run ('BOLA-*', 'lgpd', ...).
+        skip: Selectors of rules not to run.
+        min_severity: Only keep issues at or above this severity.
+
+    Raises:
+        ScanError: If the spec or the configuration cannot be loaded, or
+            rule options are combined with a Ruleset.
+    """
+    ruleset = resolve_ruleset(config_or_ruleset, rules, skip, min_severity)
+    return ruleset.scan(read_spec(spec_or_path, ruleset.limits))
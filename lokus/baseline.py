@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Severity order shared by security issues, LGPD issues and deep search findings
+SEVERITY_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+SEVERITY_RANK = {level: rank for rank, level in enumerate(SEVERITY_LEVELS)}
+
+# Deep search findings carry no severity of their own
+DEEP_SEARCH_SEVERITY = "HIGH"
+
+BASELINE_VERSION = 1
+
+
+def normalize_path(path: str) -> str:
+    """Normalizes a dotted finding path so equivalent paths fingerprint equally."""
+    parts = [part.strip() for part in str(path or "").split(".")]
+    return ".".join(part for part in parts if part)
+
+
+def fingerprint(rule_id: str, path: str, key: str = "") -> str:
+    """Returns a stable fingerprint for a finding: rule ID + normalized path + key."""
+    raw = "\0".join((rule_id, normalize_path(path), str(key or "")))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def finding_fingerprint(finding: Dict[str, Any]) -> str:
+    """Fingerprint of a deep search finding, whose rule ID is its type."""
+    return fingerprint(
+        finding.get("type", ""), finding.get("path", ""), finding.get("key", "")
+    )
+
+
+def issue_fingerprint(issue: Any) -> str:
+    """Fingerprint of a SecurityIssue or LGPDIssue, with the issue's key if it has one."""
+    return fingerprint(issue.rule_id, issue.path, getattr(issue, "key", ""))
+
+
+class FindingFilter:
+    """
+    Drops findings at emission time.
+
+    Findings below `min_severity` or whose fingerprint is in the baseline
+    set are rejected in O(1); rejected baseline matches are counted.
+    """
+
+    def __init__(
+        self,
+        min_severity: Optional[str] = None,
+        baseline: Optional[Iterable[str]] = None,
+    ):
+        self.min_rank = SEVERITY_RANK[min_severity.upper()] if min_severity else 0
+        self.baseline: Set[str] = set(baseline or ())
+        self.suppressed = 0
+
+    def severity_enabled(self, severity: str) -> bool:
+        return SEVERITY_RANK.get(severity, len(SEVERITY_LEVELS)) >= self.min_rank
+
+    def accepts(
+        self, rule_id: str, path: str, key: str = "", severity: str = ""
+    ) -> bool:
+        if severity and not self.severity_enabled(severity):
+            return False
+        if self.baseline and fingerprint(rule_id, path, key) in self.baseline:
+            self.suppressed += 1
+            return False
+        return True
+
+
+def load_baseline(baseline_path: str) -> Optional[Set[str]]:
+    """
+    Loads known fingerprints from a baseline file.
+
+    Accepts files written by --write-baseline as well as Lokus JSON
+    reports (every "fingerprint" field is collected).
+    """
+    try:
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"Error: Baseline file not found at {baseline_path}")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"Error parsing baseline file {baseline_path}: {e}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read baseline file {baseline_path}: {e}")
+        return None
+
+    if isinstance(data, dict) and isinstance(data.get("fingerprints"), list):
+        return {str(value) for value in data["fingerprints"]}
+
+    if isinstance(data, dict):
+        fingerprints = set()
+        for section in ("findings", "security_issues", "lgpd_issues"):
+            for item in data.get(section) or []:
+                if isinstance(item, dict) and item.get("fingerprint"):
+                    fingerprints.add(item["fingerprint"])
+        return fingerprints
+
+    print(f"Error: Baseline file {baseline_path} is not a valid baseline.")
+    return None
+
+
+def write_baseline(baseline_path: str, fingerprints: Iterable[str]) -> None:
+    """Writes fingerprints to a baseline file in a stable, diff-friendly order."""
+    with open(baseline_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": BASELINE_VERSION, "fingerprints": sorted(set(fingerprints))},
+            f,
+            indent=2,
+        )
+        f.write("\n")
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import sys
+from typing import Optional
+
+
+def file_digest(file_path: str) -> Optional[str]:
+    """SHA-256 of a file's content, or None if it cannot be read."""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def user_cache_dir() -> str:
+    """
+    The per-user cache directory of Lokus: LOCALAPPDATA on Windows,
+    ~/Library/Caches on macOS and XDG_CACHE_HOME (or ~/.cache) elsewhere.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "lokus")
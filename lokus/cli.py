@@ -1,22 +1,105 @@
+import os
 import sys
+import time
+from json import dumps
+from typing import Dict, List, Optional, Tuple
 
 import click
 
+from lokus.api import Ruleset
+from lokus.baseline import (
+    SEVERITY_LEVELS,
+    FindingFilter,
+    load_baseline,
+    write_baseline,
+)
+from lokus.cache_files import user_cache_dir
 from lokus.config_loader import load_config
-from lokus.deep_search import deep_search_forbidden_keys
-from lokus.lgpd_validator import LGPDValidator
-from lokus.pdf_reporter import pdf_reporter
-from lokus.reporter import report_findings
-from lokus.security_validator import SecurityValidator
-from lokus.yaml_parser import load_swagger_spec
+from lokus.html_reporter import html_reporter
+from lokus.incremental import (
+    DEFAULT_CACHE_DIR,
+    ResultCache,
+    external_ref_files,
+    find_spec_files,
+    git_changed_files,
+)
+from lokus.metrics import METRICS_FORMATS, RunMetrics, timed_phase
+from lokus.parallel import scan_parallel
+from lokus.pdf_jobs import PdfRenderer, validate_pdf_name
+from lokus.positions import PositionIndex
+from lokus.reporter import report_batch, report_compact, report_findings
+from lokus.scanner import ScanResult, run_scan
+from lokus.server import DEFAULT_PORT, ScanService, create_server, remote_scan
+from lokus.sharding import (
+    MODE_FILES,
+    MODE_SPEC,
+    build_partial,
+    load_partial,
+    merge_partials,
+    parse_shard,
+    scan_spec_shard,
+    shard_files,
+)
+from lokus.spec_diff import diff_specs
+from lokus.watch import SpecWatcher
+from lokus.yaml_parser import (
+    SPEC_FILE_EXTENSIONS,
+    is_openapi_document,
+    load_swagger_spec,
+)
+
+
+class DefaultCommandGroup(click.Group):
+    """Runs the `scan` command when no subcommand is named, so `lokus SPEC` keeps working."""
 
+    default_command = "scan"
 
-@click.command()
+    def parse_args(self, ctx: click.Context, args: list) -> list:
+        if not args or (
+            args[0] not in self.commands and args[0] not in ("--help", "--version")
+        ):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
 @click.version_option(prog_name="lokus")
+def main() -> None:
+    """
+    Lokus: find security and LGPD issues in your APIs from their docs.
+
+    `lokus SPEC [OPTIONS]` is short for `lokus scan SPEC [OPTIONS]`; run
+    `lokus scan --help` for the scan options.
+    """
+
+
+def _parse_pdf_name_option(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[str]:
+    if value is not None:
+        try:
+            validate_pdf_name(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+    return value
+
+
+def _parse_shard_option(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[Tuple[int, int]]:
+    if value is None:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+@main.command("scan")
 @click.argument(
     "swagger_file",
     type=str,
-    required=True,
+    nargs=-1,
 )
 @click.option(
     "--config",
@@ -27,7 +110,219 @@ from lokus.yaml_parser import load_swagger_spec
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output.")
 @click.option("--json", is_flag=True, help="Change output format to JSON")
 @click.option("--pdf", is_flag=True, help="Generate a PDF file with report findings.")
-def main(swagger_file: str, config: str, verbose: bool, json: bool, pdf: bool) -> None:
+@click.option(
+    "--pdf-dir",
+    type=str,
+    default=".",
+    help="Directory for PDF reports, created if needed. (default: current directory)",
+)
+@click.option(
+    "--pdf-name",
+    type=str,
+    default=None,
+    callback=_parse_pdf_name_option,
+    help="File name template for PDF reports: {stem} is the spec file name without extension, {timestamp} the start of the run. (default: lokus_report-{timestamp}.pdf, or lokus_report-{stem}-{timestamp}.pdf with --changed-since)",
+)
+@click.option(
+    "--html",
+    "html_path",
+    type=str,
+    default=None,
+    metavar="FILE",
+    help="Write a self-contained HTML report to this file.",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    help="Run only these rules: rule IDs, families (e.g. 'BOLA-*') or validators (deep_search, security, lgpd). Repeatable or comma-separated.",
+)
+@click.option(
+    "--skip",
+    multiple=True,
+    help="Do not run these rules: rule IDs, families (e.g. 'LGPD-*') or validators. Repeatable or comma-separated.",
+)
+@click.option(
+    "--min-severity",
+    type=click.Choice(SEVERITY_LEVELS, case_sensitive=False),
+    default=None,
+    help="Only report issues at or above this severity. Deep search findings count as HIGH.",
+)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=str,
+    default=None,
+    help="Suppress known findings listed in this baseline file (or a previous --json report).",
+)
+@click.option(
+    "--write-baseline",
+    "write_baseline_path",
+    type=str,
+    default=None,
+    help="Write the fingerprints of the reported findings (plus --baseline ones) to this file.",
+)
+@click.option(
+    "--diff",
+    nargs=2,
+    type=str,
+    default=None,
+    metavar="OLD NEW",
+    help="Compare two versions of a spec, rescanning only what changed. Reports new and resolved issues.",
+)
+@click.option(
+    "--changed-since",
+    type=str,
+    default=None,
+    metavar="REF",
+    help="Validate every spec under the given paths (default: current directory), rescanning only files changed since this git ref and reusing cached results for the rest.",
+)
+@click.option(
+    "--cache-dir",
+    type=str,
+    default=None,
+    help=f"Directory for cached scan results used by --changed-since (default: {DEFAULT_CACHE_DIR}) and for merged configurations that use `extends` (default: the user cache directory).",
+)
+@click.option(
+    "--remote",
+    type=str,
+    default=None,
+    metavar="URL",
+    help="Send the spec to a running `lokus serve` (http://host:port or unix:///path) instead of scanning it here.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Watch the given specs or directories (default: current directory) and revalidate files as they change, printing only new and resolved findings.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Scan a large spec on this many worker processes (0: one per CPU core).",
+)
+@click.option(
+    "--shard",
+    type=str,
+    default=None,
+    metavar="INDEX/COUNT",
+    callback=_parse_shard_option,
+    help="Scan only this shard (1-based) of the spec files under the given paths, or of the operations of a single spec, and print a partial JSON result for `lokus merge`.",
+)
+@click.option(
+    "--positions",
+    is_flag=True,
+    help="Add the line and column of each finding to the report, looked up only for the reported paths.",
+)
+@click.option(
+    "--metrics-file",
+    type=str,
+    default=None,
+    metavar="FILE",
+    help="Write run metrics (specs and nodes scanned, findings per rule, time per phase and rule, cache hits, peak memory) to this file, e.g. for the Prometheus node exporter textfile collector.",
+)
+@click.option(
+    "--metrics-format",
+    type=click.Choice(METRICS_FORMATS),
+    default=None,
+    help="Format of --metrics-file. (default: json for .json files, prometheus otherwise)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the time spent per rule and the calls, matches and time of each forbidden key pattern to stderr after the report.",
+)
+def scan(
+    swagger_file: Tuple[str, ...],
+    config: str,
+    verbose: bool,
+    json: bool,
+    pdf: bool,
+    pdf_dir: str,
+    pdf_name: Optional[str],
+    html_path: Optional[str],
+    only: Tuple[str, ...],
+    skip: Tuple[str, ...],
+    min_severity: Optional[str],
+    baseline_path: Optional[str],
+    write_baseline_path: Optional[str],
+    diff: Optional[Tuple[str, str]],
+    changed_since: Optional[str],
+    cache_dir: Optional[str],
+    remote: Optional[str],
+    watch: bool,
+    jobs: int,
+    shard: Optional[Tuple[int, int]],
+    positions: bool,
+    metrics_file: Optional[str],
+    metrics_format: Optional[str],
+    profile: bool,
+) -> None:
+    """Validate a Swagger/OpenAPI specification."""
+    if diff and swagger_file:
+        raise click.UsageError("SWAGGER_FILE cannot be combined with --diff.")
+    if diff and changed_since:
+        raise click.UsageError("--diff cannot be combined with --changed-since.")
+    if changed_since and html_path:
+        raise click.UsageError("--html is not supported with --changed-since.")
+    if watch and (
+        diff
+        or changed_since
+        or remote
+        or json
+        or pdf
+        or html_path
+        or write_baseline_path
+    ):
+        raise click.UsageError(
+            "--watch cannot be combined with --diff, --changed-since, --remote, --json, --pdf, --html or --write-baseline."
+        )
+    if shard and (diff or changed_since or watch or remote or pdf or html_path):
+        raise click.UsageError(
+            "--shard cannot be combined with --diff, --changed-since, --watch, --remote, --pdf or --html."
+        )
+    if (metrics_file or profile) and (watch or remote or shard):
+        raise click.UsageError(
+            "--metrics-file and --profile cannot be combined with --watch, --remote or --shard."
+        )
+    if metrics_format and not metrics_file:
+        raise click.UsageError("--metrics-format requires --metrics-file.")
+    if not diff and not changed_since and not watch and not shard:
+        if not swagger_file:
+            raise click.UsageError("Missing argument 'SWAGGER_FILE'.")
+        if len(swagger_file) > 1:
+            raise click.UsageError(
+                "Only one SWAGGER_FILE can be given without --changed-since."
+            )
+    if remote and (diff or changed_since or baseline_path or write_baseline_path):
+        raise click.UsageError(
+            "--remote cannot be combined with --diff, --changed-since or baselines."
+        )
+    spec_paths = swagger_file
+    swagger_file = swagger_file[0] if swagger_file else None
+
+    if remote:
+        # The server holds the configuration; only send it when chosen explicitly
+        ctx = click.get_current_context()
+        explicit_config = (
+            ctx.get_parameter_source("config") != click.core.ParameterSource.DEFAULT
+        )
+        exit_code = _scan_remote(
+            remote,
+            swagger_file,
+            config if explicit_config else None,
+            only,
+            skip,
+            min_severity,
+            json,
+            verbose,
+            PdfRenderer(pdf_dir, pdf_name) if pdf else None,
+            positions,
+            html_path,
+        )
+        sys.exit(exit_code)
+
     if verbose:
         print("Verbose mode enabled.")
         print(f"Attempting to validate: {swagger_file}")
@@ -36,66 +331,551 @@ def main(swagger_file: str, config: str, verbose: bool, json: bool, pdf: bool) -
 
     # 1. Load configuration
 
-    config_data = load_config(config)
+    config_files: List[str] = []
+    # Long-running watches reload the configuration themselves; nothing to cache
+    config_cache_dir = None if watch else cache_dir or user_cache_dir()
+    config_data = load_config(config, config_cache_dir, files=config_files)
     if config_data is None:
         # load_config already prints error messages
         sys.exit(1)  # Configuration error
 
+    # Known findings and the severity threshold are dropped as they are emitted
+    baseline_fingerprints = set()
+    if baseline_path:
+        baseline_fingerprints = load_baseline(baseline_path)
+        if baseline_fingerprints is None:
+            # load_baseline already prints error messages
+            sys.exit(1)  # Baseline error
+        if verbose:
+            print(f"Loaded {len(baseline_fingerprints)} baseline fingerprint(s).")
+
+    # Resolve rule selection and compile the rules once, before scanning
+    ruleset = Ruleset(config_data, only, skip, min_severity, baseline_fingerprints)
+    for warning in ruleset.warnings:
+        print(f"Warning: {warning}")
+    selection = ruleset.selection
+    finding_filter = ruleset.finding_filter()
+    metrics = RunMetrics(profile_patterns=profile) if metrics_file or profile else None
+
+    if shard:
+        _scan_shard(shard, spec_paths or (".",), config, ruleset, verbose)
+        return
+
+    if watch:
+        SpecWatcher(
+            spec_paths or (".",),
+            config,
+            ruleset,
+            config_files=config_files,
+        ).run()
+        return
+
+    if changed_since:
+        results = _scan_changed_since(
+            changed_since,
+            spec_paths or (".",),
+            cache_dir or DEFAULT_CACHE_DIR,
+            ruleset,
+            verbose,
+            metrics,
+        )
+        # The PDFs render in parallel while the report is printed
+        renderer = PdfRenderer(pdf_dir, pdf_name, batch=True) if pdf else None
+        if renderer:
+            for spec_file, result in results.items():
+                renderer.submit(spec_file, result)
+        with timed_phase(metrics, "report"):
+            exit_code = report_batch(
+                results, config, json, verbose, with_positions=positions
+            )
+        if write_baseline_path:
+            fingerprints = set(baseline_fingerprints)
+            for result in results.values():
+                fingerprints |= result.fingerprints()
+            write_baseline(write_baseline_path, fingerprints)
+            if verbose:
+                print(f"Baseline written to {write_baseline_path}")
+        if renderer and not renderer.wait():
+            exit_code = exit_code or 1
+        _finish_metrics(metrics, metrics_file, metrics_format, profile)
+        sys.exit(exit_code)
+
     # 2. Load Swagger specification
 
-    swagger_data = load_swagger_spec(swagger_file)
-    if swagger_data is None:
-        # load_swagger_spec already prints error messages
-        sys.exit(1)  # Swagger file error
+    if diff:
+        old_file, new_file = diff
+        swagger_file = new_file
+        with timed_phase(metrics, "load"):
+            old_data = load_swagger_spec(old_file, ruleset.limits)
+            swagger_data = load_swagger_spec(new_file, ruleset.limits)
+        if old_data is None or swagger_data is None:
+            # load_swagger_spec already prints error messages
+            sys.exit(1)  # Swagger file error
+    else:
+        with timed_phase(metrics, "load"):
+            swagger_data = load_swagger_spec(swagger_file, ruleset.limits)
+        if swagger_data is None:
+            # load_swagger_spec already prints error messages
+            sys.exit(1)  # Swagger file error
 
-    # 3. Perform deep search for forbidden keys
+    # 3-5. Perform deep search, security and LGPD compliance validation
 
-    if verbose:
-        print("Starting deep search for forbidden keys...")
-    findings = deep_search_forbidden_keys(swagger_data, "", config_data, verbose)
-    if verbose:
-        print(f"Deep search completed. Found {len(findings)} item(s).")
+    resolved_issues = None
+    if diff:
+        # Only the changed parts of both versions (and what references them) are scanned
+        spec_diff = diff_specs(old_data, swagger_data)
+        if verbose:
+            print(
+                f"Diff: {len(spec_diff.added)} added, {len(spec_diff.changed)} changed, "
+                f"{len(spec_diff.removed)} removed unit(s); rescanning {len(spec_diff.scanned)}."
+            )
+        new_result = run_scan(
+            spec_diff.new_spec,
+            config_data,
+            selection,
+            finding_filter,
+            verbose,
+            deep_search_rules=ruleset.deep_search_rules,
+            security_validator=ruleset.security_validator,
+            lgpd_validator=ruleset.lgpd_validator,
+            limits=ruleset.limits,
+            metrics=metrics,
+        )
+        # The old version is only a reference: timed, but not counted as a spec
+        with timed_phase(metrics, "diff_old"):
+            old_result = run_scan(
+                spec_diff.old_spec,
+                config_data,
+                selection,
+                FindingFilter(min_severity),
+                deep_search_rules=ruleset.deep_search_rules,
+                security_validator=ruleset.security_validator,
+                lgpd_validator=ruleset.lgpd_validator,
+                limits=ruleset.limits,
+            )
+        result = new_result.excluding(old_result.fingerprints())
+        resolved_issues = old_result.excluding(new_result.fingerprints()).summaries()
+    elif jobs != 1:
+        if verbose:
+            print(f"Scanning on {jobs or 'all available'} worker process(es)...")
+        # Rules run on the workers, so only the whole scan is measured here
+        started = time.perf_counter()
+        with timed_phase(metrics, "scan"):
+            result = scan_parallel(swagger_data, ruleset, jobs or None)
+        if metrics:
+            metrics.observe_scan(result, time.perf_counter() - started)
+    else:
+        result = run_scan(
+            swagger_data,
+            config_data,
+            selection,
+            finding_filter,
+            verbose,
+            deep_search_rules=ruleset.deep_search_rules,
+            security_validator=ruleset.security_validator,
+            lgpd_validator=ruleset.lgpd_validator,
+            limits=ruleset.limits,
+            metrics=metrics,
+        )
 
-    # 4. Perform security validation
+    findings = result.findings
+    security_issues = result.security_issues
+    lgpd_issues = result.lgpd_issues
 
-    if verbose:
-        print("Starting security validation...")
-    security_validator = SecurityValidator()
-    security_issues = security_validator.validate_spec(swagger_data)
-    if verbose:
-        print(f"Security validation completed. Found {len(security_issues)} issue(s).")
+    # The PDF is laid out on a worker process while the report is printed
+    renderer = None
+    if pdf:
+        renderer = PdfRenderer(pdf_dir, pdf_name)
+        renderer.submit(swagger_file, result)
 
-    # 5. Perform LGPD compliance validation
+    # 6. Report findings and get exit code from reporter
+    # The reporter function will print to stdout based on the format
+    with timed_phase(metrics, "report"):
+        exit_code = report_findings(
+            findings,
+            swagger_file,
+            config,
+            json,
+            verbose,
+            security_issues=security_issues,
+            lgpd_issues=lgpd_issues,
+            suppressed_count=result.suppressed_count,
+            resolved_issues=resolved_issues,
+            limits_exceeded=result.limits_exceeded,
+            positions=PositionIndex(file_path=swagger_file) if positions else None,
+        )
+
+    if write_baseline_path:
+        write_baseline(
+            write_baseline_path,
+            baseline_fingerprints | result.fingerprints(),
+        )
+        if verbose:
+            print(f"Baseline written to {write_baseline_path}")
+
+    if html_path:
+        with timed_phase(metrics, "html"):
+            html_reporter(
+                swagger_file,
+                findings,
+                html_path,
+                security_issues=security_issues,
+                lgpd_issues=lgpd_issues,
+                limits_exceeded=result.limits_exceeded,
+            )
+
+    # 7. Wait for the PDF file with reports
+    if renderer:
+        with timed_phase(metrics, "pdf"):
+            if not renderer.wait():
+                exit_code = exit_code or 1  # PDF error
+
+    _finish_metrics(metrics, metrics_file, metrics_format, profile)
+    sys.exit(exit_code)
+
+
+def _finish_metrics(
+    metrics: Optional[RunMetrics],
+    metrics_file: Optional[str],
+    metrics_format: Optional[str],
+    profile: bool,
+) -> None:
+    if metrics is None:
+        return
+    if profile:
+        # On stderr, so JSON reports on stdout stay parseable
+        print(metrics.format_profile(), file=sys.stderr)
+    if metrics_file:
+        metrics.write(metrics_file, metrics_format)
+
+
+def _scan_changed_since(
+    ref: str,
+    paths: Tuple[str, ...],
+    cache_dir: str,
+    ruleset: Ruleset,
+    verbose: bool,
+    metrics: Optional[RunMetrics] = None,
+) -> Dict[str, ScanResult]:
+    """Scans the specs changed since `ref` and takes the rest from the cache."""
+    changed_files = git_changed_files(ref)
+    if changed_files is None:
+        # git_changed_files already prints error messages
+        sys.exit(1)  # Git error
+
+    spec_files = find_spec_files(paths)
+    cache = ResultCache(cache_dir, ruleset.settings_key)
+    results: Dict[str, ScanResult] = {}
+    rescanned = 0
+    for spec_file in spec_files:
+        result = None
+        if os.path.realpath(spec_file) not in changed_files:
+            result = cache.get(spec_file)
+        if result is None:
+            if verbose:
+                print(f"Scanning {spec_file}...")
+            with timed_phase(metrics, "load"):
+                spec_data = load_swagger_spec(spec_file, ruleset.limits)
+            if spec_data is None:
+                # load_swagger_spec already prints error messages
+                continue
+            result = ruleset.scan(spec_data, metrics)
+            # Partial results depend on timing, so they are never reused
+            if not result.limits_exceeded:
+                ref_files = external_ref_files(spec_data, spec_file, ruleset.limits)
+                cache.put(spec_file, ref_files, result)
+            rescanned += 1
+        results[spec_file] = result
+
+    if metrics:
+        metrics.cache_hits += cache.hits
+        metrics.cache_misses += rescanned
 
-    if verbose:
-        print("Starting LGPD compliance validation...")
-    lgpd_validator = LGPDValidator()
-    lgpd_issues = lgpd_validator.validate_spec(swagger_data)
     if verbose:
         print(
-            f"LGPD compliance validation completed. Found {len(lgpd_issues)} issue(s)."
+            f"Found {len(spec_files)} spec(s): {rescanned} scanned, "
+            f"{cache.hits} reused from cache ({len(changed_files)} file(s) changed since {ref})."
         )
+    return results
 
-    # 6. Report findings and get exit code from reporter
-    # The reporter function will print to stdout based on the format
-    report_findings(
-        findings,
+
+def _scan_shard(
+    shard: Tuple[int, int],
+    paths: Tuple[str, ...],
+    config: str,
+    ruleset: Ruleset,
+    verbose: bool,
+) -> None:
+    """Scans one shard and prints its partial result."""
+    index, count = shard
+    results: Dict[str, ScanResult] = {}
+    if len(paths) == 1 and os.path.isfile(paths[0]):
+        # A single spec is split by path items and components
+        mode = MODE_SPEC
+        spec_data = load_swagger_spec(paths[0], ruleset.limits)
+        if spec_data is None:
+            # load_swagger_spec already prints error messages
+            sys.exit(1)  # Swagger file error
+        results[paths[0]] = scan_spec_shard(spec_data, ruleset, index, count)
+    else:
+        mode = MODE_FILES
+        spec_files = find_spec_files(paths)
+        assigned = shard_files(spec_files, index, count)
+        if verbose:
+            print(
+                f"Shard {index}/{count}: {len(assigned)} of {len(spec_files)} spec(s)."
+            )
+        for spec_file in assigned:
+            spec_data = load_swagger_spec(spec_file, ruleset.limits)
+            if spec_data is None:
+                # load_swagger_spec already prints error messages
+                continue
+            results[spec_file] = ruleset.scan(spec_data)
+
+    click.echo(dumps(build_partial(results, index, count, mode, config)))
+
+
+def _scan_remote(
+    url: str,
+    swagger_file: str,
+    config_path: Optional[str],
+    only: Tuple[str, ...],
+    skip: Tuple[str, ...],
+    min_severity: Optional[str],
+    output_json: bool,
+    verbose: bool,
+    renderer: Optional[PdfRenderer] = None,
+    positions: bool = False,
+    html_path: Optional[str] = None,
+) -> int:
+    """Has a running `lokus serve` scan the spec, reports its answer and returns the exit code."""
+    try:
+        with open(swagger_file, "r", encoding="utf-8") as f:
+            spec_text = f.read()
+    except OSError as e:
+        print(f"Error: Could not read Swagger/OpenAPI file {swagger_file}: {e}")
+        sys.exit(1)  # Swagger file error
+
+    request = {
+        "spec": spec_text,
+        "source": swagger_file,
+        "only": list(only),
+        "skip": list(skip),
+        "min_severity": min_severity,
+    }
+    if config_path:
+        request["config"] = os.path.abspath(config_path)
+    try:
+        report = remote_scan(url, request)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)  # Rejected by the server
+    except OSError as e:
+        print(f"Error: Could not reach lokus server at {url}: {e}")
+        sys.exit(1)  # Connection error
+
+    if verbose:
+        cache_state = "cached" if report.get("cached") else "fresh"
+        print(f"Received {cache_state} result from {url}")
+
+    result = ScanResult.from_dict(report)
+    if renderer:
+        renderer.submit(swagger_file, result)
+    exit_code = report_findings(
+        result.findings,
         swagger_file,
-        config,
-        json,
+        config_path or report.get("config_file"),
+        output_json,
         verbose,
-        security_issues=security_issues,
-        lgpd_issues=lgpd_issues,
+        security_issues=result.security_issues,
+        lgpd_issues=result.lgpd_issues,
+        suppressed_count=result.suppressed_count,
+        limits_exceeded=result.limits_exceeded,
+        positions=PositionIndex(spec_text) if positions else None,
     )
 
-    # 7. Generate a PDF file with reports
-    if pdf:
-        pdf_reporter(
-            swagger_file_path=swagger_file,
-            findings=findings,
-            security_issues=security_issues,
-            lgpd_issues=lgpd_issues,
+    if html_path:
+        html_reporter(
+            swagger_file,
+            result.findings,
+            html_path,
+            security_issues=result.security_issues,
+            lgpd_issues=result.lgpd_issues,
+            limits_exceeded=result.limits_exceeded,
+        )
+    if renderer and not renderer.wait():
+        exit_code = exit_code or 1  # PDF error
+    return exit_code
+
+
+@main.command("serve")
+@click.option(
+    "--config",
+    type=str,
+    default=".forbidden_keys.yaml",
+    help="Configuration used for requests that do not name one. (default: .forbidden_keys.yaml in the current directory)",
+)
+@click.option(
+    "--host", type=str, default="127.0.0.1", show_default=True, help="Address to bind."
+)
+@click.option(
+    "--port", type=int, default=DEFAULT_PORT, show_default=True, help="Port to bind."
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=str,
+    default=None,
+    help="Listen on this Unix socket instead of a TCP port.",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Log every request.")
+def serve(
+    config: str, host: str, port: int, socket_path: Optional[str], verbose: bool
+) -> None:
+    """Keep configuration and results warm and answer scans over HTTP."""
+    service = ScanService(os.path.abspath(config))
+    try:
+        # Fail at startup rather than on the first request
+        service.config(service.default_config_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)  # Configuration error
+
+    try:
+        server = create_server(service, host, port, socket_path, verbose)
+    except OSError as e:
+        print(f"Error: Could not start lokus server: {e}")
+        sys.exit(1)  # Bind error
+
+    address = f"unix://{socket_path}" if socket_path else f"http://{host}:{port}"
+    print(f"Lokus server listening on {address} (POST /scan, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+@main.command("pre-commit")
+@click.argument("files", type=str, nargs=-1)
+@click.option(
+    "--config",
+    type=str,
+    default=".forbidden_keys.yaml",
+    help="Path to the forbidden keys configuration YAML file. (default: .forbidden_keys.yaml in the current directory)",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    help="Run only these rules: rule IDs, families or validators. Repeatable or comma-separated.",
+)
+@click.option(
+    "--skip",
+    multiple=True,
+    help="Do not run these rules: rule IDs, families or validators. Repeatable or comma-separated.",
+)
+@click.option(
+    "--min-severity",
+    type=click.Choice(SEVERITY_LEVELS, case_sensitive=False),
+    default=None,
+    help="Only report issues at or above this severity. Deep search findings count as HIGH.",
+)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=str,
+    default=None,
+    help="Suppress known findings listed in this baseline file (or a previous --json report).",
+)
+def pre_commit(
+    files: Tuple[str, ...],
+    config: str,
+    only: Tuple[str, ...],
+    skip: Tuple[str, ...],
+    min_severity: Optional[str],
+    baseline_path: Optional[str],
+) -> None:
+    """
+    Validate the OpenAPI documents among FILES, one line per issue.
+
+    Meant for pre-commit hooks: files that are not OpenAPI documents are
+    skipped, and all files are scanned in one process with the
+    configuration compiled once.
+    """
+    spec_files = [
+        file_path
+        for file_path in files
+        if file_path.lower().endswith(SPEC_FILE_EXTENSIONS)
+        and is_openapi_document(file_path)
+    ]
+    if not spec_files:
+        return
+
+    config_data = load_config(config, user_cache_dir())
+    if config_data is None:
+        # load_config already prints error messages
+        sys.exit(1)  # Configuration error
+
+    baseline_fingerprints = set()
+    if baseline_path:
+        baseline_fingerprints = load_baseline(baseline_path)
+        if baseline_fingerprints is None:
+            # load_baseline already prints error messages
+            sys.exit(1)  # Baseline error
+
+    ruleset = Ruleset(config_data, only, skip, min_severity, baseline_fingerprints)
+    for warning in ruleset.warnings:
+        print(f"Warning: {warning}")
+
+    results: Dict[str, ScanResult] = {}
+    load_failed = False
+    for spec_file in spec_files:
+        spec_data = load_swagger_spec(spec_file, ruleset.limits)
+        if spec_data is None:
+            # load_swagger_spec already prints error messages
+            load_failed = True
+            continue
+        results[spec_file] = ruleset.scan(spec_data)
+
+    exit_code = report_compact(results)
+    sys.exit(1 if load_failed else exit_code)
+
+
+@main.command("merge")
+@click.argument("partial_files", type=str, nargs=-1, required=True)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output.")
+@click.option("--json", is_flag=True, help="Change output format to JSON")
+def merge(partial_files: Tuple[str, ...], verbose: bool, json: bool) -> None:
+    """Combine the partial results of `--shard` runs into one report."""
+    partials = [load_partial(partial_file) for partial_file in partial_files]
+    if any(partial is None for partial in partials):
+        # load_partial already prints error messages
+        sys.exit(2)  # Partial result error
+    merged = merge_partials(partials)
+    if merged is None:
+        # merge_partials already prints error messages
+        sys.exit(2)  # Incomplete shard run
+
+    mode, config_file, results = merged
+    if mode == MODE_SPEC and len(results) == 1:
+        [(swagger_file, result)] = results.items()
+        exit_code = report_findings(
+            result.findings,
+            swagger_file,
+            config_file,
+            json,
+            verbose,
+            security_issues=result.security_issues,
+            lgpd_issues=result.lgpd_issues,
+            suppressed_count=result.suppressed_count,
+            limits_exceeded=result.limits_exceeded,
         )
+    else:
+        exit_code = report_batch(results, config_file, json, verbose)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,45 +1,230 @@
 #!/usr/bin/env python3
+import contextlib
+import hashlib
+import io
+import json
+import os
+
 import yaml
 
+from lokus import __version__
+from lokus.cache_files import file_digest
+from lokus.limits import LIMIT_TYPES
+from lokus.pattern_check import check_pattern
+
+# Top-level sections of a configuration and their types
+CONFIG_STRUCTURE = {
+    "forbidden_keys": list,
+    "forbidden_key_patterns": list,
+    "forbidden_keys_at_paths": list,
+    "allowed_exceptions": list,
+    "rules": dict,
+    "limits": dict,
+}
+
+# Profiles that `extends` accepts by name
+BUILTIN_PROFILES = ("basic-config", "enterprise", "lgpd-focused", "strict-security")
+
+# Installed packages ship the profiles as lokus/profiles; a source checkout
+# has them under templates/configs
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIRS = (
+    os.path.join(_PACKAGE_DIR, "profiles"),
+    os.path.join(os.path.dirname(_PACKAGE_DIR), "templates", "configs"),
+)
+
+CONFIG_CACHE_VERSION = 1
+
+
+def profile_path(name):
+    """Returns the file of a built-in profile, or None if there is none by that name."""
+    if name not in BUILTIN_PROFILES:
+        return None
+    for directory in PROFILE_DIRS:
+        file_path = os.path.join(directory, f"{name}.yaml")
+        if os.path.isfile(file_path):
+            return file_path
+    return None
 
-def load_config(config_path=".forbidden_keys.yaml"):
-    """Loads the forbidden keys configuration from a YAML file."""
+
+def load_config(config_path=".forbidden_keys.yaml", cache_dir=None, files=None):
+    """
+    Loads the forbidden keys configuration from a YAML file.
+
+    A configuration can `extends` built-in profiles (by name) and other
+    files (by path, relative to it); they are merged in order, the file
+    itself last. With `cache_dir`, the merged result of such a chain is
+    cached there, keyed by the hash of every file in the chain, so later
+    loads skip parsing, merging and pattern checks until one of them
+    changes. Nothing is written without it.
+
+    If `files` is a list, the paths of every file in the chain are added
+    to it, so callers can watch them for changes.
+    """
     if not config_path:
         print(
             "Error: Configuration file path not provided. Using default: .forbidden_keys.yaml"
         )
         config_path = ".forbidden_keys.yaml"
 
+    if cache_dir:
+        cached = _cached_config(config_path, cache_dir)
+        if cached is not None:
+            output, config, digests = cached
+            if files is not None:
+                files.extend(digests)
+            # The warnings of the first load still apply
+            print(output, end="")
+            return config
+
+    digests = {}
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        config = _load_config_chain(config_path, [], digests)
+    print(output.getvalue(), end="")
+    if files is not None:
+        files.extend(digests)
+    if config is not None and cache_dir and len(digests) > 1:
+        _store_config(config_path, cache_dir, digests, output.getvalue(), config)
+    return config
+
+
+def _load_config_chain(config_path, including, digests):
+    real_path = os.path.realpath(config_path)
+    if real_path in including:
+        chain = " -> ".join([*including, real_path])
+        print(f"Error: Configuration {config_path} extends itself: {chain}")
+        return None
+    config, extends = _load_config_file(config_path, digests)
+    if config is None:
+        return None
+
+    parents = []
+    for entry in extends:
+        parent_path = profile_path(entry)
+        if parent_path is None and entry in BUILTIN_PROFILES:
+            print(f"Error: Built-in profile '{entry}' is not installed.")
+            return None
+        if parent_path is None:
+            # Included files are relative to the file including them
+            parent_path = os.path.join(os.path.dirname(config_path), entry)
+            if not os.path.isfile(parent_path):
+                print(
+                    f"Error: Configuration {config_path} extends '{entry}', which is neither a file nor a built-in profile ({', '.join(BUILTIN_PROFILES)})."
+                )
+                return None
+        parent = _load_config_chain(parent_path, [*including, real_path], digests)
+        if parent is None:
+            return None
+        parents.append(parent)
+    return merge_configs(*parents, config) if parents else config
+
+
+def merge_configs(*configs):
+    """
+    Merges validated configurations in order: list sections are
+    concatenated without duplicates, and later `rules` and `limits` entries
+    override earlier ones.
+    """
+    merged = {}
+    for key, expected_type in CONFIG_STRUCTURE.items():
+        if expected_type is dict:
+            merged[key] = {}
+            for config in configs:
+                merged[key].update(config[key])
+            continue
+        merged[key] = []
+        seen = set()
+        for config in configs:
+            for item in config[key]:
+                marker = json.dumps(item, sort_keys=True, default=str)
+                if marker not in seen:
+                    seen.add(marker)
+                    merged[key].append(item)
+    return merged
+
+
+def _cache_entry_path(config_path, cache_dir):
+    name = hashlib.sha256(os.path.realpath(config_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, "configs", f"{name[:32]}.json")
+
+
+def _chain_key(digests):
+    payload = json.dumps(
+        {"lokus": __version__, "cache": CONFIG_CACHE_VERSION, "files": digests},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_config(config_path, cache_dir):
+    entry_path = _cache_entry_path(config_path, cache_dir)
+    # Configurations that extend nothing never have an entry
+    if not os.path.isfile(entry_path):
+        return None
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
+        with open(entry_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    digests = entry.get("digests") or {}
+    current = {file_path: file_digest(file_path) for file_path in digests}
+    if not digests or entry.get("key") != _chain_key(current):
+        return None
+    return entry["output"], entry["config"], digests
+
+
+def _store_config(config_path, cache_dir, digests, output, config):
+    entry_path = _cache_entry_path(config_path, cache_dir)
+    entry = {
+        "key": _chain_key(digests),
+        "digests": digests,
+        "output": output,
+        "config": config,
+    }
+    partial = f"{entry_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(partial, entry_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write configuration cache for {config_path}: {e}")
+
+
+def _load_config_file(config_path, digests):
+    """
+    Loads and validates one configuration file, recording its digest.
+
+    Returns:
+        The validated configuration and the entries of its `extends` key,
+        or (None, []) if the file cannot be used.
+    """
+    try:
+        with open(config_path, "rb") as f:
+            content = f.read()
+            digests[os.path.realpath(config_path)] = hashlib.sha256(content).hexdigest()
             # CRITICAL: Always use yaml.safe_load() to prevent arbitrary code execution
             # from a potentially compromised configuration file.
-            config = yaml.safe_load(f)
+            config = yaml.safe_load(content)
 
             if config is None:  # Handles empty config file
                 print(
                     f"Warning: Configuration file {config_path} is empty. No rules will be applied."
                 )
                 return {
-                    "forbidden_keys": [],
-                    "forbidden_key_patterns": [],
-                    "forbidden_keys_at_paths": [],
-                    "allowed_exceptions": [],
-                }
+                    key: expected_type()
+                    for key, expected_type in CONFIG_STRUCTURE.items()
+                }, []
 
             if not isinstance(config, dict):
                 print(
                     f"Error: Configuration file {config_path} is not a valid YAML dictionary."
                 )
-                return None
+                return None, []
 
             # Basic validation of top-level keys and their types
-            expected_config_structure = {
-                "forbidden_keys": list,
-                "forbidden_key_patterns": list,
-                "forbidden_keys_at_paths": list,
-                "allowed_exceptions": list,
-            }
+            expected_config_structure = CONFIG_STRUCTURE
 
             validated_config = {}
             for key, expected_type in expected_config_structure.items():
@@ -48,35 +233,84 @@ def load_config(config_path=".forbidden_keys.yaml"):
                         print(
                             f"Warning: Configuration key '{key}' in {config_path} is not of expected type {expected_type.__name__}. It will be ignored."
                         )
-                        validated_config[
-                            key
-                        ] = []  # Default to empty list if type is wrong
+                        # Default to an empty value if type is wrong
+                        validated_config[key] = expected_type()
                     else:
                         validated_config[key] = config[key]
                 else:
-                    # If a key is missing, initialize it as an empty list
-                    validated_config[key] = []
+                    # If a key is missing, initialize it as an empty value
+                    validated_config[key] = expected_type()
+
+            # The rules section only understands rule selectors
+            for key, value in validated_config["rules"].items():
+                if key not in ("only", "skip"):
+                    print(
+                        f"Warning: Unknown key 'rules.{key}' in configuration file {config_path}. It will be ignored."
+                    )
+                elif not isinstance(value, list):
+                    print(
+                        f"Warning: Configuration key 'rules.{key}' in {config_path} is not of expected type list. It will be ignored."
+                    )
+                    validated_config["rules"][key] = []
+
+            # Limits must be positive numbers; invalid ones are not enforced
+            for key, value in list(validated_config["limits"].items()):
+                if key not in LIMIT_TYPES:
+                    print(
+                        f"Warning: Unknown key 'limits.{key}' in configuration file {config_path}. It will be ignored."
+                    )
+                    del validated_config["limits"][key]
+                elif (
+                    isinstance(value, bool)
+                    or not isinstance(value, LIMIT_TYPES[key])
+                    or value <= 0
+                ):
+                    print(
+                        f"Warning: Configuration key 'limits.{key}' in {config_path} is not a positive number. It will be ignored."
+                    )
+                    del validated_config["limits"][key]
+
+            # Patterns run on every key and string value, so slow ones slow every scan
+            for idx, pattern in enumerate(validated_config["forbidden_key_patterns"]):
+                if not isinstance(pattern, str):
+                    continue
+                for problem in check_pattern(pattern):
+                    print(
+                        f"Warning: Pattern '{pattern}' at index {idx} of forbidden_key_patterns in {config_path} {problem}; it may slow down every scan."
+                    )
+
+            # Profiles and files this one builds on, by name or relative path
+            extends = config.get("extends", [])
+            if isinstance(extends, str):
+                extends = [extends]
+            if not isinstance(extends, list) or not all(
+                isinstance(entry, str) for entry in extends
+            ):
+                print(
+                    f"Warning: Configuration key 'extends' in {config_path} is not a profile name, a file or a list of them. It will be ignored."
+                )
+                extends = []
 
             # Check for unknown top-level keys
             for key in config.keys():
-                if key not in expected_config_structure:
+                if key not in expected_config_structure and key != "extends":
                     print(
                         f"Warning: Unknown top-level key '{key}' in configuration file {config_path}. It will be ignored."
                     )
 
-            return validated_config
+            return validated_config, extends
 
     except FileNotFoundError:
         print(f"Error: Configuration file not found at {config_path}")
-        return None
+        return None, []
     except yaml.YAMLError as e:
         print(f"Error parsing configuration file {config_path}: {e}")
-        return None
+        return None, []
     except Exception as e:
         print(
             f"An unexpected error occurred while loading configuration from {config_path}: {e}"
         )
-        return None
+        return None, []
 
 
 if __name__ == "__main__":
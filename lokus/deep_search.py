@@ -1,8 +1,105 @@
 #!/usr/bin/env python3
 import re
 
+from lokus.baseline import DEEP_SEARCH_SEVERITY
+from lokus.limits import LimitExceeded
 
-def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
+# Rule IDs of the deep search, matching the "type" of its findings
+DEEP_SEARCH_RULES = ("forbidden_key", "forbidden_key_pattern", "forbidden_key_at_path")
+
+
+class DeepSearchRules:
+    """
+    The deep search part of a configuration, compiled once.
+
+    Regex patterns are compiled, path rules are normalized and rule types
+    disabled by the selection are left empty, so a compiled instance can be
+    reused for any number of specs.
+    """
+
+    def __init__(
+        self,
+        forbidden_keys=(),
+        patterns=(),
+        keys_at_paths=(),
+        allowed_exceptions=(),
+        warnings=(),
+    ):
+        self.forbidden_keys = forbidden_keys
+        self.patterns = list(patterns)
+        self.keys_at_paths = list(keys_at_paths)
+        self.allowed_exceptions = list(allowed_exceptions)
+        self.warnings = list(warnings)
+
+    @property
+    def is_empty(self):
+        return not (self.forbidden_keys or self.patterns or self.keys_at_paths)
+
+    @classmethod
+    def compile(cls, config_data, selection=None):
+        """Compiles the deep search rules of a configuration; never prints."""
+        config_data = config_data or {}
+
+        def rule_enabled(rule_id):
+            return selection is None or selection.is_enabled(rule_id, "deep_search")
+
+        forbidden_keys = (
+            config_data.get("forbidden_keys", [])
+            if rule_enabled("forbidden_key")
+            else []
+        )
+        try:
+            forbidden_keys = frozenset(forbidden_keys)
+        except TypeError:
+            # Unhashable entries can still be compared one by one
+            pass
+
+        warnings = []
+        patterns = []
+        if rule_enabled("forbidden_key_pattern"):
+            for idx, pattern_str in enumerate(
+                config_data.get("forbidden_key_patterns", [])
+            ):
+                try:
+                    patterns.append((pattern_str, re.compile(pattern_str)))
+                except re.error as e:
+                    warnings.append(
+                        f"Invalid regex pattern '{pattern_str}' at index {idx} in configuration: {e}. It will be skipped."
+                    )
+
+        keys_at_paths = []
+        if rule_enabled("forbidden_key_at_path"):
+            for item in config_data.get("forbidden_keys_at_paths", []):
+                path_to_check = item.get("path")
+                forbidden_key_at_path = item.get("key")
+                reason = item.get(
+                    "reason",
+                    f"Key '{forbidden_key_at_path}' is forbidden at path '{path_to_check}'.",
+                )
+                keys_at_paths.append(
+                    (path_to_check.lstrip("."), forbidden_key_at_path, reason)
+                )
+
+        return cls(
+            forbidden_keys=forbidden_keys,
+            patterns=patterns,
+            keys_at_paths=keys_at_paths,
+            allowed_exceptions=config_data.get("allowed_exceptions", []),
+            warnings=warnings,
+        )
+
+
+def deep_search_forbidden_keys(
+    data,
+    current_path,
+    config_data,
+    verbose=False,
+    selection=None,
+    finding_filter=None,
+    rules=None,
+    budget=None,
+    metrics=None,
+):
     """
     Recursively searches for forbidden keys in the provided data structure.
 
@@ -11,6 +108,14 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
         current_path: A string representing the path to the current data segment.
         config_data: The loaded forbidden keys configuration.
         verbose: Boolean flag for verbose logging.
+        selection: Optional RuleSelection; disabled rule types are not checked.
+        finding_filter: Optional FindingFilter applied to each finding as it is found.
+        rules: Optional DeepSearchRules compiled in advance; compiled from
+            config_data and selection when omitted.
+        budget: Optional ScanBudget; when it runs out, the findings made so
+            far are returned and the exceeded limit is recorded on it.
+        metrics: Optional RunMetrics; when it profiles patterns, each
+            pattern's calls, matches and time are counted into it.
 
     Returns:
         A list of findings (dictionaries).
@@ -21,20 +126,32 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
             print("Debug: deep_search called with no config_data.")
         return findings
 
-    forbidden_keys_list = config_data.get("forbidden_keys", [])
-    forbidden_patterns_list = config_data.get("forbidden_key_patterns", [])
-    # Ensure patterns are compiled for efficiency, handle invalid patterns
-    compiled_patterns = []
-    for idx, pattern_str in enumerate(forbidden_patterns_list):
-        try:
-            compiled_patterns.append((pattern_str, re.compile(pattern_str)))
-        except re.error as e:
-            print(
-                f"Warning: Invalid regex pattern '{pattern_str}' at index {idx} in configuration: {e}. It will be skipped."
-            )
+    # Findings below the severity threshold would all be dropped anyway
+    if finding_filter is not None and not finding_filter.severity_enabled(
+        DEEP_SEARCH_SEVERITY
+    ):
+        return findings
 
-    forbidden_keys_at_paths_list = config_data.get("forbidden_keys_at_paths", [])
-    allowed_exceptions_list = config_data.get("allowed_exceptions", [])
+    def add_finding(finding):
+        if finding_filter is None or finding_filter.accepts(
+            finding["type"], finding["path"], finding["key"]
+        ):
+            findings.append(finding)
+
+    if rules is None:
+        rules = DeepSearchRules.compile(config_data, selection)
+        for warning in rules.warnings:
+            print(f"Warning: {warning}")
+    forbidden_keys_list = rules.forbidden_keys
+    compiled_patterns = rules.patterns
+    if metrics is not None and metrics.profile_patterns:
+        compiled_patterns = metrics.timed_patterns(compiled_patterns)
+    forbidden_keys_at_paths_list = rules.keys_at_paths
+    allowed_exceptions_list = rules.allowed_exceptions
+
+    # Nothing to look for, so don't walk the spec at all
+    if rules.is_empty:
+        return findings
 
     def check_key(key, path):
         # 1. Check for allowed exceptions first
@@ -55,7 +172,7 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
 
         # 2. Check against globally forbidden keys
         if key in forbidden_keys_list:
-            findings.append(
+            add_finding(
                 {
                     "path": path,
                     "key": key,
@@ -67,7 +184,7 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
         # 3. Check against forbidden key patterns (regex)
         for pattern_str, compiled_pattern in compiled_patterns:
             if compiled_pattern.fullmatch(key):
-                findings.append(
+                add_finding(
                     {
                         "path": path,
                         "key": key,
@@ -77,32 +194,29 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
                 )
 
         # 4. Check against keys forbidden at specific paths
-        for item in forbidden_keys_at_paths_list:
-            path_to_check = item.get("path")
-            forbidden_key_at_path = item.get("key")
-            reason = item.get(
-                "reason",
-                f"Key '{forbidden_key_at_path}' is forbidden at path '{path_to_check}'.",
-            )
-
+        if forbidden_keys_at_paths_list:
             # Normalize paths for comparison (remove leading dot if current_path was empty)
             normalized_path = path.lstrip(".")
-            normalized_path_to_check = path_to_check.lstrip(".")
+            for (
+                path_to_check,
+                forbidden_key_at_path,
+                reason,
+            ) in forbidden_keys_at_paths_list:
+                if normalized_path == path_to_check and key == forbidden_key_at_path:
+                    add_finding(
+                        {
+                            "path": path,
+                            "key": key,
+                            "type": "forbidden_key_at_path",
+                            "message": reason,
+                        }
+                    )
 
-            if (
-                normalized_path == normalized_path_to_check
-                and key == forbidden_key_at_path
-            ):
-                findings.append(
-                    {
-                        "path": path,
-                        "key": key,
-                        "type": "forbidden_key_at_path",
-                        "message": reason,
-                    }
-                )
+    tick = budget.tick if budget is not None else None
 
     def process_value(value, path):
+        if tick is not None:
+            tick()
         if isinstance(value, dict):
             for k, v in value.items():
                 new_path = f"{path}.{k}" if path else k
@@ -111,7 +225,7 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
                 if isinstance(v, str):
                     for pattern_str, compiled_pattern in compiled_patterns:
                         if compiled_pattern.fullmatch(v):
-                            findings.append(
+                            add_finding(
                                 {
                                     "path": new_path,
                                     "key": v,
@@ -131,7 +245,7 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
                         if isinstance(v, str):
                             for pattern_str, compiled_pattern in compiled_patterns:
                                 if compiled_pattern.fullmatch(v):
-                                    findings.append(
+                                    add_finding(
                                         {
                                             "path": item_path,
                                             "key": v,
@@ -143,5 +257,8 @@ def deep_search_forbidden_keys(data, current_path, config_data, verbose=False):
                 else:
                     process_value(item, new_path)
 
-    process_value(data, current_path)
+    try:
+        process_value(data, current_path)
+    except LimitExceeded as e:
+        budget.record(e)
     return findings
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+import os
+from datetime import datetime
+from html import escape
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+from lokus import report_colors
+from lokus.lgpd_validator import LGPDIssue
+from lokus.security_validator import SecurityIssue
+
+# Deep search findings have no severity of their own; they count as HIGH
+FINDING_SEVERITY = "HIGH"
+
+_CSS = f"""
+body {{ font-family: Helvetica, Arial, sans-serif; margin: 2em auto; max-width: 1100px; color: #222; }}
+h1 {{ text-align: center; }}
+h2 {{ background: {report_colors.HEADER_BACKGROUND}; border: 2px solid {report_colors.PRIMARY}; padding: 6px; }}
+table {{ border-collapse: collapse; width: 100%; margin: 0.5em 0; }}
+th, td {{ border: 1px solid {report_colors.PRIMARY}; padding: 4px 6px; text-align: left; vertical-align: top; font-size: 0.9em; }}
+th {{ background: {report_colors.SECONDARY}; color: white; }}
+tr:nth-child(even) td {{ background: {report_colors.LIGHT_BACKGROUND}; }}
+table.info th {{ width: 12em; background: {report_colors.ACCENT}; }}
+td.path {{ font-family: monospace; word-break: break-all; }}
+details {{ border: 1px solid {report_colors.PRIMARY}; margin: 0.5em 0; }}
+summary {{ cursor: pointer; padding: 6px; background: {report_colors.LIGHT_BACKGROUND}; font-weight: bold; }}
+details > div {{ padding: 0 8px 8px; }}
+.badge {{ color: white; border-radius: 3px; padding: 1px 6px; font-size: 0.8em; }}
+.status {{ border: 2px solid {report_colors.SEVERITY["CRITICAL"]}; padding: 6px; }}
+"""
+
+
+def _group_by_rule(
+    entries: Iterable[Any], rule_of: Callable[[Any], str]
+) -> Dict[str, List[Any]]:
+    # Rules in order of first appearance, in a single pass over the entries
+    groups: Dict[str, List[Any]] = {}
+    for entry in entries:
+        groups.setdefault(rule_of(entry), []).append(entry)
+    return groups
+
+
+def _total(groups: Dict[str, List[Any]]) -> int:
+    return sum(len(entries) for entries in groups.values())
+
+
+def _badge(severity: str) -> str:
+    color = report_colors.SEVERITY.get(severity, report_colors.PRIMARY)
+    return f'<span class="badge" style="background: {color}">{escape(severity)}</span>'
+
+
+def _link(url: str) -> str:
+    # Only web links are clickable; anything else is shown as text
+    if url.startswith(("http://", "https://")):
+        return f'<a href="{escape(url)}">{escape(url)}</a>'
+    return escape(url)
+
+
+def _write_issue_sections(
+    out: TextIO, groups: Dict[str, List[Any]], empty_message: str
+) -> None:
+    if not groups:
+        out.write(f"<p>{escape(empty_message)}</p>\n")
+        return
+    for rule_id, rule_issues in groups.items():
+        first = rule_issues[0]
+        out.write(
+            f"<details><summary>{_badge(first.severity.value)} "
+            f"{escape(rule_id)}: {escape(first.title)} ({len(rule_issues)})"
+            "</summary><div>\n"
+            f"<p><b>Recommendation:</b> {escape(first.recommendation)}</p>\n"
+        )
+        reference = getattr(first, "reference", None)
+        if reference:
+            out.write(f"<p><b>Reference:</b> {_link(reference)}</p>\n")
+        out.write("<table><tr><th>#</th><th>Path</th><th>Description</th></tr>\n")
+        for i, issue in enumerate(rule_issues, 1):
+            _write_row(out, i, issue.path, issue.description)
+        out.write("</table></div></details>\n")
+
+
+def _write_finding_sections(
+    out: TextIO, groups: Dict[str, List[Dict[str, Any]]]
+) -> None:
+    if not groups:
+        out.write("<p>No general findings identified.</p>\n")
+        return
+    for finding_type, typed_findings in groups.items():
+        out.write(
+            f"<details><summary>{_badge(FINDING_SEVERITY)} "
+            f"{escape(finding_type)} ({len(typed_findings)})</summary><div>\n"
+            "<table><tr><th>#</th><th>Path</th><th>Description</th></tr>\n"
+        )
+        for i, finding in enumerate(typed_findings, 1):
+            _write_row(
+                out, i, finding.get("path", "N/A"), finding.get("message", "N/A")
+            )
+        out.write("</table></div></details>\n")
+
+
+def _write_row(out: TextIO, number: int, path: Any, description: Any) -> None:
+    out.write(
+        f'<tr><td>{number}</td><td class="path">{escape(str(path))}</td>'
+        f"<td>{escape(str(description))}</td></tr>\n"
+    )
+
+
+def write_html(
+    out: TextIO,
+    swagger_file_path: str,
+    findings: Iterable[Dict[str, Any]],
+    security_issues: Optional[Iterable[SecurityIssue]] = None,
+    lgpd_issues: Optional[Iterable[LGPDIssue]] = None,
+    limits_exceeded: Optional[List[str]] = None,
+) -> None:
+    """
+    Writes a self-contained HTML report to a text stream.
+
+    Entries can come from any iterable, generators included: they are
+    grouped by rule in a single pass, since the header needs the totals,
+    then the document is written piece by piece, one collapsible section
+    per rule, without building it in memory.
+    """
+    finding_groups = _group_by_rule(
+        findings, lambda finding: finding.get("type", "N/A")
+    )
+    security_groups = _group_by_rule(security_issues or (), lambda issue: issue.rule_id)
+    lgpd_groups = _group_by_rule(lgpd_issues or (), lambda issue: issue.rule_id)
+    now = datetime.now()
+    title = f"Lokus report: {os.path.basename(swagger_file_path)}"
+
+    out.write(
+        "<!DOCTYPE html>\n"
+        f'<html lang="en"><head><meta charset="utf-8"><title>{escape(title)}</title>'
+        f"<style>{_CSS}</style></head><body>\n"
+        "<h1>API Security &amp; Compliance Report</h1>\n"
+        '<table class="info">\n'
+        f"<tr><th>Analyzed File</th><td>{escape(os.path.basename(swagger_file_path))}</td></tr>\n"
+        f"<tr><th>Full Path</th><td>{escape(swagger_file_path)}</td></tr>\n"
+        f"<tr><th>Analysis Date</th><td>{now.strftime('%Y-%m-%d %H:%M')}</td></tr>\n"
+        f"<tr><th>Total Security Issues</th><td>{_total(security_groups)}</td></tr>\n"
+        f"<tr><th>Total LGPD Issues</th><td>{_total(lgpd_groups)}</td></tr>\n"
+        f"<tr><th>General Findings</th><td>{_total(finding_groups)}</td></tr>\n"
+        "</table>\n"
+    )
+    if limits_exceeded:
+        out.write('<div class="status"><b>Limit exceeded: results are partial.</b><ul>')
+        for message in limits_exceeded:
+            out.write(f"<li>{escape(message)}</li>")
+        out.write("</ul></div>\n")
+
+    out.write("<h2>General Findings</h2>\n")
+    _write_finding_sections(out, finding_groups)
+    out.write("<h2>Security Issues</h2>\n")
+    _write_issue_sections(out, security_groups, "No security issues identified.")
+    out.write("<h2>LGPD Compliance Issues</h2>\n")
+    _write_issue_sections(out, lgpd_groups, "No LGPD compliance issues identified.")
+    out.write("</body></html>\n")
+
+
+def html_reporter(
+    swagger_file_path: str,
+    findings: Iterable[Dict[str, Any]],
+    output_path: str,
+    security_issues: Optional[Iterable[SecurityIssue]] = None,
+    lgpd_issues: Optional[Iterable[LGPDIssue]] = None,
+    limits_exceeded: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Writes the HTML report of one specification to a file.
+
+    Returns:
+        Optional[str]: The path of the written report, or None on failure.
+    """
+    try:
+        with open(output_path, "w", encoding="utf-8") as out:
+            write_html(
+                out,
+                swagger_file_path,
+                findings,
+                security_issues,
+                lgpd_issues,
+                limits_exceeded,
+            )
+    except OSError as e:
+        print(f"Error: Could not write HTML report {output_path}: {e}")
+        return None
+    print(f"✅ HTML report '{output_path}' generated successfully!")
+    return output_path
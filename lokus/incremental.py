@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+import subprocess
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+from lokus import __version__
+from lokus.cache_files import file_digest
+from lokus.limits import LimitExceeded, ScanLimits, safe_load_limited
+from lokus.scanner import ScanResult
+from lokus.yaml_parser import SPEC_FILE_EXTENSIONS, is_openapi_document
+
+# Bumped whenever cached results or their fingerprints change shape
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = ".lokus_cache"
+
+# Directories never searched for spec files
+SKIPPED_DIRS = {".git", DEFAULT_CACHE_DIR, "node_modules", "__pycache__"}
+
+
+def _git(args: List[str], cwd: str) -> str:
+    completed = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout
+
+
+def git_changed_files(ref: str, cwd: str = ".") -> Optional[Set[str]]:
+    """
+    Asks the local git repository which files changed since `ref`.
+
+    Committed, staged and unstaged changes are included, as well as
+    untracked files that are not ignored. Never touches the network.
+
+    Returns:
+        A set of absolute paths, or None if git failed.
+    """
+    try:
+        top_level = _git(["rev-parse", "--show-toplevel"], cwd).strip()
+        changed = _git(["diff", "--name-only", ref, "--"], top_level).splitlines()
+        untracked = _git(
+            ["ls-files", "--others", "--exclude-standard", "--full-name"], top_level
+        ).splitlines()
+    except FileNotFoundError:
+        print("Error: git executable not found.")
+        return None
+    except subprocess.CalledProcessError as e:
+        print(f"Error: git failed to list changes since '{ref}': {e.stderr.strip()}")
+        return None
+
+    return {
+        os.path.realpath(os.path.join(top_level, name))
+        for name in changed + untracked
+        if name
+    }
+
+
+def iter_candidate_files(paths: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+    """
+    Yields (file, explicit) for the given files and the spec-named files
+    found in the given directories, without opening any of them.
+    """
+    for path in paths:
+        if os.path.isfile(path):
+            yield path, True
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(
+                d for d in dirs if d not in SKIPPED_DIRS and not d.startswith(".")
+            )
+            for name in sorted(files):
+                if name.lower().endswith(SPEC_FILE_EXTENSIONS):
+                    yield os.path.join(root, name), False
+
+
+def find_spec_files(paths: Iterable[str]) -> List[str]:
+    """
+    Lists the OpenAPI documents under the given files and directories.
+
+    Files given explicitly are always included; files found in directories
+    must have a spec extension and look like an OpenAPI document.
+    """
+    return [
+        file_path
+        for file_path, explicit in iter_candidate_files(paths)
+        if explicit or is_openapi_document(file_path)
+    ]
+
+
+def _collect_ref_targets(data: Any) -> Set[str]:
+    targets = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not ref.startswith("#"):
+                target = ref.split("#", 1)[0]
+                if target and "://" not in target:
+                    targets.add(target)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return targets
+
+
+def external_ref_files(
+    spec_data: Dict[str, Any], spec_path: str, limits: Optional[ScanLimits] = None
+) -> List[str]:
+    """
+    Returns the local files a spec $refs, directly or through other files.
+
+    Referenced files are parsed under the same `limits` as the spec itself.
+    """
+    limits = limits or ScanLimits()
+    found: Set[str] = set()
+    pending = [(spec_data, os.path.dirname(os.path.abspath(spec_path)))]
+    while pending:
+        data, base_dir = pending.pop()
+        for target in _collect_ref_targets(data):
+            file_path = os.path.realpath(os.path.join(base_dir, target))
+            if file_path in found:
+                continue
+            found.add(file_path)
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    limits.check_size(os.fstat(f.fileno()).st_size, file_path)
+                    data = safe_load_limited(f.read(), limits, file_path)
+            except (OSError, UnicodeDecodeError, yaml.YAMLError, LimitExceeded):
+                # A missing, broken or oversized fragment is still tracked by its digest
+                continue
+            pending.append((data, os.path.dirname(file_path)))
+    return sorted(found)
+
+
+def scan_settings_key(
+    config_data: Dict[str, Any],
+    only: Iterable[str] = (),
+    skip: Iterable[str] = (),
+    min_severity: Optional[str] = None,
+    baseline: Iterable[str] = (),
+) -> str:
+    """Hashes everything besides the spec itself that changes a scan result."""
+    payload = json.dumps(
+        {
+            "lokus": __version__,
+            "cache": CACHE_VERSION,
+            "config": config_data,
+            "only": list(only),
+            "skip": list(skip),
+            "min_severity": min_severity,
+            "baseline": sorted(baseline),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of scan results, one JSON file per spec.
+
+    Entries live under a directory named after the scan settings key and
+    record the digest of the spec and of every file it $refs, so a result
+    is only reused while none of them changed.
+    """
+
+    def __init__(self, cache_dir: str, settings_key: str):
+        self.directory = os.path.join(cache_dir, settings_key[:16])
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, spec_path: str) -> str:
+        name = hashlib.sha256(os.path.realpath(spec_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name[:32]}.json")
+
+    def get(self, spec_path: str) -> Optional[ScanResult]:
+        try:
+            with open(self._entry_path(spec_path), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        digests = entry.get("digests", {})
+        if not digests or any(
+            file_digest(file_path) != digest for file_path, digest in digests.items()
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ScanResult.from_dict(entry["result"])
+
+    def put(self, spec_path: str, ref_files: List[str], result: ScanResult) -> None:
+        files = [os.path.realpath(spec_path), *ref_files]
+        entry = {
+            "digests": {file_path: file_digest(file_path) for file_path in files},
+            "result": result.to_dict(),
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._entry_path(spec_path), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+        except OSError as e:
+            print(f"Warning: Could not write result cache for {spec_path}: {e}")
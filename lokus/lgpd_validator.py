@@ -4,6 +4,15 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from lokus.baseline import FindingFilter
+from lokus.limits import ScanBudget
+from lokus.rules import RuleSelection
+from lokus.schema_index import SchemaIndex
+from lokus.validation import ValidationContext, run_checks
+
+# Number of usage locations listed in a LGPD-005 description
+MAX_LISTED_USAGES = 5
+
 
 class LGPDIssueSeverity(Enum):
     HIGH = "HIGH"
@@ -20,11 +29,43 @@ class LGPDIssue:
     path: str
     recommendation: str
     reference: Optional[str] = None
+    # What was found at the path (the kind of data, or the field name), so
+    # different findings at one path fingerprint differently
+    key: str = ""
 
 
 class LGPDValidator:
-    def __init__(self):
-        self.issues: List[LGPDIssue] = []
+    name = "lgpd"
+
+    # Rule ID -> (check method, severity), in execution order
+    RULES = {
+        "LGPD-001": ("_check_sensitive_data_in_examples", LGPDIssueSeverity.HIGH),
+        "LGPD-002": ("_check_sensitive_data_in_descriptions", LGPDIssueSeverity.HIGH),
+        "LGPD-003": ("_check_sensitive_field_names", LGPDIssueSeverity.MEDIUM),
+        "LGPD-004": ("_check_direct_identifiers_in_paths", LGPDIssueSeverity.HIGH),
+        "LGPD-005": ("_check_data_minimization", LGPDIssueSeverity.MEDIUM),
+        "LGPD-006": ("_check_purpose_limitation", LGPDIssueSeverity.MEDIUM),
+    }
+
+    def __init__(
+        self,
+        selection: Optional[RuleSelection] = None,
+        finding_filter: Optional[FindingFilter] = None,
+    ):
+        self.finding_filter = finding_filter
+
+        # Resolve the rule selection once, so disabled checks are never run.
+        # Rules whose severity is below the threshold can't emit anything either.
+        selection = selection or RuleSelection()
+        self.checks = [
+            (rule_id, getattr(self, method))
+            for rule_id, (method, severity) in self.RULES.items()
+            if selection.is_enabled(rule_id, self.name)
+            and (
+                finding_filter is None
+                or finding_filter.severity_enabled(severity.value)
+            )
+        ]
 
         # Define regex patterns for sensitive data
         self.sensitive_patterns = {
@@ -71,27 +112,32 @@ class LGPDValidator:
             "personal_data",
         }
 
-    def validate_spec(self, spec: Dict[str, Any]) -> List[LGPDIssue]:
-        """Main validation method that runs all LGPD compliance checks"""
-        self.issues = []
-
-        # Run all LGPD compliance checks
-        self._check_sensitive_data_in_examples(spec)
-        self._check_sensitive_data_in_descriptions(spec)
-        self._check_sensitive_field_names(spec)
-        self._check_direct_identifiers_in_paths(spec)
-        self._check_data_minimization(spec)
-        self._check_purpose_limitation(spec)
-
-        return self.issues
-
-    def _check_sensitive_data_in_examples(self, spec: Dict[str, Any]) -> None:
+    def validate_spec(
+        self,
+        spec: Dict[str, Any],
+        finding_filter: Optional[FindingFilter] = None,
+        budget: Optional[ScanBudget] = None,
+    ) -> List[LGPDIssue]:
+        """
+        Main validation method that runs all enabled LGPD compliance checks.
+
+        Issues are collected in a per-call context, so one instance can be
+        shared between threads. `finding_filter` overrides the one given at
+        construction for this call only; with a `budget`, checks that run out
+        of time return partial results.
+        """
+        ctx = ValidationContext(finding_filter or self.finding_filter, budget)
+        return run_checks(self.checks, spec, ctx)
+
+    def _check_sensitive_data_in_examples(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for sensitive data in example values"""
 
         def check_value(value: str, path: str) -> None:
             for pattern_name, pattern in self.sensitive_patterns.items():
                 if pattern.search(value):
-                    self.issues.append(
+                    ctx.emit(
                         LGPDIssue(
                             rule_id="LGPD-001",
                             title="Sensitive Data in Example",
@@ -100,10 +146,12 @@ class LGPDValidator:
                             path=path,
                             recommendation=f"Replace the {pattern_name} with a placeholder value",
                             reference="https://www.gov.br/cidadania/pt-br/acesso-a-informacao/lgpd",
+                            key=pattern_name,
                         )
                     )
 
         def traverse_examples(data: Any, current_path: str) -> None:
+            ctx.tick()
             if isinstance(data, dict):
                 for key, value in data.items():
                     new_path = f"{current_path}.{key}" if current_path else key
@@ -116,13 +164,15 @@ class LGPDValidator:
 
         traverse_examples(spec, "")
 
-    def _check_sensitive_data_in_descriptions(self, spec: Dict[str, Any]) -> None:
+    def _check_sensitive_data_in_descriptions(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for sensitive data in descriptions"""
 
         def check_value(value: str, path: str) -> None:
             for pattern_name, pattern in self.sensitive_patterns.items():
                 if pattern.search(value):
-                    self.issues.append(
+                    ctx.emit(
                         LGPDIssue(
                             rule_id="LGPD-002",
                             title="Sensitive Data in Description",
@@ -131,10 +181,12 @@ class LGPDValidator:
                             path=path,
                             recommendation=f"Remove the {pattern_name} from the description",
                             reference="https://www.gov.br/cidadania/pt-br/acesso-a-informacao/lgpd",
+                            key=pattern_name,
                         )
                     )
 
         def traverse_descriptions(data: Any, current_path: str) -> None:
+            ctx.tick()
             if isinstance(data, dict):
                 for key, value in data.items():
                     new_path = f"{current_path}.{key}" if current_path else key
@@ -147,13 +199,15 @@ class LGPDValidator:
 
         traverse_descriptions(spec, "")
 
-    def _check_sensitive_field_names(self, spec: Dict[str, Any]) -> None:
+    def _check_sensitive_field_names(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for sensitive field names in schemas and parameters"""
 
         def check_field_name(name: str, path: str) -> None:
             name_lower = name.lower()
             if name_lower in self.sensitive_field_names:
-                self.issues.append(
+                ctx.emit(
                     LGPDIssue(
                         rule_id="LGPD-003",
                         title="Sensitive Field Name",
@@ -162,10 +216,12 @@ class LGPDValidator:
                         path=path,
                         recommendation="Consider using a more generic field name or documenting the data protection measures",
                         reference="https://www.gov.br/cidadania/pt-br/acesso-a-informacao/lgpd",
+                        key=name,
                     )
                 )
 
         def traverse_fields(data: Any, current_path: str) -> None:
+            ctx.tick()
             if isinstance(data, dict):
                 for key, value in data.items():
                     new_path = f"{current_path}.{key}" if current_path else key
@@ -178,7 +234,9 @@ class LGPDValidator:
 
         traverse_fields(spec, "")
 
-    def _check_direct_identifiers_in_paths(self, spec: Dict[str, Any]) -> None:
+    def _check_direct_identifiers_in_paths(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for direct identifiers in API paths"""
         paths = spec.get("paths", {})
         for path, path_item in paths.items():
@@ -187,7 +245,7 @@ class LGPDValidator:
                 pattern in path.lower()
                 for pattern in ["/cpf/", "/cnpj/", "/rg/", "/email/"]
             ):
-                self.issues.append(
+                ctx.emit(
                     LGPDIssue(
                         rule_id="LGPD-004",
                         title="Direct Identifier in Path",
@@ -199,47 +257,50 @@ class LGPDValidator:
                     )
                 )
 
-    def _check_data_minimization(self, spec: Dict[str, Any]) -> None:
+    def _check_data_minimization(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for data minimization principle compliance"""
-
-        def check_schema_properties(schema: Dict[str, Any], path: str) -> None:
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
+        for entry in SchemaIndex(spec):
+            ctx.tick()
+            if not entry.is_object:
+                continue
+
+            required = entry.required
+            usages = [usage for usage in entry.usages if usage != entry.path]
+            used_at = ""
+            if usages:
+                shown = ", ".join(usages[:MAX_LISTED_USAGES])
+                if len(usages) > MAX_LISTED_USAGES:
+                    shown += f" and {len(usages) - MAX_LISTED_USAGES} more"
+                used_at = f" (used at: {shown})"
 
             # Check if all properties are necessary
-            for prop_name, prop in properties.items():
-                if prop_name not in required and not prop.get("description"):
-                    self.issues.append(
-                        LGPDIssue(
-                            rule_id="LGPD-005",
-                            title="Missing Property Justification",
-                            description=f"Optional property '{prop_name}' lacks justification",
-                            severity=LGPDIssueSeverity.MEDIUM,
-                            path=f"{path}.properties.{prop_name}",
-                            recommendation="Add a description explaining why this property is necessary",
-                            reference="https://www.gov.br/cidadania/pt-br/acesso-a-informacao/lgpd",
-                        )
+            for prop_name, prop in entry.schema["properties"].items():
+                if prop_name in required:
+                    continue
+                if isinstance(prop, dict) and prop.get("description"):
+                    continue
+                ctx.emit(
+                    LGPDIssue(
+                        rule_id="LGPD-005",
+                        title="Missing Property Justification",
+                        description=f"Optional property '{prop_name}' lacks justification{used_at}",
+                        severity=LGPDIssueSeverity.MEDIUM,
+                        path=f"{entry.path}.properties.{prop_name}",
+                        recommendation="Add a description explaining why this property is necessary",
+                        reference="https://www.gov.br/cidadania/pt-br/acesso-a-informacao/lgpd",
                     )
+                )
 
-        def traverse_schemas(data: Any, current_path: str) -> None:
-            if isinstance(data, dict):
-                if "type" in data and data["type"] == "object":
-                    check_schema_properties(data, current_path)
-                for key, value in data.items():
-                    new_path = f"{current_path}.{key}" if current_path else key
-                    traverse_schemas(value, new_path)
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    traverse_schemas(item, f"{current_path}[{i}]")
-
-        traverse_schemas(spec, "")
-
-    def _check_purpose_limitation(self, spec: Dict[str, Any]) -> None:
+    def _check_purpose_limitation(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for purpose limitation principle compliance"""
 
         def check_operation_purpose(operation: Dict[str, Any], path: str) -> None:
             if not operation.get("description"):
-                self.issues.append(
+                ctx.emit(
                     LGPDIssue(
                         rule_id="LGPD-006",
                         title="Missing Operation Purpose",
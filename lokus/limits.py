@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+# Traversal steps between two clock reads; keeps time budgets nearly free
+CHECK_INTERVAL = 1024
+
+
+class LimitExceeded(ValueError):
+    """Raised when a document or a scan goes over one of the ScanLimits."""
+
+    def __init__(self, limit: str, message: str):
+        super().__init__(message)
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class ScanLimits:
+    """
+    Guardrails for untrusted specs; None disables a limit.
+
+    The size, node and depth limits apply while a document is parsed (YAML
+    aliases count as many nodes as they expand to). The time budgets apply
+    while it is scanned: a scan that runs out returns what it found so far,
+    with the exceeded limits listed in the result.
+    """
+
+    max_bytes: Optional[int] = None
+    max_nodes: Optional[int] = None
+    max_depth: Optional[int] = None
+    # Seconds for the whole scan, and for each rule
+    scan_timeout: Optional[float] = None
+    rule_timeout: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config_data: Optional[Dict[str, Any]]) -> "ScanLimits":
+        """Reads the `limits` section of a configuration (already validated)."""
+        section = (config_data or {}).get("limits") or {}
+        return cls(
+            **{f.name: section[f.name] for f in fields(cls) if f.name in section}
+        )
+
+    @property
+    def timed(self) -> bool:
+        return self.scan_timeout is not None or self.rule_timeout is not None
+
+    def check_size(self, size: int, source: str) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise LimitExceeded(
+                "max_bytes",
+                f"Limit exceeded: {source} is {size} bytes, over max_bytes ({self.max_bytes}).",
+            )
+
+
+# Value types accepted for each limit in a configuration file
+LIMIT_TYPES: Dict[str, Tuple[type, ...]] = {
+    "max_bytes": (int,),
+    "max_nodes": (int,),
+    "max_depth": (int,),
+    "scan_timeout": (int, float),
+    "rule_timeout": (int, float),
+}
+
+
+class _LimitedSafeLoader(yaml.SafeLoader):
+    """
+    A SafeLoader that counts nodes and nesting depth as it composes them.
+
+    Each anchor remembers the size and depth of its subtree, so an alias is
+    charged what it expands to and "billion laughs" documents stop early.
+    """
+
+    def __init__(self, stream: Any, limits: ScanLimits, source: str):
+        super().__init__(stream)
+        self.limits = limits
+        self.source = source
+        self.node_count = 0
+        self.depth = 0
+        self.deepest = 0
+        self.anchor_costs: Dict[str, Tuple[int, int]] = {}
+
+    def _charge(self, nodes: int, depth: int) -> None:
+        self.node_count += nodes
+        self.deepest = max(self.deepest, depth)
+        limits = self.limits
+        if limits.max_nodes is not None and self.node_count > limits.max_nodes:
+            raise LimitExceeded(
+                "max_nodes",
+                f"Limit exceeded: {self.source} has more than max_nodes ({limits.max_nodes}) YAML nodes.",
+            )
+        if limits.max_depth is not None and depth > limits.max_depth:
+            raise LimitExceeded(
+                "max_depth",
+                f"Limit exceeded: {self.source} nests deeper than max_depth ({limits.max_depth}).",
+            )
+
+    def compose_node(self, parent: Any, index: Any) -> Any:
+        if self.check_event(yaml.AliasEvent):
+            nodes, depth = self.anchor_costs.get(self.peek_event().anchor, (1, 1))
+            self._charge(nodes, self.depth + depth)
+            return super().compose_node(parent, index)
+
+        anchor = self.peek_event().anchor
+        nodes_before, deepest_before = self.node_count, self.deepest
+        self.depth += 1
+        self.deepest = self.depth
+        self._charge(1, self.depth)
+        node = super().compose_node(parent, index)
+        if anchor is not None:
+            self.anchor_costs[anchor] = (
+                self.node_count - nodes_before,
+                self.deepest - self.depth + 1,
+            )
+        self.depth -= 1
+        self.deepest = max(self.deepest, deepest_before)
+        return node
+
+
+def safe_load_limited(content: Any, limits: ScanLimits, source: str) -> Any:
+    """
+    yaml.safe_load with the node and depth limits enforced while parsing.
+
+    Raises:
+        LimitExceeded: If the content is over the node or depth limit.
+        yaml.YAMLError: If the content is not valid YAML.
+    """
+    if limits.max_nodes is None and limits.max_depth is None:
+        return yaml.safe_load(content)
+    loader = _LimitedSafeLoader(content, limits, source)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+class ScanBudget:
+    """
+    The time budgets of one scan.
+
+    Rules call start_rule() before running and tick() as they traverse the
+    spec; tick() only reads the clock every CHECK_INTERVAL calls and raises
+    LimitExceeded once the rule or the scan is out of time. Exceeded limits
+    are collected in `exceeded` for the scan result.
+
+    With `metrics` (a RunMetrics), the same hooks also time each rule and
+    count the nodes it traverses; nodes are counted from the countdown, so
+    tick() does no extra work. Call finish() once the last rule is done.
+    """
+
+    def __init__(self, limits: Optional[ScanLimits] = None, metrics: Any = None):
+        self.limits = limits or ScanLimits()
+        self.metrics = metrics
+        self.exceeded: List[str] = []
+        self.deadline = (
+            time.monotonic() + self.limits.scan_timeout
+            if self.limits.scan_timeout is not None
+            else None
+        )
+        self.rule_id: Optional[str] = None
+        self._rule_deadline = self.deadline
+        self._countdown = CHECK_INTERVAL
+        self._rule_started = 0.0
+        self._rule_nodes = 0
+
+    @property
+    def scan_expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    def start_rule(self, rule_id: str) -> bool:
+        """Starts the budget of a rule; False if the scan is already out of time."""
+        self.finish()
+        if self.scan_expired:
+            self._record(
+                f"Limit exceeded: scan_timeout ({self.limits.scan_timeout}s); the remaining rules were not run."
+            )
+            return False
+        self.rule_id = rule_id
+        self._rule_deadline = self.deadline
+        if self.limits.rule_timeout is not None:
+            rule_deadline = time.monotonic() + self.limits.rule_timeout
+            if self._rule_deadline is None or rule_deadline < self._rule_deadline:
+                self._rule_deadline = rule_deadline
+        self._countdown = CHECK_INTERVAL
+        self._rule_nodes = 0
+        if self.metrics is not None:
+            self._rule_started = time.perf_counter()
+        return True
+
+    def finish(self) -> None:
+        """Ends the current rule, reporting its time and nodes to the metrics."""
+        if self.rule_id is None:
+            return
+        if self.metrics is not None:
+            nodes = self._rule_nodes + CHECK_INTERVAL - self._countdown
+            self.metrics.observe_rule(
+                self.rule_id, time.perf_counter() - self._rule_started, nodes
+            )
+        self.rule_id = None
+
+    def tick(self) -> None:
+        self._countdown -= 1
+        if self._countdown:
+            return
+        self._countdown = CHECK_INTERVAL
+        self._rule_nodes += CHECK_INTERVAL
+        if self._rule_deadline is not None and time.monotonic() > self._rule_deadline:
+            if self.scan_expired:
+                limit = "scan_timeout"
+                seconds = self.limits.scan_timeout
+            else:
+                limit = "rule_timeout"
+                seconds = self.limits.rule_timeout
+            raise LimitExceeded(
+                limit,
+                f"Limit exceeded: {limit} ({seconds}s) during {self.rule_id}; its results are partial.",
+            )
+
+    def record(self, error: LimitExceeded) -> None:
+        self._record(str(error))
+
+    def _record(self, message: str) -> None:
+        if message not in self.exceeded:
+            self.exceeded.append(message)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRICS_FORMATS = ("prometheus", "json")
+
+# Upper bounds (seconds) of the per-spec scan time histogram
+SCAN_SECONDS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def resolve_metrics_format(path: str, metrics_format: Optional[str] = None) -> str:
+    """The chosen format, or the one implied by the file extension."""
+    if metrics_format:
+        return metrics_format
+    return "json" if path.lower().endswith(".json") else "prometheus"
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Histogram:
+    """A cumulative histogram, as Prometheus exposes them."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": {str(bound): n for bound, n in zip(self.buckets, self.counts)},
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class PatternStats:
+    """Calls, matches and time of one forbidden key pattern."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "hits": self.hits, "seconds": self.seconds}
+
+
+class TimedPattern:
+    """A compiled pattern that counts its calls, matches and time."""
+
+    def __init__(self, compiled: "re.Pattern", stats: PatternStats):
+        self.compiled = compiled
+        self.stats = stats
+
+    def fullmatch(self, string: str) -> Optional["re.Match"]:
+        start = time.perf_counter()
+        match = self.compiled.fullmatch(string)
+        self.stats.seconds += time.perf_counter() - start
+        self.stats.calls += 1
+        if match:
+            self.stats.hits += 1
+        return match
+
+
+class RunMetrics:
+    """
+    Counters of one Lokus run, for dashboards.
+
+    Scans feed it through run_scan(metrics=...): phases are timed around
+    each validator, rules are timed and their nodes counted by the scan
+    budget (which already sees every rule start and every traversed node),
+    and each result adds its entries per rule. Nothing is collected when no
+    RunMetrics is passed.
+
+    With `profile_patterns`, the deep search also counts the calls, matches
+    and time of each forbidden key pattern. That times every match, so it
+    is left to explicit profiling runs.
+    """
+
+    def __init__(self, profile_patterns: bool = False) -> None:
+        self.profile_patterns = profile_patterns
+        self.patterns: Dict[str, PatternStats] = {}
+        self.specs_scanned = 0
+        self.nodes_visited = 0
+        self.findings: Dict[str, int] = {}
+        self.phase_seconds: Dict[str, float] = {}
+        self.rule_seconds: Dict[str, float] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.scan_seconds = Histogram(SCAN_SECONDS_BUCKETS)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Adds the time spent in the block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def observe_rule(self, rule_id: str, seconds: float, nodes: int) -> None:
+        self.rule_seconds[rule_id] = self.rule_seconds.get(rule_id, 0.0) + seconds
+        self.nodes_visited += nodes
+
+    def timed_patterns(
+        self, patterns: List[Tuple[str, "re.Pattern"]]
+    ) -> List[Tuple[str, Any]]:
+        """Wraps compiled deep search patterns to count into this run."""
+        return [
+            (
+                pattern,
+                TimedPattern(
+                    compiled, self.patterns.setdefault(pattern, PatternStats())
+                ),
+            )
+            for pattern, compiled in patterns
+        ]
+
+    def observe_scan(self, result: Any, seconds: float) -> None:
+        """Counts one scanned spec and its reported entries per rule."""
+        self.specs_scanned += 1
+        self.scan_seconds.observe(seconds)
+        rule_ids: List[str] = [finding.get("type") for finding in result.findings]
+        rule_ids.extend(issue.rule_id for issue in result.security_issues)
+        rule_ids.extend(issue.rule_id for issue in result.lgpd_issues)
+        for rule_id in rule_ids:
+            self.findings[rule_id] = self.findings.get(rule_id, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "specs_scanned": self.specs_scanned,
+            "nodes_visited": self.nodes_visited,
+            "findings": dict(sorted(self.findings.items())),
+            "phase_seconds": self.phase_seconds,
+            "rule_seconds": dict(sorted(self.rule_seconds.items())),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "scan_seconds": self.scan_seconds.to_dict(),
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+        if self.profile_patterns:
+            data["patterns"] = {
+                pattern: stats.to_dict() for pattern, stats in self.patterns.items()
+            }
+        return data
+
+    def to_prometheus(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[str]) -> None:
+            lines.append(f"# HELP lokus_{name} {help_text}")
+            lines.append(f"# TYPE lokus_{name} {kind}")
+            lines.extend(f"lokus_{sample}" for sample in samples)
+
+        def labeled(name: str, label: str, values: Dict[str, Any]) -> List[str]:
+            return [
+                f'{name}{{{label}="{_escape_label(key)}"}} {value}'
+                for key, value in sorted(values.items())
+            ]
+
+        metric(
+            "specs_scanned_total",
+            "counter",
+            "Specs scanned in this run.",
+            [f"specs_scanned_total {self.specs_scanned}"],
+        )
+        metric(
+            "nodes_visited_total",
+            "counter",
+            "Spec nodes traversed by the rules.",
+            [f"nodes_visited_total {self.nodes_visited}"],
+        )
+        metric(
+            "findings_total",
+            "counter",
+            "Reported findings and issues per rule.",
+            labeled("findings_total", "rule", self.findings),
+        )
+        metric(
+            "phase_seconds_total",
+            "counter",
+            "Time spent per pipeline phase.",
+            labeled("phase_seconds_total", "phase", self.phase_seconds),
+        )
+        metric(
+            "rule_seconds_total",
+            "counter",
+            "Time spent per rule.",
+            labeled("rule_seconds_total", "rule", self.rule_seconds),
+        )
+        metric(
+            "cache_hits_total",
+            "counter",
+            "Results reused from the cache.",
+            [f"cache_hits_total {self.cache_hits}"],
+        )
+        metric(
+            "cache_misses_total",
+            "counter",
+            "Specs scanned because no cached result could be used.",
+            [f"cache_misses_total {self.cache_misses}"],
+        )
+        histogram = self.scan_seconds
+        metric(
+            "scan_seconds",
+            "histogram",
+            "Time to scan one spec.",
+            [
+                f'scan_seconds_bucket{{le="{bound}"}} {count}'
+                for bound, count in zip(histogram.buckets, histogram.counts)
+            ]
+            + [
+                f'scan_seconds_bucket{{le="+Inf"}} {histogram.count}',
+                f"scan_seconds_sum {histogram.sum}",
+                f"scan_seconds_count {histogram.count}",
+            ],
+        )
+        if self.profile_patterns:
+            for name, field, help_text in (
+                (
+                    "pattern_calls_total",
+                    "calls",
+                    "Keys and values matched per pattern.",
+                ),
+                ("pattern_hits_total", "hits", "Matches per forbidden key pattern."),
+                ("pattern_seconds_total", "seconds", "Time spent per pattern."),
+            ):
+                metric(
+                    name,
+                    "counter",
+                    help_text,
+                    labeled(
+                        name,
+                        "pattern",
+                        {
+                            pattern: getattr(stats, field)
+                            for pattern, stats in self.patterns.items()
+                        },
+                    ),
+                )
+        peak = peak_rss_bytes()
+        if peak is not None:
+            metric(
+                "peak_rss_bytes",
+                "gauge",
+                "Peak resident memory of the run.",
+                [f"peak_rss_bytes {peak}"],
+            )
+        return "\n".join(lines) + "\n"
+
+    def format_profile(self, limit: int = 20) -> str:
+        """The costliest rules and patterns of the run, as text tables."""
+        lines = ["Profile: rule cost", f"  {'RULE':<24} {'TIME':>10}"]
+        by_time = sorted(self.rule_seconds.items(), key=lambda item: -item[1])
+        for rule_id, seconds in by_time[:limit]:
+            lines.append(f"  {rule_id:<24} {seconds * 1000:>7.2f} ms")
+        if self.profile_patterns:
+            lines.append("Profile: forbidden key pattern cost")
+            lines.append(f"  {'PATTERN':<40} {'CALLS':>9} {'HITS':>7} {'TIME':>10}")
+            by_time = sorted(self.patterns.items(), key=lambda item: -item[1].seconds)
+            for pattern, stats in by_time[:limit]:
+                lines.append(
+                    f"  {pattern:<40} {stats.calls:>9} {stats.hits:>7} {stats.seconds * 1000:>7.2f} ms"
+                )
+        return "\n".join(lines)
+
+    def write(self, path: str, metrics_format: Optional[str] = None) -> bool:
+        """
+        Writes the metrics to a file, replacing it atomically so collectors
+        never read a partial file. Returns False (and prints why) on failure.
+        """
+        if resolve_metrics_format(path, metrics_format) == "json":
+            text = json.dumps(self.to_dict(), indent=2) + "\n"
+        else:
+            text = self.to_prometheus()
+        partial = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(partial, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(partial, path)
+        except OSError as e:
+            print(f"Error: Could not write metrics file {path}: {e}")
+            return False
+        return True
+
+
+def timed_phase(metrics: Optional[RunMetrics], name: str) -> ContextManager[None]:
+    """Times a block as a phase of `metrics`, or does nothing without metrics."""
+    return metrics.phase(name) if metrics is not None else nullcontext()
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
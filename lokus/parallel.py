@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lokus.api import Ruleset
+from lokus.lgpd_validator import LGPDValidator
+from lokus.scanner import ScanResult
+from lokus.security_validator import SecurityValidator
+from lokus.spec_diff import SWAGGER2_SECTIONS
+
+# Rules that need the whole spec at once (LGPD-005 indexes every schema)
+WHOLE_SPEC_RULES = ("LGPD-005",)
+
+# Chunks per worker, so a slow chunk does not leave other workers idle
+CHUNKS_PER_WORKER = 4
+
+# Specs with fewer units than this are scanned in-process
+MIN_PARALLEL_UNITS = 64
+
+# A chunk unit: ("paths", "/users"), ("components", "schemas", "User"),
+# ("definitions", "User") or a whole top-level key ("info",)
+ChunkUnit = Tuple[Any, ...]
+
+_WORKER_RULESET: Optional[Ruleset] = None
+
+
+def partition_units(spec: Dict[str, Any]) -> List[Tuple[ChunkUnit, Any]]:
+    """Splits a spec into path items, component entries and other top-level keys."""
+    units: List[Tuple[ChunkUnit, Any]] = []
+    for key, value in spec.items():
+        if key == "paths" and isinstance(value, dict):
+            units.extend((("paths", name), item) for name, item in value.items())
+        elif key == "components" and isinstance(value, dict):
+            for section, entries in value.items():
+                if isinstance(entries, dict):
+                    units.extend(
+                        (("components", section, name), entry)
+                        for name, entry in entries.items()
+                    )
+                else:
+                    units.append((("components", section), entries))
+        elif key in SWAGGER2_SECTIONS and isinstance(value, dict):
+            units.extend(((key, name), entry) for name, entry in value.items())
+        else:
+            units.append(((key,), value))
+    return units
+
+
+def build_chunk(units: List[Tuple[ChunkUnit, Any]]) -> Dict[str, Any]:
+    """Reassembles a partial spec from units, keeping their original paths."""
+    chunk: Dict[str, Any] = {}
+    for unit, value in units:
+        target = chunk
+        for part in unit[:-1]:
+            target = target.setdefault(part, {})
+        target[unit[-1]] = value
+    return chunk
+
+
+def split_spec(spec: Dict[str, Any], chunk_count: int) -> List[Dict[str, Any]]:
+    """Cuts a spec into at most `chunk_count` contiguous partial specs."""
+    units = partition_units(spec)
+    chunk_count = max(1, min(chunk_count, len(units)))
+    size, extra = divmod(len(units), chunk_count)
+    chunks = []
+    start = 0
+    for i in range(chunk_count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(build_chunk(units[start:end]))
+        start = end
+    return chunks
+
+
+def _init_worker(ruleset: Ruleset) -> None:
+    global _WORKER_RULESET
+    _WORKER_RULESET = ruleset
+
+
+def _scan_chunk(chunk: Dict[str, Any]) -> ScanResult:
+    return _WORKER_RULESET.scan(chunk)
+
+
+def _unique(items: List[Any], key: Any) -> List[Any]:
+    # Container keys ("paths", "components", ...) appear in every chunk
+    seen = set()
+    unique = []
+    for item in items:
+        marker = key(item)
+        if marker not in seen:
+            seen.add(marker)
+            unique.append(item)
+    return unique
+
+
+def _issue_key(issue: Any) -> Tuple[str, str, str]:
+    return (issue.rule_id, issue.path, issue.description)
+
+
+def _merge_issues(rule_order: List[str], issue_lists: List[List[Any]]) -> List[Any]:
+    """Orders issues rule by rule, then part by part, as a single scan would."""
+    merged = []
+    for rule_id in rule_order:
+        for issues in issue_lists:
+            merged.extend(issue for issue in issues if issue.rule_id == rule_id)
+    return _unique(merged, _issue_key)
+
+
+def merge_results(results: List[ScanResult]) -> ScanResult:
+    """
+    Merges the results of contiguous parts of one spec, in part order.
+
+    Entries reported by several parts (e.g. for the shared "paths" key) are
+    kept once.
+    """
+    return ScanResult(
+        findings=_unique(
+            [finding for result in results for finding in result.findings],
+            lambda finding: tuple(sorted(finding.items())),
+        ),
+        security_issues=_merge_issues(
+            list(SecurityValidator.RULES),
+            [result.security_issues for result in results],
+        ),
+        lgpd_issues=_merge_issues(
+            list(LGPDValidator.RULES),
+            [result.lgpd_issues for result in results],
+        ),
+        suppressed_count=sum(result.suppressed_count for result in results),
+        limits_exceeded=_unique(
+            [message for result in results for message in result.limits_exceeded],
+            lambda message: message,
+        ),
+    )
+
+
+def part_ruleset(ruleset: Ruleset, baseline: Optional[Iterable[str]] = None) -> Ruleset:
+    """The ruleset to scan one part of a spec with: everything but whole-spec rules."""
+    return Ruleset(
+        ruleset.config_data,
+        ruleset.only,
+        ruleset.skip + list(WHOLE_SPEC_RULES),
+        ruleset.min_severity,
+        ruleset.baseline if baseline is None else baseline,
+    )
+
+
+def scan_whole_spec_rules(
+    spec_data: Dict[str, Any],
+    ruleset: Ruleset,
+    baseline: Optional[Iterable[str]] = None,
+) -> ScanResult:
+    """Runs only the enabled whole-spec rules of a ruleset over the full spec."""
+    whole_rules = [
+        rule_id
+        for rule_id in WHOLE_SPEC_RULES
+        if ruleset.selection.is_enabled(rule_id, LGPDValidator.name)
+    ]
+    if not whole_rules:
+        return ScanResult()
+    return Ruleset(
+        {},
+        whole_rules,
+        min_severity=ruleset.min_severity,
+        baseline=ruleset.baseline if baseline is None else baseline,
+    ).scan(spec_data)
+
+
+def scan_parallel(
+    spec_data: Dict[str, Any],
+    ruleset: Ruleset,
+    workers: Optional[int] = None,
+    chunks_per_worker: int = CHUNKS_PER_WORKER,
+) -> ScanResult:
+    """
+    Scans one large spec on a pool of worker processes.
+
+    The spec is cut into contiguous chunks of path items and component
+    entries. Each worker receives the compiled ruleset once, at startup, and
+    then only chunks. Rules that need the whole spec run in this process
+    while the workers scan. Results are merged in the order a single-process
+    scan reports them, and the baseline is applied after merging so
+    suppression counts stay exact.
+    """
+    workers = workers or os.cpu_count() or 1
+    units = partition_units(spec_data)
+    if workers < 2 or len(units) < MIN_PARALLEL_UNITS:
+        return ruleset.scan(spec_data)
+
+    # Workers skip the whole-spec rules and the baseline, applied after merging
+    chunk_ruleset = part_ruleset(ruleset, baseline=())
+
+    chunks = split_spec(spec_data, workers * chunks_per_worker)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(chunk_ruleset,)
+    ) as pool:
+        pending = pool.map(_scan_chunk, chunks)
+        whole_result = scan_whole_spec_rules(spec_data, ruleset, baseline=())
+        chunk_results = list(pending)
+
+    merged = merge_results(chunk_results + [whole_result])
+
+    finding_filter = ruleset.finding_filter()
+    if finding_filter.baseline:
+        merged.findings = [
+            finding
+            for finding in merged.findings
+            if finding_filter.accepts(finding["type"], finding["path"], finding["key"])
+        ]
+        merged.security_issues = [
+            issue
+            for issue in merged.security_issues
+            if finding_filter.accepts(issue.rule_id, issue.path)
+        ]
+        merged.lgpd_issues = [
+            issue
+            for issue in merged.lgpd_issues
+            if finding_filter.accepts(issue.rule_id, issue.path, issue.key)
+        ]
+        merged.suppressed_count = finding_filter.suppressed
+    return merged
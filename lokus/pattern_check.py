@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+import re
+import string
+import time
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+# Characters used to probe what a part of a pattern can match
+PROBE_CHARS = frozenset(string.ascii_letters + string.digits + string.punctuation + " ")
+
+# Repeated characters of adversarial keys, in order of preference
+SEED_CHARS = "aA0_-. @/:"
+MAX_SEEDS = 4
+
+# Lengths of the adversarial keys: small steps while backtracking may be
+# exponential, then doubling to catch polynomial blowups on long values
+KEY_LENGTHS = tuple(range(6, 33, 2)) + (64, 128, 256)
+
+# Endings that make a key fail at its last character, forcing backtracking
+KEY_ENDINGS = ("!", "☃")
+
+# Time to reject one key above which a pattern is reported as slow
+SLOW_PATTERN_SECONDS = 0.01
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_ZERO_WIDTH = (
+    sre_constants.AT,
+    sre_constants.ASSERT,
+    sre_constants.ASSERT_NOT,
+)
+_CATEGORIES = {
+    "CATEGORY_DIGIT": re.compile(r"\d"),
+    "CATEGORY_NOT_DIGIT": re.compile(r"\D"),
+    "CATEGORY_SPACE": re.compile(r"\s"),
+    "CATEGORY_NOT_SPACE": re.compile(r"\S"),
+    "CATEGORY_WORD": re.compile(r"\w"),
+    "CATEGORY_NOT_WORD": re.compile(r"\W"),
+}
+
+
+def _in_chars(items) -> FrozenSet[str]:
+    # Probe characters matched by a character class ([...], \w, ...)
+    negate = False
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            low, high = av
+            chars.update(c for c in PROBE_CHARS if low <= ord(c) <= high)
+        elif op is sre_constants.CATEGORY:
+            category = _CATEGORIES.get(str(av))
+            if category is None:
+                return PROBE_CHARS
+            chars.update(c for c in PROBE_CHARS if category.match(c))
+        else:
+            return PROBE_CHARS
+    chars &= PROBE_CHARS
+    return PROBE_CHARS - chars if negate else frozenset(chars)
+
+
+def _item_first(op, av) -> FrozenSet[str]:
+    # Probe characters that can start a match of one parsed item
+    if op is sre_constants.LITERAL:
+        return frozenset({chr(av)}) & PROBE_CHARS
+    if op is sre_constants.NOT_LITERAL:
+        return PROBE_CHARS - {chr(av)}
+    if op is sre_constants.ANY:
+        return PROBE_CHARS
+    if op is sre_constants.IN:
+        return _in_chars(av)
+    if op is sre_constants.SUBPATTERN:
+        return _first(av[-1])
+    if op is sre_constants.BRANCH:
+        return frozenset().union(*(_first(branch) for branch in av[1]))
+    if op in _REPEATS:
+        return _first(av[2])
+    if op in _ZERO_WIDTH:
+        return frozenset()
+    # Anything else (backreferences, conditionals...) may match anything
+    return PROBE_CHARS
+
+
+def _can_be_empty(op, av) -> bool:
+    if op in _REPEATS:
+        return av[0] == 0 or av[2].getwidth()[0] == 0
+    if op is sre_constants.SUBPATTERN:
+        return av[-1].getwidth()[0] == 0
+    if op is sre_constants.BRANCH:
+        return any(branch.getwidth()[0] == 0 for branch in av[1])
+    return op in _ZERO_WIDTH
+
+
+def _first(items) -> FrozenSet[str]:
+    chars: FrozenSet[str] = frozenset()
+    for op, av in items:
+        chars |= _item_first(op, av)
+        if not _can_be_empty(op, av):
+            break
+    return chars
+
+
+def _flatten(items):
+    # Top-level items of a sequence, looking through groups
+    for op, av in items:
+        if op is sre_constants.SUBPATTERN:
+            yield from _flatten(av[-1])
+        else:
+            yield op, av
+
+
+def _walk(items):
+    # Every item of a parsed pattern, at any depth
+    for op, av in items:
+        yield op, av
+        if op in _REPEATS:
+            yield from _walk(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            yield from _walk(av[-1])
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from _walk(branch)
+
+
+def _inner_repeats(items):
+    # Repeats of variable length, at any depth
+    for op, av in _walk(items):
+        if op in _REPEATS and av[1] > av[0]:
+            yield op, av
+
+
+def _repeat_risk(body) -> Optional[str]:
+    """Why repeating `body` without bound can backtrack catastrophically."""
+    for _, inner in _inner_repeats(body):
+        inner_chars = _first(inner[2])
+        # Other required parts of the body separate the iterations only if
+        # the inner repeat cannot consume them as well
+        separators = [
+            _item_first(op, av)
+            for op, av in _flatten(body)
+            if av is not inner and not _can_be_empty(op, av)
+        ]
+        if not any(
+            separator and not separator & inner_chars for separator in separators
+        ):
+            return "nested quantifiers"
+    for op, av in _flatten(body):
+        if op is sre_constants.BRANCH:
+            firsts = [_first(branch) for branch in av[1]]
+            for i, chars in enumerate(firsts):
+                if any(chars & other for other in firsts[i + 1 :]):
+                    return "a repeated alternation whose branches overlap"
+    return None
+
+
+def _static_risk(items) -> Optional[str]:
+    for op, av in items:
+        if op in _REPEATS:
+            if av[1] == sre_constants.MAXREPEAT:
+                risk = _repeat_risk(av[2])
+                if risk:
+                    return risk
+            risk = _static_risk(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            risk = _static_risk(av[-1])
+        elif op is sre_constants.BRANCH:
+            risk = next(filter(None, (_static_risk(b) for b in av[1])), None)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            risk = _static_risk(av[1])
+        else:
+            risk = None
+        if risk:
+            return risk
+    return None
+
+
+def adversarial_keys(pattern: str) -> List[str]:
+    """
+    Keys built to make a pattern backtrack: runs of characters its
+    repeats accept, after its literal prefix, ending in a character that
+    makes the match fail. Shorter keys come first.
+    """
+    parsed = sre_parse.parse(pattern)
+    repeats = list(_inner_repeats(parsed))
+    repeated_bodies = any(
+        av[1] > 1 and any(_inner_repeats(av[2]))
+        for op, av in _walk(parsed)
+        if op in _REPEATS
+    )
+    if len(repeats) < 2 and not repeated_bodies:
+        # With a single variable repeat, matching time is linear in the key
+        return []
+    repeated = frozenset().union(*(_first(av[2]) for _, av in repeats))
+    prefix = ""
+    for op, av in parsed:
+        if op is not sre_constants.LITERAL:
+            break
+        prefix += chr(av)
+    seeds = [c for c in SEED_CHARS if c in repeated]
+    seeds += sorted(repeated - set(seeds))
+    return [
+        prefix + seed * length + ending
+        for length in KEY_LENGTHS
+        for seed in seeds[:MAX_SEEDS]
+        for ending in KEY_ENDINGS
+    ]
+
+
+def _match_seconds(compiled: "re.Pattern", key: str) -> float:
+    start = time.perf_counter()
+    compiled.fullmatch(key)
+    return time.perf_counter() - start
+
+
+def time_pattern(compiled: "re.Pattern") -> Tuple[float, str]:
+    """
+    Times a compiled pattern on its adversarial keys, stopping at the first
+    slow one. Returns the longest time to reject a key and that key.
+    """
+    slowest = (0.0, "")
+    for key in adversarial_keys(compiled.pattern):
+        seconds = _match_seconds(compiled, key)
+        if seconds > SLOW_PATTERN_SECONDS:
+            # Measured again, so a pause of the process is not blamed on the pattern
+            seconds = min(seconds, _match_seconds(compiled, key))
+        if seconds > slowest[0]:
+            slowest = (seconds, key)
+        if seconds > SLOW_PATTERN_SECONDS:
+            break
+    return slowest
+
+
+@lru_cache(maxsize=None)
+def check_pattern(pattern: str) -> Tuple[str, ...]:
+    """
+    Problems of a forbidden key pattern that can make scans slow: a static
+    look for constructs prone to catastrophic backtracking, and a timed run
+    against adversarial keys. Invalid patterns are left to the deep search,
+    which reports them. Results are cached per pattern.
+    """
+    try:
+        compiled = re.compile(pattern)
+        risk = _static_risk(sre_parse.parse(pattern))
+    except (re.error, RecursionError):
+        return ()
+    problems = []
+    if risk:
+        problems.append(f"has {risk}, which can backtrack catastrophically")
+    seconds, key = time_pattern(compiled)
+    if seconds > SLOW_PATTERN_SECONDS:
+        problems.append(
+            f"took {seconds * 1000:.0f} ms to reject a {len(key)}-character key"
+        )
+    return tuple(problems)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from string import Formatter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from lokus.scanner import ScanResult
+
+# File names of PDF reports; {stem} is the spec file name without its
+# extension and {timestamp} the time the run started
+DEFAULT_PDF_NAME = "lokus_report-{timestamp}.pdf"
+DEFAULT_BATCH_PDF_NAME = "lokus_report-{stem}-{timestamp}.pdf"
+PDF_NAME_FIELDS = ("stem", "timestamp")
+
+
+def validate_pdf_name(name: str) -> None:
+    """Raises ValueError for templates with unknown or malformed fields."""
+    try:
+        fields = [field for _, field, _, _ in Formatter().parse(name) if field]
+    except ValueError as e:
+        raise ValueError(f"Invalid PDF name template '{name}': {e}")
+    unknown = [field for field in fields if field not in PDF_NAME_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) in PDF name template '{name}': {', '.join(unknown)}. "
+            f"Use {{stem}} and {{timestamp}}."
+        )
+
+
+def _render_job(job: Tuple[str, Dict[str, Any], str]) -> str:
+    # Runs in a worker: reportlab is only loaded there
+    from lokus.pdf_reporter import write_pdf
+
+    spec_path, result_data, output_path = job
+    with open(output_path, "wb") as stream:
+        write_pdf(ScanResult.from_dict(result_data), stream, spec_path)
+    return output_path
+
+
+class PdfRenderer:
+    """
+    Renders PDF reports on a pool of worker processes.
+
+    Results are handed over as soon as they are scanned, serialized with
+    ScanResult.to_dict(), so layout overlaps with reporting and several
+    reports render in parallel. Nothing is started until the first report
+    is submitted.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = ".",
+        name: Optional[str] = None,
+        workers: Optional[int] = None,
+        batch: bool = False,
+    ):
+        self.output_dir = output_dir
+        self.name = name or (DEFAULT_BATCH_PDF_NAME if batch else DEFAULT_PDF_NAME)
+        self.workers = workers
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[str, Future]] = []
+        self._paths: Set[str] = set()
+
+    def output_path(self, spec_path: str) -> str:
+        """The report path for a spec; repeated names get a numeric suffix."""
+        stem = os.path.splitext(os.path.basename(spec_path))[0]
+        path = os.path.join(
+            self.output_dir, self.name.format(stem=stem, timestamp=self.timestamp)
+        )
+        base, extension = os.path.splitext(path)
+        suffix = 1
+        while path in self._paths:
+            suffix += 1
+            path = f"{base}-{suffix}{extension}"
+        self._paths.add(path)
+        return path
+
+    def submit(self, spec_path: str, result: ScanResult) -> Optional[str]:
+        """Queues the report of one spec; returns where it will be written."""
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except OSError as e:
+            print(
+                f"Error: Could not create PDF output directory {self.output_dir}: {e}"
+            )
+            return None
+        output_path = self.output_path(spec_path)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers or os.cpu_count() or 1
+            )
+        job = (spec_path, result.to_dict(), output_path)
+        self._pending.append((output_path, self._pool.submit(_render_job, job)))
+        return output_path
+
+    def wait(self) -> bool:
+        """Waits for every queued report; returns whether all were written."""
+        succeeded = True
+        for output_path, future in self._pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Error generating PDF '{output_path}': {e}")
+                succeeded = False
+                continue
+            print(f"✅ PDF report '{output_path}' generated successfully!")
+            print(f"📄 Report saved to: {os.path.abspath(output_path)}")
+        self._pending = []
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        return succeeded
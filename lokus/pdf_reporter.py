@@ -1,9 +1,13 @@
+import io
 import os
+import textwrap
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional
 
 from reportlab.graphics.shapes import Drawing
 from reportlab.lib.colors import (
+    Color,
     HexColor,
     white,
 )
@@ -22,96 +26,58 @@ from reportlab.platypus import (
 )
 from svglib.svglib import svg2rlg
 
+from lokus import report_colors
 from lokus.lgpd_validator import LGPDIssue, LGPDIssueSeverity
+from lokus.scanner import ScanResult
 from lokus.security_validator import SecurityIssue, SecurityIssueSeverity
 
+# Above this many entries, the report lists them as grouped rows instead of
+# one card each, so layout time follows the number of rules
+COMPACT_THRESHOLD = 200
 
-def pdf_reporter(
-    swagger_file_path: str,
-    findings: List[Dict[str, Any]],
-    security_issues: Optional[List[SecurityIssue]] = None,
-    lgpd_issues: Optional[List[LGPDIssue]] = None,
-):
-    """
-    Generates a PDF report based on provided security and LGPD issues,
-    and general findings.
+# Characters per line of the path and description columns in compact mode
+COMPACT_PATH_WIDTH = 48
+COMPACT_DESCRIPTION_WIDTH = 60
 
-    Args:
-        swagger_file_path (str): Path to the analyzed Swagger file.
-        findings (List[Dict[str, Any]]): A list of general findings.
-        security_issues (Optional[List[SecurityIssue]]): A list of security issues.
-        lgpd_issues (Optional[List[LGPDIssue]]): A list of LGPD issues.
-    """
+# Rows per table in compact mode (a few pages each)
+COMPACT_ROWS_PER_TABLE = 200
 
-    output_filename = f"lokus_report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
 
-    # Document setup with custom margins
-    doc = SimpleDocTemplate(
-        output_filename,
-        pagesize=letter,
-        leftMargin=0.75 * inch,
-        rightMargin=0.75 * inch,
-        topMargin=1 * inch,
-        bottomMargin=1 * inch,
-    )
+def _wrap(text: Any, width: int) -> str:
+    # Plain multi-line strings lay out much faster than Paragraphs
+    return "\n".join(textwrap.wrap(str(text), width, break_long_words=True)) or "-"
 
-    styles = getSampleStyleSheet()
-    story = []
 
-    # Define color scheme
-    primary_color = HexColor("#9000a5")  # Deep purple for primary elements
-    secondary_color = HexColor("#5a007a")  # Darker purple for secondary elements
-    header_background = HexColor("#B594B6")  # Light purple for header background
-    header_border = HexColor("#9000a5")  # Matching border color for headers
-    accent_color = HexColor("#3498db")  # Bright blue for accents and highlights
-
-    # Define severity issue colors
-    success_color = HexColor("#2ecc71")  # Green for low severity or success
-    warning_color = HexColor("#f39c12")  # Yellow for medium severity or warning
-    danger_color = HexColor("#e67e22")  # Orange for high severity or danger
-    critical_color = HexColor("#e74c3c")  # Red for critical severity
-
-    # Custom styles for different text elements
-    title_style = ParagraphStyle(
-        name="CustomTitle",
-        parent=styles["Title"],
-        fontSize=28,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName="Helvetica-Bold",
-    )
+def _group_by(entries: List[Any], key: Any) -> Dict[Any, List[Any]]:
+    groups: Dict[Any, List[Any]] = {}
+    for entry in entries:
+        groups.setdefault(key(entry), []).append(entry)
+    return groups
 
-    subtitle_style = ParagraphStyle(
-        name="CustomSubtitle",
-        parent=styles["Normal"],
-        fontSize=16,
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName="Helvetica",
-    )
 
-    header_style = ParagraphStyle(
-        name="CustomHeader",
-        parent=styles["Heading1"],
-        fontSize=20,
-        spaceBefore=20,
-        spaceAfter=20,
-        fontName="Helvetica-Bold",
-        borderWidth=2,
-        borderColor=header_border,
-        borderPadding=6,
-        backColor=header_background,
-    )
+# Color scheme
+PRIMARY_COLOR = HexColor(report_colors.PRIMARY)
+SECONDARY_COLOR = HexColor(report_colors.SECONDARY)
+HEADER_BACKGROUND = HexColor(report_colors.HEADER_BACKGROUND)
+HEADER_BORDER = HexColor(report_colors.PRIMARY)  # Matching border color for headers
+ACCENT_COLOR = HexColor(report_colors.ACCENT)
+LIGHT_BACKGROUND = HexColor(report_colors.LIGHT_BACKGROUND)
+CARD_BACKGROUND = HexColor("#FDFDFE")
 
-    subheader_style = ParagraphStyle(
-        name="CustomSubHeader",
-        parent=styles["Heading2"],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=10,
-        fontName="Helvetica-Bold",
-    )
+SEVERITY_COLORS = {
+    severity: HexColor(report_colors.SEVERITY[severity.value])
+    for severity in (*SecurityIssueSeverity, *LGPDIssueSeverity)
+}
+
+# Shipped inside the package, so reports work from any working directory
+LOGO_PATH = os.path.join(os.path.dirname(__file__), "static", "logo-name.svg")
+LOGO_SCALE = 0.2
 
+
+@lru_cache(maxsize=None)
+def _paragraph_styles() -> Dict[str, ParagraphStyle]:
+    """Custom styles for the text elements, built once per process."""
+    styles = getSampleStyleSheet()
     normal_style = ParagraphStyle(
         name="CustomNormal",
         parent=styles["Normal"],
@@ -119,62 +85,199 @@ def pdf_reporter(
         spaceAfter=6,
         alignment=TA_JUSTIFY,
     )
+    return {
+        "title": ParagraphStyle(
+            name="CustomTitle",
+            parent=styles["Title"],
+            fontSize=28,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Bold",
+        ),
+        "subtitle": ParagraphStyle(
+            name="CustomSubtitle",
+            parent=styles["Normal"],
+            fontSize=16,
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName="Helvetica",
+        ),
+        "header": ParagraphStyle(
+            name="CustomHeader",
+            parent=styles["Heading1"],
+            fontSize=20,
+            spaceBefore=20,
+            spaceAfter=20,
+            fontName="Helvetica-Bold",
+            borderWidth=2,
+            borderColor=HEADER_BORDER,
+            borderPadding=6,
+            backColor=HEADER_BACKGROUND,
+        ),
+        "subheader": ParagraphStyle(
+            name="CustomSubHeader",
+            parent=styles["Heading2"],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=10,
+            fontName="Helvetica-Bold",
+        ),
+        "normal": normal_style,
+        "bold": ParagraphStyle(
+            name="CustomBold",
+            parent=normal_style,
+            fontName="Helvetica-Bold",
+        ),
+    }
 
-    bold_style = ParagraphStyle(
-        name="CustomBold",
-        parent=normal_style,
-        fontName="Helvetica-Bold",
-    )
 
-    # Severity colors mapping
-    severity_colors = {
-        SecurityIssueSeverity.CRITICAL: critical_color,
-        SecurityIssueSeverity.HIGH: danger_color,
-        SecurityIssueSeverity.MEDIUM: warning_color,
-        SecurityIssueSeverity.LOW: success_color,
-        LGPDIssueSeverity.HIGH: danger_color,
-        LGPDIssueSeverity.MEDIUM: warning_color,
-        LGPDIssueSeverity.LOW: success_color,
-    }
+@lru_cache(maxsize=None)
+def _table_style(kind: str, color: Optional[Color] = None) -> TableStyle:
+    """
+    Table styles, built once per kind and header color.
 
-    def scale(drawing: Drawing, scaling_factor):
-        """Scale a reportlab.graphics.shapes.Drawing() object while maintaining aspect ratio."""
+    Tables copy the commands of their style, so one instance can be shared.
+    """
+    if kind == "centered":
+        commands = [
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("VALIGN", (0, 0), (-1, -1), "CENTER"),
+        ]
+    elif kind == "summary":
+        commands = [
+            ("BACKGROUND", (0, 0), (1, 0), ACCENT_COLOR),
+            ("TEXTCOLOR", (0, 0), (1, 0), white),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
+            ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 11),
+            ("GRID", (0, 0), (-1, -1), 1, PRIMARY_COLOR),
+            ("BACKGROUND", (0, 1), (-1, -1), LIGHT_BACKGROUND),
+        ]
+    elif kind == "file_info":
+        commands = [
+            ("BACKGROUND", (0, 0), (-1, -1), LIGHT_BACKGROUND),
+            ("GRID", (0, 0), (-1, -1), 1, PRIMARY_COLOR),
+            ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ]
+    elif kind == "card":
+        commands = [
+            ("BACKGROUND", (0, 0), (1, 0), color),
+            ("TEXTCOLOR", (0, 0), (1, 0), white),
+            ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (1, 0), 12),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 1), (-1, -1), 10),
+            ("GRID", (0, 0), (-1, -1), 1, PRIMARY_COLOR),
+            ("BACKGROUND", (0, 1), (-1, -1), CARD_BACKGROUND),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BACKGROUND]),
+        ]
+    elif kind == "finding":
+        commands = [
+            ("BACKGROUND", (0, 0), (1, 0), SECONDARY_COLOR),
+            ("TEXTCOLOR", (0, 0), (1, 0), white),
+            ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
+            ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
+            ("GRID", (0, 0), (-1, -1), 1, PRIMARY_COLOR),
+            ("BACKGROUND", (0, 1), (-1, -1), LIGHT_BACKGROUND),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("WORDWRAP", (0, 0), (-1, -1), True),
+        ]
+    elif kind == "rule_header":
+        commands = [
+            ("BACKGROUND", (0, 0), (1, 0), color),
+            ("TEXTCOLOR", (0, 0), (1, 0), white),
+            ("SPAN", (0, 0), (1, 0)),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 1, PRIMARY_COLOR),
+            ("BACKGROUND", (0, 1), (-1, -1), CARD_BACKGROUND),
+        ]
+    elif kind == "rows":
+        commands = [
+            ("BACKGROUND", (0, 0), (-1, 0), color),
+            ("TEXTCOLOR", (0, 0), (-1, 0), white),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 8),
+            ("LEADING", (0, 0), (-1, -1), 10),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 0.5, PRIMARY_COLOR),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, LIGHT_BACKGROUND]),
+        ]
+    else:
+        raise ValueError(f"Unknown table style: {kind}")
+    return TableStyle(commands)
 
-        scaling_x = scaling_factor
-        scaling_y = scaling_factor
 
-        drawing.width = drawing.minWidth() * scaling_x
-        drawing.height = drawing.height * scaling_y
+def _scale(drawing: Drawing, scaling_factor: float) -> Drawing:
+    """Scale a reportlab.graphics.shapes.Drawing() object while maintaining aspect ratio."""
+    drawing.width = drawing.minWidth() * scaling_factor
+    drawing.height = drawing.height * scaling_factor
+    drawing.scale(scaling_factor, scaling_factor)
+    return drawing
 
-        drawing.scale(scaling_x, scaling_y)
-        return drawing
 
-    def add_image(image_path, scaling_factor):
-        """Add a centered SVG image file to the Flowable story."""
+@lru_cache(maxsize=None)
+def _logo() -> Optional[Drawing]:
+    """The parsed and scaled logo, or None when it cannot be loaded."""
+    try:
+        drawing = svg2rlg(LOGO_PATH)
+    except Exception:
+        return None
+    if drawing is None:
+        return None
+    return _scale(drawing, LOGO_SCALE)
 
-        try:
-            if os.path.exists(image_path):
-                drawing = svg2rlg(image_path)
 
-                if drawing:
-                    scaled_drawing = scale(drawing, scaling_factor=scaling_factor)
+def _build_pdf(
+    target: Any,
+    swagger_file_path: str,
+    findings: List[Dict[str, Any]],
+    security_issues: Optional[List[SecurityIssue]],
+    lgpd_issues: Optional[List[LGPDIssue]],
+    compact: Optional[bool],
+) -> None:
+    """Lays out the report into `target`, a file name or binary stream."""
+    if compact is None:
+        total = (
+            len(findings or []) + len(security_issues or []) + len(lgpd_issues or [])
+        )
+        compact = total > COMPACT_THRESHOLD
 
-                    # Create a table with the drawing to center it
-                    table = Table([[scaled_drawing]], colWidths=[None])
-                    table.setStyle(
-                        TableStyle(
-                            [
-                                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                                ("VALIGN", (0, 0), (-1, -1), "CENTER"),
-                            ]
-                        )
-                    )
+    # Document setup with custom margins
+    doc = SimpleDocTemplate(
+        target,
+        pagesize=letter,
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+        topMargin=1 * inch,
+        bottomMargin=1 * inch,
+    )
 
-                    story.append(table)
-                    story.append(Spacer(1, 0.5 * inch))
+    styles = _paragraph_styles()
+    title_style = styles["title"]
+    subtitle_style = styles["subtitle"]
+    header_style = styles["header"]
+    subheader_style = styles["subheader"]
+    normal_style = styles["normal"]
+    bold_style = styles["bold"]
+    story = []
 
-        except Exception:
-            story.append("")
+    def add_logo():
+        """Add the centered logo to the Flowable story."""
+        logo = _logo()
+        if logo is not None:
+            # Flowables keep layout state, so only the drawing is shared
+            table = Table([[logo]], colWidths=[None])
+            table.setStyle(_table_style("centered"))
+            story.append(table)
+            story.append(Spacer(1, 0.5 * inch))
 
     def create_summary_table():
         """Create a summary statistics table"""
@@ -209,26 +312,13 @@ def pdf_reporter(
         ]
 
         summary_table = Table(summary_data, colWidths=[3 * inch, 1.5 * inch])
-        summary_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (1, 0), accent_color),
-                    ("TEXTCOLOR", (0, 0), (1, 0), white),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
-                    ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 11),
-                    ("GRID", (0, 0), (-1, -1), 1, primary_color),
-                    ("BACKGROUND", (0, 1), (-1, -1), HexColor("#F8F9FA")),
-                ]
-            )
-        )
+        summary_table.setStyle(_table_style("summary"))
 
         return summary_table
 
     def create_issue_card(issue, issue_type="Security"):
         """Create a professional card for each issue"""
-        severity_color = severity_colors.get(issue.severity, primary_color)
+        severity_color = SEVERITY_COLORS.get(issue.severity, PRIMARY_COLOR)
 
         # Create issue data for table
         issue_data = [
@@ -262,28 +352,94 @@ def pdf_reporter(
             )
 
         issue_table = Table(issue_data, colWidths=[1.5 * inch, 5 * inch])
-        issue_table.setStyle(
-            TableStyle(
+        issue_table.setStyle(_table_style("card", severity_color))
+
+        return KeepTogether([issue_table, Spacer(1, 0.3 * inch)])
+
+    def create_rows_tables(header, rows, col_widths, header_color):
+        """Create long tables that split across pages, repeating their header"""
+        rows_style = _table_style("rows", header_color)
+        # Each page split measures the remaining rows again, so one huge
+        # table lays out in quadratic time; bounded tables keep it linear
+        tables = []
+        for start in range(0, len(rows), COMPACT_ROWS_PER_TABLE):
+            rows_table = Table(
+                [header] + rows[start : start + COMPACT_ROWS_PER_TABLE],
+                colWidths=col_widths,
+                repeatRows=1,
+                splitByRow=1,
+            )
+            rows_table.setStyle(rows_style)
+            tables.append(rows_table)
+        return tables
+
+    def create_rule_group(rule_issues, issue_type="Security"):
+        """Create one shared header per rule, followed by a row per affected path"""
+        first = rule_issues[0]
+        severity_color = SEVERITY_COLORS.get(first.severity, PRIMARY_COLOR)
+
+        header_data = [
+            [
+                Paragraph(
+                    f"{issue_type} Issue: {first.rule_id} ({len(rule_issues)})",
+                    bold_style,
+                ),
+                "",
+            ],
+            [
+                Paragraph("Severity", bold_style),
+                Paragraph(
+                    f'<font color="{severity_color}"><b>{first.severity.value.upper()}</b></font>',
+                    bold_style,
+                ),
+            ],
+            [Paragraph("Title", bold_style), Paragraph(first.title, bold_style)],
+            [
+                Paragraph("Recommendation", bold_style),
+                Paragraph(first.recommendation, normal_style),
+            ],
+        ]
+        if getattr(first, "reference", None):
+            header_data.append(
                 [
-                    ("BACKGROUND", (0, 0), (1, 0), severity_color),
-                    ("TEXTCOLOR", (0, 0), (1, 0), white),
-                    ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (1, 0), 12),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 10),
-                    ("GRID", (0, 0), (-1, -1), 1, primary_color),
-                    ("BACKGROUND", (0, 1), (-1, -1), HexColor("#FDFDFE")),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [white, HexColor("#F8F9FA")]),
+                    Paragraph("Reference", bold_style),
+                    Paragraph(first.reference, normal_style),
                 ]
             )
-        )
 
-        return KeepTogether([issue_table, Spacer(1, 0.3 * inch)])
+        header_table = Table(header_data, colWidths=[1.5 * inch, 5 * inch])
+        header_table.setStyle(_table_style("rule_header", severity_color))
+
+        rows = [
+            [
+                str(i),
+                _wrap(issue.path, COMPACT_PATH_WIDTH),
+                _wrap(issue.description, COMPACT_DESCRIPTION_WIDTH),
+            ]
+            for i, issue in enumerate(rule_issues, 1)
+        ]
+        return [
+            KeepTogether([header_table]),
+            *create_rows_tables(
+                ["#", "Path", "Description"],
+                rows,
+                [0.5 * inch, 2.9 * inch, 3.1 * inch],
+                SECONDARY_COLOR,
+            ),
+            Spacer(1, 0.3 * inch),
+        ]
+
+    def add_issues(issues, issue_type):
+        """Add issues as cards, or grouped by rule in compact mode"""
+        if not compact:
+            for issue in issues:
+                story.append(create_issue_card(issue, issue_type))
+            return
+        for rule_issues in _group_by(issues, lambda issue: issue.rule_id).values():
+            story.extend(create_rule_group(rule_issues, issue_type))
 
     # --- Title Page ---
-    add_image("static/logo-name.svg", 0.2)
+    add_logo()
 
     story.append(Paragraph("API Security & Compliance Report", title_style))
     story.append(Spacer(1, 0.2 * inch))
@@ -299,24 +455,14 @@ def pdf_reporter(
 
     # File info table
     file_info_data = [
-        ["Analyzed File", os.path.basename(swagger_file_path)],
-        ["Full Path", swagger_file_path],
+        ["Analyzed File", os.path.basename(swagger_file_path) or "N/A"],
+        ["Full Path", swagger_file_path or "N/A"],
         ["Analysis Date", now.strftime("%Y-%m-%d")],
         ["Generated By", "Lokus Security & Compliance Analyzer"],
     ]
 
     file_info_table = Table(file_info_data, colWidths=[2 * inch, 4 * inch])
-    file_info_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, -1), HexColor("#F8F9FA")),
-                ("GRID", (0, 0), (-1, -1), 1, primary_color),
-                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 10),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ]
-        )
-    )
+    file_info_table.setStyle(_table_style("file_info"))
 
     story.append(file_info_table)
     story.append(Spacer(1, 0.5 * inch))
@@ -328,7 +474,32 @@ def pdf_reporter(
 
     # --- General Findings Section ---
     story.append(Paragraph("General Findings", header_style))
-    if findings:
+    if findings and compact:
+        story.append(Paragraph("Detailed Analysis Results", subheader_style))
+        for finding_type, typed_findings in _group_by(
+            findings, lambda finding: finding.get("type", "N/A")
+        ).items():
+            story.append(
+                Paragraph(f"{finding_type} ({len(typed_findings)})", bold_style)
+            )
+            rows = [
+                [
+                    str(i),
+                    _wrap(finding.get("path", "N/A"), COMPACT_PATH_WIDTH),
+                    _wrap(finding.get("message", "N/A"), COMPACT_DESCRIPTION_WIDTH),
+                ]
+                for i, finding in enumerate(typed_findings, 1)
+            ]
+            story.extend(
+                create_rows_tables(
+                    ["#", "Path", "Description"],
+                    rows,
+                    [0.5 * inch, 2.9 * inch, 3.1 * inch],
+                    SECONDARY_COLOR,
+                )
+            )
+            story.append(Spacer(1, 0.3 * inch))
+    elif findings:
         story.append(Paragraph("Detailed Analysis Results", subheader_style))
         for i, finding in enumerate(findings):
             finding_data = [
@@ -344,21 +515,7 @@ def pdf_reporter(
             ]
 
             finding_table = Table(finding_data, colWidths=[1.5 * inch, 5 * inch])
-            finding_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (1, 0), secondary_color),
-                        ("TEXTCOLOR", (0, 0), (1, 0), white),
-                        ("FONTNAME", (0, 0), (1, 0), "Helvetica-Bold"),
-                        ("FONTNAME", (0, 1), (0, -1), "Helvetica-Bold"),
-                        ("GRID", (0, 0), (-1, -1), 1, primary_color),
-                        ("BACKGROUND", (0, 1), (-1, -1), HexColor("#F8F9FA")),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("WORDWRAP", (0, 0), (-1, -1), True),
-                    ]
-                )
-            )
+            finding_table.setStyle(_table_style("finding"))
 
             story.append(finding_table)
             story.append(Spacer(1, 0.2 * inch))
@@ -371,8 +528,7 @@ def pdf_reporter(
     # --- Security Issues Section ---
     story.append(Paragraph("Security Issues", header_style))
     if security_issues:
-        for issue in security_issues:
-            story.append(create_issue_card(issue, "Security"))
+        add_issues(security_issues, "Security")
     else:
         story.append(Paragraph("✅ No security issues identified.", normal_style))
         story.append(Spacer(1, 0.2 * inch))
@@ -382,21 +538,100 @@ def pdf_reporter(
     # --- LGPD Issues Section ---
     story.append(Paragraph("LGPD Compliance Issues", header_style))
     if lgpd_issues:
-        for issue in lgpd_issues:
-            story.append(create_issue_card(issue, "LGPD"))
+        add_issues(lgpd_issues, "LGPD")
     else:
         story.append(
             Paragraph("✅ No LGPD compliance issues identified.", normal_style)
         )
         story.append(Spacer(1, 0.2 * inch))
 
-    # --- Build ththe resized SVG on the PDF at position e PDF ---
+    doc.build(story)
+
+
+def write_pdf(
+    result: ScanResult,
+    stream: BinaryIO,
+    swagger_file_path: str = "",
+    compact: Optional[bool] = None,
+) -> None:
+    """
+    Writes the PDF report of a scan result to a binary stream.
+
+    Args:
+        result (ScanResult): The scan result to report.
+        stream (BinaryIO): Any writable binary stream: a file, a socket
+            wrapper, an upload buffer.
+        swagger_file_path (str): Path of the analyzed spec, shown on the
+            title page.
+        compact (Optional[bool]): See pdf_reporter.
+
+    Raises:
+        Exception: Whatever reportlab raises when layout fails.
+    """
+    _build_pdf(
+        stream,
+        swagger_file_path,
+        result.findings,
+        result.security_issues,
+        result.lgpd_issues,
+        compact,
+    )
+
+
+def render_pdf(
+    result: ScanResult,
+    swagger_file_path: str = "",
+    compact: Optional[bool] = None,
+) -> bytes:
+    """Returns the PDF report of a scan result, without touching the disk."""
+    buffer = io.BytesIO()
+    write_pdf(result, buffer, swagger_file_path, compact)
+    return buffer.getvalue()
+
+
+def pdf_reporter(
+    swagger_file_path: str,
+    findings: List[Dict[str, Any]],
+    security_issues: Optional[List[SecurityIssue]] = None,
+    lgpd_issues: Optional[List[LGPDIssue]] = None,
+    compact: Optional[bool] = None,
+    output_path: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Generates a PDF report based on provided security and LGPD issues,
+    and general findings.
+
+    Args:
+        swagger_file_path (str): Path to the analyzed Swagger file.
+        findings (List[Dict[str, Any]]): A list of general findings.
+        security_issues (Optional[List[SecurityIssue]]): A list of security issues.
+        lgpd_issues (Optional[List[LGPDIssue]]): A list of LGPD issues.
+        compact (Optional[bool]): Group entries by rule, one table row per
+            path, instead of one card per entry. By default, used when there
+            are more than COMPACT_THRESHOLD entries.
+        output_path (Optional[str]): Where to write the report. Defaults to
+            lokus_report-<timestamp>.pdf in the current directory.
+
+    Returns:
+        Optional[str]: The path of the written report, or None on failure.
+    """
+    output_filename = (
+        output_path or f"lokus_report-{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    )
+    result = ScanResult(
+        findings=findings or [],
+        security_issues=security_issues or [],
+        lgpd_issues=lgpd_issues or [],
+    )
     try:
-        doc.build(story)
+        with open(output_filename, "wb") as stream:
+            write_pdf(result, stream, swagger_file_path, compact)
         print(f"✅ PDF report '{output_filename}' generated successfully!")
         print(f"📄 Report saved to: {os.path.abspath(output_filename)}")
+        return output_filename
     except Exception as e:
         print(f"❌ Error generating PDF: {e}")
         import traceback
 
         traceback.print_exc()
+        return None
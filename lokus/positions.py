@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+# 1-based (line, column) of an entry in its source document
+Position = Tuple[int, int]
+
+# Report sections whose entries carry a "path"
+REPORT_SECTIONS = ("findings", "security_issues", "lgpd_issues")
+
+
+class PositionIndex:
+    """
+    Maps report paths ("paths./users.get", "tags[0].name") to source positions.
+
+    Nothing is done until the first lookup: the document is then composed
+    once into YAML nodes, which keep their marks, and each mapping gets a
+    key table when a path first goes through it. Runs without findings
+    never pay for it.
+    """
+
+    def __init__(self, content: Any = None, file_path: Optional[str] = None):
+        # Either the document content, or a file read on the first lookup
+        self.content = content
+        self.file_path = file_path
+        self._root: Optional[yaml.Node] = None
+        self._composed = False
+        self._keys: Dict[int, Dict[str, Tuple[yaml.Node, yaml.Node]]] = {}
+        self._positions: Dict[str, Optional[Position]] = {}
+
+    def _compose(self) -> Optional[yaml.Node]:
+        if not self._composed:
+            self._composed = True
+            try:
+                if self.content is None and self.file_path is not None:
+                    with open(self.file_path, "r", encoding="utf-8") as f:
+                        self.content = f.read()
+                self._root = yaml.compose(self.content, Loader=yaml.SafeLoader)
+            except (OSError, ValueError, yaml.YAMLError):
+                # Positions are best effort; the scan itself already succeeded
+                self._root = None
+        return self._root
+
+    def _key_table(
+        self, node: yaml.MappingNode
+    ) -> Dict[str, Tuple[yaml.Node, yaml.Node]]:
+        table = self._keys.get(id(node))
+        if table is None:
+            table = {}
+            for key_node, value_node in node.value:
+                if isinstance(key_node, yaml.ScalarNode):
+                    table.setdefault(key_node.value, (key_node, value_node))
+            self._keys[id(node)] = table
+        return table
+
+    def _step(
+        self, node: yaml.Node, rest: str
+    ) -> Optional[Tuple[yaml.Node, yaml.Node, str]]:
+        """Consumes one path segment; returns (marked node, child node, rest)."""
+        if rest.startswith("[") and isinstance(node, yaml.SequenceNode):
+            end = rest.find("]")
+            try:
+                item = node.value[int(rest[1:end])]
+            except (ValueError, IndexError):
+                return None
+            return item, item, rest[end + 1 :].lstrip(".")
+        if not isinstance(node, yaml.MappingNode):
+            return None
+        # Keys may contain dots ("/v1.0/users"); prefer the longest one that fits
+        table = self._key_table(node)
+        cuts = [i for i, char in enumerate(rest) if char in ".["] + [len(rest)]
+        for cut in reversed(cuts):
+            entry = table.get(rest[:cut])
+            if entry is not None:
+                key_node, value_node = entry
+                return key_node, value_node, rest[cut:].lstrip(".")
+        return None
+
+    def locate(self, path: Optional[str]) -> Optional[Position]:
+        """
+        Returns the position of a report path, or of its deepest part found.
+
+        Mapping entries point at their key; list items at the item.
+        """
+        if not path:
+            return None
+        if path in self._positions:
+            return self._positions[path]
+        node = self._compose()
+        marked = None
+        rest = path.lstrip(".")
+        while node is not None and rest:
+            step = self._step(node, rest)
+            if step is None:
+                break
+            marked, node, rest = step
+        position = None
+        if marked is not None:
+            position = (marked.start_mark.line + 1, marked.start_mark.column + 1)
+        self._positions[path] = position
+        return position
+
+    def annotate(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Adds "line" and "column" to the entries of a JSON report, in place."""
+        for section in REPORT_SECTIONS:
+            entries: List[Dict[str, Any]] = report.get(section) or []
+            for entry in entries:
+                position = self.locate(entry.get("path"))
+                if position is not None:
+                    entry["line"], entry["column"] = position
+        return report
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# Color scheme shared by the PDF and HTML reports, as hex strings so
+# reporters that do not use reportlab need not load it
+
+PRIMARY = "#9000a5"  # Deep purple for primary elements
+SECONDARY = "#5a007a"  # Darker purple for secondary elements
+HEADER_BACKGROUND = "#B594B6"  # Light purple for header background
+ACCENT = "#3498db"  # Bright blue for accents and highlights
+LIGHT_BACKGROUND = "#F8F9FA"
+
+# Severity issue colors, by severity value (shared by security and LGPD issues)
+SEVERITY = {
+    "CRITICAL": "#e74c3c",  # Red for critical severity
+    "HIGH": "#e67e22",  # Orange for high severity or danger
+    "MEDIUM": "#f39c12",  # Yellow for medium severity or warning
+    "LOW": "#2ecc71",  # Green for low severity or success
+}
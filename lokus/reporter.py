@@ -2,10 +2,53 @@
 import json
 from typing import Any, Dict, List, Optional
 
+from lokus.baseline import finding_fingerprint
 from lokus.lgpd_validator import LGPDIssue
+from lokus.positions import PositionIndex
+from lokus.scanner import LIMIT_EXCEEDED_STATUS, ScanResult, issue_to_dict
 from lokus.security_validator import SecurityIssue
 
 
+def build_json_report(
+    findings: List[Dict[str, Any]],
+    swagger_file_path: str,
+    config_file_path: str,
+    security_issues: Optional[List[SecurityIssue]] = None,
+    lgpd_issues: Optional[List[LGPDIssue]] = None,
+    suppressed_count: int = 0,
+    resolved_issues: Optional[List[Dict[str, Any]]] = None,
+    limits_exceeded: Optional[List[str]] = None,
+    positions: Optional[PositionIndex] = None,
+) -> Dict[str, Any]:
+    """Builds the JSON report of one specification (see report_findings)."""
+    output = {
+        "swagger_file": swagger_file_path,
+        "config_file": config_file_path,
+        "findings": [
+            {**finding, "fingerprint": finding_fingerprint(finding)}
+            for finding in findings
+        ],
+        "security_issues": [issue_to_dict(issue) for issue in (security_issues or [])],
+        "lgpd_issues": [issue_to_dict(issue) for issue in (lgpd_issues or [])],
+        "suppressed_issues": suppressed_count,
+    }
+    if resolved_issues is not None:
+        output["resolved_issues"] = resolved_issues
+    if limits_exceeded:
+        output["status"] = LIMIT_EXCEEDED_STATUS
+        output["limits_exceeded"] = limits_exceeded
+    if positions is not None:
+        positions.annotate(output)
+    return output
+
+
+def _path_label(path: Any, positions: Optional[PositionIndex]) -> str:
+    position = positions.locate(path) if positions is not None else None
+    if position is None:
+        return str(path)
+    return f"{path} (line {position[0]}, column {position[1]})"
+
+
 def report_findings(
     findings: List[Dict[str, Any]],
     swagger_file_path: str,
@@ -14,6 +57,10 @@ def report_findings(
     verbose: bool = False,
     security_issues: Optional[List[SecurityIssue]] = None,
     lgpd_issues: Optional[List[LGPDIssue]] = None,
+    suppressed_count: int = 0,
+    resolved_issues: Optional[List[Dict[str, Any]]] = None,
+    limits_exceeded: Optional[List[str]] = None,
+    positions: Optional[PositionIndex] = None,
 ) -> int:
     """
     Reports the findings from the validation process.
@@ -26,52 +73,50 @@ def report_findings(
         verbose: Whether to include verbose output.
         security_issues: Optional list of security issues.
         lgpd_issues: Optional list of LGPD compliance issues.
+        suppressed_count: Number of known findings suppressed by a baseline.
+        resolved_issues: Optional summaries of issues fixed since a previous
+            spec version (diff mode).
+        limits_exceeded: Guardrails the scan ran into; its results are
+            partial when given.
+        positions: Optional index of the specification source; adds the
+            line and column of each entry.
 
     Returns:
-        int: Exit code (0 for success, 1 for issues found, 2 for errors).
+        int: Exit code (0 for success, 1 for issues found, 2 for errors,
+        including partial results).
     """
 
     has_issues = bool(findings or security_issues or lgpd_issues)
 
     if output_json:
         # JSON output format
-        output = {
-            "swagger_file": swagger_file_path,
-            "config_file": config_file_path,
-            "findings": findings,
-            "security_issues": [
-                {
-                    "rule_id": issue.rule_id,
-                    "title": issue.title,
-                    "description": issue.description,
-                    "severity": issue.severity.value,
-                    "path": issue.path,
-                    "recommendation": issue.recommendation,
-                    "reference": issue.reference,
-                }
-                for issue in (security_issues or [])
-            ],
-            "lgpd_issues": [
-                {
-                    "rule_id": issue.rule_id,
-                    "title": issue.title,
-                    "description": issue.description,
-                    "severity": issue.severity.value,
-                    "path": issue.path,
-                    "recommendation": issue.recommendation,
-                    "reference": issue.reference,
-                }
-                for issue in (lgpd_issues or [])
-            ],
-        }
+        output = build_json_report(
+            findings,
+            swagger_file_path,
+            config_file_path,
+            security_issues=security_issues,
+            lgpd_issues=lgpd_issues,
+            suppressed_count=suppressed_count,
+            resolved_issues=resolved_issues,
+            limits_exceeded=limits_exceeded,
+            positions=positions,
+        )
         print(json.dumps(output))
     else:  # Default to text format
         print("Swagger/OpenAPI Specification Validator")
         print("--------------------------------------")
         print(f"Specification File: {swagger_file_path}")
         print(f"Configuration File: {config_file_path}")
+        if suppressed_count:
+            print(f"Suppressed by baseline: {suppressed_count}")
         print("")
 
+        if limits_exceeded:
+            print("STATUS: LIMIT EXCEEDED - results below are partial")
+            for message in limits_exceeded:
+                print(f"  {message}")
+            print("")
+
         if has_issues:
             print("STATUS: VALIDATION FAILED")
 
@@ -79,7 +124,7 @@ def report_findings(
                 print(f"\nForbidden Items Found: {len(findings)}")
                 print("--------------------------------------")
                 for i, finding in enumerate(findings, 1):
-                    print(f"  {i}. Path: {finding.get('path')}")
+                    print(f"  {i}. Path: {_path_label(finding.get('path'), positions)}")
                     print(f"     Key: {finding.get('key')}")
                     print(f"     Type: {finding.get('type')}")
                     print(f"     Reason: {finding.get('message')}")
@@ -92,7 +137,7 @@ def report_findings(
                 for i, issue in enumerate(security_issues, 1):
                     print(f"  {i}. [{issue.severity.value}] {issue.title}")
                     print(f"     Rule ID: {issue.rule_id}")
-                    print(f"     Path: {issue.path}")
+                    print(f"     Path: {_path_label(issue.path, positions)}")
                     print(f"     Description: {issue.description}")
                     print(f"     Recommendation: {issue.recommendation}")
                     print(f"     Reference: {issue.reference}")
@@ -105,7 +150,7 @@ def report_findings(
                 for i, issue in enumerate(lgpd_issues, 1):
                     print(f"  {i}. [{issue.severity.value}] {issue.title}")
                     print(f"     Rule ID: {issue.rule_id}")
-                    print(f"     Path: {issue.path}")
+                    print(f"     Path: {_path_label(issue.path, positions)}")
                     print(f"     Description: {issue.description}")
                     print(f"     Recommendation: {issue.recommendation}")
                     print(f"     Reference: {issue.reference}")
@@ -118,13 +163,132 @@ def report_findings(
         else:
             print("STATUS: VALIDATION PASSED - No issues found.")
 
+        if resolved_issues:
+            print(f"\nResolved Issues: {len(resolved_issues)}")
+            print("--------------------------------------")
+            for i, issue in enumerate(resolved_issues, 1):
+                print(f"  {i}. [{issue['rule_id']}] {issue['path']}")
+                print(f"     Description: {issue['description']}")
+
     # Set exit status
+    if limits_exceeded:
+        return 2  # Partial results
     if has_issues:
         return 1  # Issues found
     else:
         return 0  # All clear
 
 
+def report_batch(
+    results: Dict[str, ScanResult],
+    config_file_path: str,
+    output_json: bool = False,
+    verbose: bool = False,
+    with_positions: bool = False,
+) -> int:
+    """
+    Reports the results of several specifications as one combined report.
+
+    Args:
+        results: Scan result per specification path, in report order.
+        config_file_path: Path to the configuration file.
+        output_json: Format of the output to JSON.
+        verbose: Whether to include verbose output.
+        with_positions: Add the line and column of each entry, read from
+            the specification files.
+
+    Returns:
+        int: Exit code (0 for success, 1 for issues found, 2 for partial
+        results).
+    """
+    has_issues = any(result.has_issues for result in results.values())
+
+    if output_json:
+        output = {
+            "config_file": config_file_path,
+            "reports": [
+                build_json_report(
+                    result.findings,
+                    swagger_file_path,
+                    config_file_path,
+                    security_issues=result.security_issues,
+                    lgpd_issues=result.lgpd_issues,
+                    suppressed_count=result.suppressed_count,
+                    limits_exceeded=result.limits_exceeded,
+                    positions=(
+                        PositionIndex(file_path=swagger_file_path)
+                        if with_positions
+                        else None
+                    ),
+                )
+                for swagger_file_path, result in results.items()
+            ],
+        }
+        print(json.dumps(output))
+    else:
+        for swagger_file_path, result in results.items():
+            report_findings(
+                result.findings,
+                swagger_file_path,
+                config_file_path,
+                verbose=verbose,
+                security_issues=result.security_issues,
+                lgpd_issues=result.lgpd_issues,
+                suppressed_count=result.suppressed_count,
+                limits_exceeded=result.limits_exceeded,
+                positions=(
+                    PositionIndex(file_path=swagger_file_path)
+                    if with_positions
+                    else None
+                ),
+            )
+            print("")
+        failed = sum(1 for result in results.values() if result.has_issues)
+        print("======================================")
+        print(
+            f"Combined: {len(results)} specification(s) validated, {failed} with issues."
+        )
+
+    if any(result.limits_exceeded for result in results.values()):
+        return 2
+    return 1 if has_issues else 0
+
+
+def report_compact(results: Dict[str, ScanResult]) -> int:
+    """
+    Reports several specifications one line per issue, as
+    `file:line:column: [RULE] path: description`.
+
+    Specifications without issues print nothing, so a clean run is silent;
+    positions are only looked up in files that have issues.
+
+    Returns:
+        int: Exit code (0 for success, 1 for issues found, 2 for partial
+        results).
+    """
+    has_issues = False
+    partial = False
+    for swagger_file_path, result in results.items():
+        for message in result.limits_exceeded:
+            partial = True
+            print(f"{swagger_file_path}: {message}")
+        positions = PositionIndex(file_path=swagger_file_path)
+        for summary in result.summaries():
+            has_issues = True
+            position = positions.locate(summary["path"])
+            location = (
+                f"{swagger_file_path}:{position[0]}:{position[1]}"
+                if position
+                else swagger_file_path
+            )
+            print(
+                f"{location}: [{summary['rule_id']}] {summary['path']}: {summary['description']}"
+            )
+    if partial:
+        return 2
+    return 1 if has_issues else 0
+
+
 # Note: sys.exit() will be called in the main script based on the return value of this function
 # and other potential errors (like file not found, parse errors) that occur before this stage.
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def _split_selectors(values: Optional[Iterable[str]]) -> List[str]:
+    """Flattens repeated and comma-separated selectors into a clean list."""
+    selectors = []
+    for value in values or []:
+        for part in str(value).split(","):
+            part = part.strip()
+            if part:
+                selectors.append(part)
+    return selectors
+
+
+@dataclass
+class RuleSelection:
+    """
+    Decides which rules run before any scanning happens.
+
+    Selectors are rule IDs ('LGPD-005'), glob families ('BOLA-*') or
+    validator names ('deep_search', 'security', 'lgpd'), compared
+    case-insensitively. An empty `only` list enables everything; `skip`
+    always wins over `only`.
+    """
+
+    only: List[str] = field(default_factory=list)
+    skip: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_options(
+        cls,
+        config_data: Optional[Dict[str, Any]] = None,
+        only: Optional[Iterable[str]] = None,
+        skip: Optional[Iterable[str]] = None,
+    ) -> "RuleSelection":
+        """
+        Builds a selection from the config file `rules` section and CLI options.
+
+        CLI `only` selectors replace the ones from the config file, while
+        `skip` selectors from both sources are combined.
+        """
+        rules_config = (config_data or {}).get("rules") or {}
+        config_only = _split_selectors(rules_config.get("only"))
+        config_skip = _split_selectors(rules_config.get("skip"))
+        cli_only = _split_selectors(only)
+        return cls(
+            only=cli_only or config_only,
+            skip=config_skip + _split_selectors(skip),
+        )
+
+    @staticmethod
+    def _matches(selector: str, rule_id: str, validator: str) -> bool:
+        selector = selector.lower()
+        return selector == validator.lower() or fnmatchcase(rule_id.lower(), selector)
+
+    def is_enabled(self, rule_id: str, validator: str) -> bool:
+        """Returns whether a single rule of the given validator should run."""
+        if self.only and not any(
+            self._matches(selector, rule_id, validator) for selector in self.only
+        ):
+            return False
+        return not any(
+            self._matches(selector, rule_id, validator) for selector in self.skip
+        )
+
+    def enabled_rules(self, validator: str, rule_ids: Iterable[str]) -> List[str]:
+        return [rule_id for rule_id in rule_ids if self.is_enabled(rule_id, validator)]
+
+    def validator_enabled(self, validator: str, rule_ids: Iterable[str]) -> bool:
+        """A validator runs only if at least one of its rules is enabled."""
+        return any(self.is_enabled(rule_id, validator) for rule_id in rule_ids)
+
+    def unmatched(self, known_rules: Dict[str, Iterable[str]]) -> List[str]:
+        """Lists selectors that match no known rule or validator (likely typos)."""
+        unmatched = []
+        for selector in self.only + self.skip:
+            if not any(
+                self._matches(selector, rule_id, validator)
+                for validator, rule_ids in known_rules.items()
+                for rule_id in rule_ids
+            ):
+                unmatched.append(selector)
+        return unmatched
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from lokus.baseline import FindingFilter, finding_fingerprint, issue_fingerprint
+from lokus.deep_search import (
+    DEEP_SEARCH_RULES,
+    DeepSearchRules,
+    deep_search_forbidden_keys,
+)
+from lokus.lgpd_validator import LGPDIssue, LGPDIssueSeverity, LGPDValidator
+from lokus.limits import ScanBudget, ScanLimits
+from lokus.metrics import RunMetrics, timed_phase
+from lokus.rules import RuleSelection
+from lokus.security_validator import (
+    SecurityIssue,
+    SecurityIssueSeverity,
+    SecurityValidator,
+)
+
+# Report status of a result cut short by a guardrail
+LIMIT_EXCEEDED_STATUS = "limit_exceeded"
+
+
+def issue_to_dict(issue: Any) -> Dict[str, Any]:
+    """Serializes a SecurityIssue or LGPDIssue to the JSON report shape."""
+    output = {
+        "rule_id": issue.rule_id,
+        "title": issue.title,
+        "description": issue.description,
+        "severity": issue.severity.value,
+        "path": issue.path,
+        "recommendation": issue.recommendation,
+        "reference": issue.reference,
+        "fingerprint": issue_fingerprint(issue),
+    }
+    if getattr(issue, "key", ""):
+        output["key"] = issue.key
+    return output
+
+
+def _issue_from_dict(data: Dict[str, Any], issue_type: Any, severity_type: Any) -> Any:
+    extra = {"key": data["key"]} if data.get("key") else {}
+    return issue_type(
+        rule_id=data["rule_id"],
+        title=data["title"],
+        description=data["description"],
+        severity=severity_type(data["severity"]),
+        path=data["path"],
+        recommendation=data["recommendation"],
+        reference=data.get("reference"),
+        **extra,
+    )
+
+
+@dataclass
+class ScanResult:
+    """Everything found in one spec by deep search and the validators."""
+
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    security_issues: List[SecurityIssue] = field(default_factory=list)
+    lgpd_issues: List[LGPDIssue] = field(default_factory=list)
+    suppressed_count: int = 0
+    # Guardrails hit while scanning; the result is partial when not empty
+    limits_exceeded: List[str] = field(default_factory=list)
+
+    @property
+    def has_issues(self) -> bool:
+        return bool(self.findings or self.security_issues or self.lgpd_issues)
+
+    def fingerprints(self) -> Set[str]:
+        return {finding_fingerprint(finding) for finding in self.findings} | {
+            issue_fingerprint(issue)
+            for issue in self.security_issues + self.lgpd_issues
+        }
+
+    def excluding(self, fingerprints: Set[str]) -> "ScanResult":
+        """Returns a copy without the entries whose fingerprint is in the set."""
+        return ScanResult(
+            findings=[
+                finding
+                for finding in self.findings
+                if finding_fingerprint(finding) not in fingerprints
+            ],
+            security_issues=[
+                issue
+                for issue in self.security_issues
+                if issue_fingerprint(issue) not in fingerprints
+            ],
+            lgpd_issues=[
+                issue
+                for issue in self.lgpd_issues
+                if issue_fingerprint(issue) not in fingerprints
+            ],
+            suppressed_count=self.suppressed_count,
+            limits_exceeded=list(self.limits_exceeded),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        output = {
+            "findings": [
+                {**finding, "fingerprint": finding_fingerprint(finding)}
+                for finding in self.findings
+            ],
+            "security_issues": [issue_to_dict(issue) for issue in self.security_issues],
+            "lgpd_issues": [issue_to_dict(issue) for issue in self.lgpd_issues],
+            "suppressed_issues": self.suppressed_count,
+        }
+        if self.limits_exceeded:
+            output["status"] = LIMIT_EXCEEDED_STATUS
+            output["limits_exceeded"] = list(self.limits_exceeded)
+        return output
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanResult":
+        """Rebuilds a result from to_dict() output (or a single-spec JSON report)."""
+        return cls(
+            findings=[
+                {key: value for key, value in finding.items() if key != "fingerprint"}
+                for finding in data.get("findings", [])
+            ],
+            security_issues=[
+                _issue_from_dict(issue, SecurityIssue, SecurityIssueSeverity)
+                for issue in data.get("security_issues", [])
+            ],
+            lgpd_issues=[
+                _issue_from_dict(issue, LGPDIssue, LGPDIssueSeverity)
+                for issue in data.get("lgpd_issues", [])
+            ],
+            suppressed_count=data.get("suppressed_issues", 0),
+            limits_exceeded=list(data.get("limits_exceeded", [])),
+        )
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """Flattens every entry to rule ID, path, description and fingerprint."""
+        summaries = [
+            {
+                "rule_id": finding.get("type"),
+                "path": finding.get("path"),
+                "description": finding.get("message"),
+                "fingerprint": finding_fingerprint(finding),
+            }
+            for finding in self.findings
+        ]
+        summaries.extend(
+            {
+                "rule_id": issue.rule_id,
+                "path": issue.path,
+                "description": issue.title,
+                "fingerprint": issue_fingerprint(issue),
+            }
+            for issue in self.security_issues + self.lgpd_issues
+        )
+        return summaries
+
+
+def run_scan(
+    spec_data: Dict[str, Any],
+    config_data: Dict[str, Any],
+    selection: Optional[RuleSelection] = None,
+    finding_filter: Optional[FindingFilter] = None,
+    verbose: bool = False,
+    deep_search_rules: Optional[DeepSearchRules] = None,
+    security_validator: Optional[SecurityValidator] = None,
+    lgpd_validator: Optional[LGPDValidator] = None,
+    limits: Optional[ScanLimits] = None,
+    metrics: Optional[RunMetrics] = None,
+) -> ScanResult:
+    """
+    Runs deep search and the enabled validators over a loaded spec.
+
+    Validators with no enabled rule are not instantiated, so they never
+    traverse the spec. Pass `deep_search_rules` and validator instances
+    built once to reuse them across scans; validators are stateless, so
+    they can be shared by concurrent scans. The time budgets of `limits`
+    cut rules short; what they found so far is kept and the result lists
+    the exceeded limits. With `metrics`, phase and rule times, traversed
+    nodes and reported entries are added to it.
+    """
+    selection = selection or RuleSelection()
+    finding_filter = finding_filter or FindingFilter()
+    suppressed_before = finding_filter.suppressed
+    result = ScanResult()
+    # Budgets are only tracked when timed or measured, so plain scans pay nothing
+    budget = None
+    if metrics is not None or (limits is not None and limits.timed):
+        budget = ScanBudget(limits, metrics)
+    started = time.perf_counter()
+
+    # Deep search for forbidden keys
+
+    if selection.validator_enabled("deep_search", DEEP_SEARCH_RULES) and (
+        budget is None or budget.start_rule("deep_search")
+    ):
+        if verbose:
+            print("Starting deep search for forbidden keys...")
+        with timed_phase(metrics, "deep_search"):
+            result.findings = deep_search_forbidden_keys(
+                spec_data,
+                "",
+                config_data,
+                verbose,
+                selection=selection,
+                finding_filter=finding_filter,
+                rules=deep_search_rules,
+                budget=budget,
+                metrics=metrics,
+            )
+        if verbose:
+            print(f"Deep search completed. Found {len(result.findings)} item(s).")
+    elif verbose:
+        print("Deep search disabled by rule selection.")
+
+    # Security validation
+
+    if selection.validator_enabled(SecurityValidator.name, SecurityValidator.RULES):
+        if verbose:
+            print("Starting security validation...")
+        if security_validator is None:
+            security_validator = SecurityValidator(selection, finding_filter)
+        with timed_phase(metrics, "security"):
+            result.security_issues = security_validator.validate_spec(
+                spec_data, finding_filter, budget
+            )
+        if verbose:
+            print(
+                f"Security validation completed. Found {len(result.security_issues)} issue(s)."
+            )
+    elif verbose:
+        print("Security validation disabled by rule selection.")
+
+    # LGPD compliance validation
+
+    if selection.validator_enabled(LGPDValidator.name, LGPDValidator.RULES):
+        if verbose:
+            print("Starting LGPD compliance validation...")
+        if lgpd_validator is None:
+            lgpd_validator = LGPDValidator(selection, finding_filter)
+        with timed_phase(metrics, "lgpd"):
+            result.lgpd_issues = lgpd_validator.validate_spec(
+                spec_data, finding_filter, budget
+            )
+        if verbose:
+            print(
+                f"LGPD compliance validation completed. Found {len(result.lgpd_issues)} issue(s)."
+            )
+    elif verbose:
+        print("LGPD compliance validation disabled by rule selection.")
+
+    result.suppressed_count = finding_filter.suppressed - suppressed_before
+    if budget is not None:
+        budget.finish()
+        result.limits_exceeded = budget.exceeded
+    if metrics is not None:
+        metrics.observe_scan(result, time.perf_counter() - started)
+    return result
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# Keywords whose values are sub-schemas (or lists of sub-schemas)
+_SUBSCHEMA_KEYWORDS = ("items", "additionalProperties", "not")
+_COMPOSITION_KEYWORDS = ("allOf", "oneOf", "anyOf")
+
+
+@dataclass
+class IndexedSchema:
+    """A distinct schema found in the spec and every place it is used from."""
+
+    path: str
+    schema: Dict[str, Any]
+    # Insertion-ordered set: shared schemas get many usages, each added once
+    usages: Dict[str, None] = field(default_factory=dict)
+    # Required names contributed by the allOf composition the schema is part of
+    inherited_required: Set[str] = field(default_factory=set)
+
+    @property
+    def required(self) -> Set[str]:
+        required = self.schema.get("required", [])
+        names = set(required) if isinstance(required, list) else set()
+        return names | self.inherited_required
+
+    @property
+    def is_object(self) -> bool:
+        # Only schemas declaring `type: object` are checked, as before indexing
+        return self.schema.get("type") == "object" and isinstance(
+            self.schema.get("properties"), dict
+        )
+
+
+def ref_to_path(ref: str) -> Optional[str]:
+    """Converts a local JSON pointer ('#/components/schemas/User') to a dotted path."""
+    if not isinstance(ref, str) or not ref.startswith("#/"):
+        return None
+    parts = [part.replace("~1", "/").replace("~0", "~") for part in ref[2:].split("/")]
+    return ".".join(parts)
+
+
+def resolve_ref(spec: Dict[str, Any], ref: str) -> Optional[Any]:
+    """Resolves a local JSON pointer against the spec, returning None if it dangles."""
+    if not isinstance(ref, str) or not ref.startswith("#/"):
+        return None
+    node: Any = spec
+    for part in ref[2:].split("/"):
+        part = part.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, dict) and part in node:
+            node = node[part]
+        elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+            node = node[int(part)]
+        else:
+            return None
+    return node
+
+
+class SchemaIndex:
+    """
+    Collects every distinct schema of a spec exactly once.
+
+    Named schemas (components.schemas / definitions) and the inline schemas of
+    parameters, request bodies, responses and headers are indexed, following
+    local $refs, properties, items and allOf/oneOf/anyOf composition. Each
+    entry records the locations that use it so issues can be attributed to
+    all of them.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self._entries: List[IndexedSchema] = []
+        self._by_id: Dict[int, IndexedSchema] = {}
+        self._build()
+
+    def __iter__(self) -> Iterator[IndexedSchema]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, schema: Any) -> Optional[IndexedSchema]:
+        return self._by_id.get(id(schema))
+
+    def _build(self) -> None:
+        # Named schemas first, so they are indexed under their canonical path
+        components = self.spec.get("components")
+        if isinstance(components, dict):
+            self._add_named(components.get("schemas"), "components.schemas")
+        self._add_named(self.spec.get("definitions"), "definitions")
+
+        paths = self.spec.get("paths")
+        if isinstance(paths, dict):
+            for path_name, path_item in paths.items():
+                if not isinstance(path_item, dict):
+                    continue
+                item_path = f"paths.{path_name}"
+                self._add_parameters(path_item.get("parameters"), item_path)
+                for method, operation in path_item.items():
+                    if method.lower() in HTTP_METHODS and isinstance(operation, dict):
+                        self._add_operation(operation, f"{item_path}.{method}")
+
+        if isinstance(components, dict):
+            for section, adder in (
+                ("parameters", self._add_parameter),
+                ("requestBodies", self._add_request_body),
+                ("responses", self._add_response),
+                ("headers", self._add_header),
+            ):
+                entries = components.get(section)
+                if isinstance(entries, dict):
+                    for name, entry in entries.items():
+                        adder(entry, f"components.{section}.{name}")
+
+    def _add_named(self, schemas: Any, base_path: str) -> None:
+        if not isinstance(schemas, dict):
+            return
+        for name, schema in schemas.items():
+            self._add_schema(schema, f"{base_path}.{name}")
+
+    def _deref(self, node: Any) -> Any:
+        """Follows $ref on non-schema objects (parameters, responses, ...)."""
+        seen = set()
+        while isinstance(node, dict) and "$ref" in node and id(node) not in seen:
+            seen.add(id(node))
+            target = resolve_ref(self.spec, node["$ref"])
+            if target is None:
+                return node
+            node = target
+        return node
+
+    def _add_operation(self, operation: Dict[str, Any], path: str) -> None:
+        self._add_parameters(operation.get("parameters"), path)
+        self._add_request_body(operation.get("requestBody"), f"{path}.requestBody")
+        responses = operation.get("responses")
+        if isinstance(responses, dict):
+            for status, response in responses.items():
+                self._add_response(response, f"{path}.responses.{status}")
+
+    def _add_parameters(self, parameters: Any, path: str) -> None:
+        if isinstance(parameters, list):
+            for i, parameter in enumerate(parameters):
+                self._add_parameter(parameter, f"{path}.parameters[{i}]")
+
+    def _add_parameter(self, parameter: Any, path: str) -> None:
+        parameter = self._deref(parameter)
+        if isinstance(parameter, dict):
+            self._add_schema(parameter.get("schema"), f"{path}.schema")
+            self._add_content(parameter.get("content"), path)
+
+    def _add_request_body(self, request_body: Any, path: str) -> None:
+        request_body = self._deref(request_body)
+        if isinstance(request_body, dict):
+            self._add_content(request_body.get("content"), path)
+
+    def _add_response(self, response: Any, path: str) -> None:
+        response = self._deref(response)
+        if not isinstance(response, dict):
+            return
+        # Swagger 2.0 responses carry the schema directly
+        self._add_schema(response.get("schema"), f"{path}.schema")
+        self._add_content(response.get("content"), path)
+        headers = response.get("headers")
+        if isinstance(headers, dict):
+            for name, header in headers.items():
+                self._add_header(header, f"{path}.headers.{name}")
+
+    def _add_header(self, header: Any, path: str) -> None:
+        header = self._deref(header)
+        if isinstance(header, dict):
+            self._add_schema(header.get("schema"), f"{path}.schema")
+
+    def _add_content(self, content: Any, path: str) -> None:
+        if isinstance(content, dict):
+            for media_type, media in content.items():
+                if isinstance(media, dict):
+                    self._add_schema(
+                        media.get("schema"), f"{path}.content.{media_type}.schema"
+                    )
+
+    def _add_schema(self, schema: Any, path: str) -> Optional[IndexedSchema]:
+        if not isinstance(schema, dict):
+            return None
+
+        if "$ref" in schema:
+            target = resolve_ref(self.spec, schema["$ref"])
+            if not isinstance(target, dict):
+                return None
+            entry = self._by_id.get(id(target))
+            if entry is None:
+                entry = self._add_schema(
+                    target, ref_to_path(schema["$ref"]) or schema["$ref"]
+                )
+            if entry is not None:
+                entry.usages[path] = None
+            return entry
+
+        entry = self._by_id.get(id(schema))
+        if entry is not None:
+            entry.usages[path] = None
+            return entry
+
+        entry = IndexedSchema(path=path, schema=schema)
+        self._by_id[id(schema)] = entry
+        self._entries.append(entry)
+
+        properties = schema.get("properties")
+        if isinstance(properties, dict):
+            for name, prop in properties.items():
+                self._add_schema(prop, f"{path}.properties.{name}")
+
+        for keyword in _SUBSCHEMA_KEYWORDS:
+            self._add_schema(schema.get(keyword), f"{path}.{keyword}")
+
+        for keyword in _COMPOSITION_KEYWORDS:
+            members = schema.get(keyword)
+            if not isinstance(members, list):
+                continue
+            member_entries = [
+                self._add_schema(member, f"{path}.{keyword}[{i}]")
+                for i, member in enumerate(members)
+            ]
+            if keyword == "allOf":
+                self._merge_required(entry, members, member_entries)
+
+        return entry
+
+    def _merge_required(
+        self,
+        entry: IndexedSchema,
+        members: List[Any],
+        member_entries: List[Optional[IndexedSchema]],
+    ) -> None:
+        """Shares the required names of an allOf composition with its inline members."""
+        group_required = set(entry.required)
+        for member_entry in member_entries:
+            if member_entry is not None:
+                group_required |= member_entry.required
+        entry.inherited_required |= group_required
+        for member, member_entry in zip(members, member_entries):
+            # Referenced members are shared with other usages and keep their own rules
+            if member_entry is not None and "$ref" not in member:
+                member_entry.inherited_required |= group_required
@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from lokus.baseline import FindingFilter
+from lokus.limits import ScanBudget
+from lokus.rules import RuleSelection
+from lokus.validation import ValidationContext, run_checks
 
 
 class SecurityIssueSeverity(Enum):
@@ -22,36 +27,78 @@ class SecurityIssue:
 
 
 class SecurityValidator:
-    def __init__(self):
-        self.issues: List[SecurityIssue] = []
-
-    def validate_spec(self, spec: Dict[str, Any]) -> List[SecurityIssue]:
-        """Main validation method that runs all security checks"""
-        self.issues = []
-
-        # Run all security checks
-        self._check_broken_object_level_auth(spec)
-        self._check_broken_authentication(spec)
-        self._check_broken_object_property_level_auth(spec)
-        self._check_unrestricted_resource_consumption(spec)
-        self._check_broken_function_level_auth(spec)
-        # self._check_unrestricted_sensitive_flows(spec)
-        # self._check_ssrf(spec)
-        # self._check_security_misconfiguration(spec)
-        # self._check_improper_inventory(spec)
-        # self._check_unsafe_api_consumption(spec)
-
-        return self.issues
-
-    def _check_broken_object_level_auth(self, spec: Dict[str, Any]) -> None:
+    name = "security"
+
+    # Rule ID -> (check method, severity), in execution order
+    RULES = {
+        "BOLA-001": ("_check_broken_object_level_auth", SecurityIssueSeverity.HIGH),
+        "AUTH-001": ("_check_broken_authentication", SecurityIssueSeverity.HIGH),
+        "BOPLA-001": (
+            "_check_broken_object_property_level_auth",
+            SecurityIssueSeverity.HIGH,
+        ),
+        "RATE-001": (
+            "_check_unrestricted_resource_consumption",
+            SecurityIssueSeverity.MEDIUM,
+        ),
+        "BFLA-001": ("_check_broken_function_level_auth", SecurityIssueSeverity.HIGH),
+        # "FLOW-001": ("_check_unrestricted_sensitive_flows", SecurityIssueSeverity.HIGH),
+        # "SSRF-001": ("_check_ssrf", SecurityIssueSeverity.HIGH),
+        # "CONFIG-001": ("_check_security_misconfiguration", SecurityIssueSeverity.HIGH),
+        # "INV-001": ("_check_improper_inventory", SecurityIssueSeverity.MEDIUM),
+        # "CONS-001": ("_check_unsafe_api_consumption", SecurityIssueSeverity.MEDIUM),
+    }
+
+    def __init__(
+        self,
+        selection: Optional[RuleSelection] = None,
+        finding_filter: Optional[FindingFilter] = None,
+    ):
+        self.finding_filter = finding_filter
+
+        # Resolve the rule selection once, so disabled checks are never run.
+        # Rules whose severity is below the threshold can't emit anything either.
+        selection = selection or RuleSelection()
+        self.checks = [
+            (rule_id, getattr(self, method))
+            for rule_id, (method, severity) in self.RULES.items()
+            if selection.is_enabled(rule_id, self.name)
+            and (
+                finding_filter is None
+                or finding_filter.severity_enabled(severity.value)
+            )
+        ]
+
+    def validate_spec(
+        self,
+        spec: Dict[str, Any],
+        finding_filter: Optional[FindingFilter] = None,
+        budget: Optional[ScanBudget] = None,
+    ) -> List[SecurityIssue]:
+        """
+        Main validation method that runs all enabled security checks.
+
+        Issues are collected in a per-call context, so one instance can be
+        shared between threads. `finding_filter` overrides the one given at
+        construction for this call only; with a `budget`, checks that run out
+        of time return partial results.
+        """
+        ctx = ValidationContext(finding_filter or self.finding_filter, budget)
+        return run_checks(self.checks, spec, ctx)
+
+    def _check_broken_object_level_auth(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for Broken Object Level Authorization (BOLA)"""
         paths = spec.get("paths", {})
         for path, path_item in paths.items():
+            ctx.tick()
             for method, operation in path_item.items():
+                ctx.tick()
                 if method.lower() in ["get", "put", "delete", "patch"]:
                     # Check if the endpoint has proper authorization
                     if not operation.get("security"):
-                        self.issues.append(
+                        ctx.emit(
                             SecurityIssue(
                                 rule_id="BOLA-001",
                                 title="Missing Authorization",
@@ -63,15 +110,18 @@ class SecurityValidator:
                             )
                         )
 
-    def _check_broken_authentication(self, spec: Dict[str, Any]) -> None:
+    def _check_broken_authentication(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for Broken Authentication"""
         security_schemes = spec.get("components", {}).get("securitySchemes", {})
 
         # Check for weak authentication schemes
         for scheme_name, scheme in security_schemes.items():
+            ctx.tick()
             if scheme.get("type") == "apiKey":
                 if not scheme.get("in") or scheme.get("in") not in ["header", "cookie"]:
-                    self.issues.append(
+                    ctx.emit(
                         SecurityIssue(
                             rule_id="AUTH-001",
                             title="Broken Authentication",
@@ -83,15 +133,19 @@ class SecurityValidator:
                         )
                     )
 
-    def _check_broken_object_property_level_auth(self, spec: Dict[str, Any]) -> None:
+    def _check_broken_object_property_level_auth(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for Broken Object Property Level Authorization (BOPLA)"""
         paths = spec.get("paths", {})
         for path, path_item in paths.items():
+            ctx.tick()
             for method, operation in path_item.items():
+                ctx.tick()
                 if method.lower() in ["put", "patch"]:
                     # Check if the operation has proper property-level authorization
                     if not operation.get("security"):
-                        self.issues.append(
+                        ctx.emit(
                             SecurityIssue(
                                 rule_id="BOPLA-001",
                                 title="Missing Property Level Authorization",
@@ -103,16 +157,20 @@ class SecurityValidator:
                             )
                         )
 
-    def _check_unrestricted_resource_consumption(self, spec: Dict[str, Any]) -> None:
+    def _check_unrestricted_resource_consumption(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for Unrestricted Resource Consumption"""
         paths = spec.get("paths", {})
         for path, path_item in paths.items():
+            ctx.tick()
             for method, operation in path_item.items():
+                ctx.tick()
                 # Check for rate limiting headers in responses
                 # print(operation)
                 responses = operation.get("responses", {})
                 if "429" not in responses:
-                    self.issues.append(
+                    ctx.emit(
                         SecurityIssue(
                             rule_id="RATE-001",
                             title="Missing Rate Limiting",
@@ -124,15 +182,19 @@ class SecurityValidator:
                         )
                     )
 
-    def _check_broken_function_level_auth(self, spec: Dict[str, Any]) -> None:
+    def _check_broken_function_level_auth(
+        self, spec: Dict[str, Any], ctx: ValidationContext
+    ) -> None:
         """Check for Broken Function Level Authorization (BFLA)"""
         paths = spec.get("paths", {})
         for path, path_item in paths.items():
+            ctx.tick()
             for method, operation in path_item.items():
+                ctx.tick()
                 if method.lower() in ["post", "put", "delete"]:
                     # Check for proper function-level authorization
                     if not operation.get("security"):
-                        self.issues.append(
+                        ctx.emit(
                             SecurityIssue(
                                 rule_id="BFLA-001",
                                 title="Missing Function Level Authorization",
@@ -144,7 +206,9 @@ class SecurityValidator:
                             )
                         )
 
-    # def _check_unrestricted_sensitive_flows(self, spec: Dict[str, Any]) -> None:
+    # def _check_unrestricted_sensitive_flows(
+    #     self, spec: Dict[str, Any], ctx: ValidationContext
+    # ) -> None:
     #     """Check for Unrestricted Access to Sensitive Business Flows"""
     #     paths = spec.get("paths", {})
     #     sensitive_keywords = [
@@ -161,7 +225,7 @@ class SecurityValidator:
     #         if any(keyword in path.lower() for keyword in sensitive_keywords):
     #             for method, operation in path_item.items():
     #                 if not operation.get("security"):
-    #                     self.issues.append(
+    #                     ctx.emit(
     #                         SecurityIssue(
     #                             rule_id="FLOW-001",
     #                             title="Unrestricted Sensitive Flow",
@@ -172,7 +236,9 @@ class SecurityValidator:
     #                         )
     #                     )
     #
-    # def _check_ssrf(self, spec: Dict[str, Any]) -> None:
+    # def _check_ssrf(
+    #     self, spec: Dict[str, Any], ctx: ValidationContext
+    # ) -> None:
     #     """Check for Server Side Request Forgery (SSRF)"""
     #     paths = spec.get("paths", {})
     #     for path, path_item in paths.items():
@@ -187,7 +253,7 @@ class SecurityValidator:
     #                     "src",
     #                     "dest",
     #                 ]:
-    #                     self.issues.append(
+    #                     ctx.emit(
     #                         SecurityIssue(
     #                             rule_id="SSRF-001",
     #                             title="Potential SSRF Vulnerability",
@@ -198,11 +264,13 @@ class SecurityValidator:
     #                         )
     #                     )
     #
-    # def _check_security_misconfiguration(self, spec: Dict[str, Any]) -> None:
+    # def _check_security_misconfiguration(
+    #     self, spec: Dict[str, Any], ctx: ValidationContext
+    # ) -> None:
     #     """Check for Security Misconfiguration"""
     #     # Check for proper security schemes
     #     if not spec.get("components", {}).get("securitySchemes"):
-    #         self.issues.append(
+    #         ctx.emit(
     #             SecurityIssue(
     #                 rule_id="CONFIG-001",
     #                 title="Missing Security Schemes",
@@ -213,11 +281,13 @@ class SecurityValidator:
     #             )
     #         )
     #
-    # def _check_improper_inventory(self, spec: Dict[str, Any]) -> None:
+    # def _check_improper_inventory(
+    #     self, spec: Dict[str, Any], ctx: ValidationContext
+    # ) -> None:
     #     """Check for Improper Inventory Management"""
     #     # Check for proper API versioning
     #     if not spec.get("info", {}).get("version"):
-    #         self.issues.append(
+    #         ctx.emit(
     #             SecurityIssue(
     #                 rule_id="INV-001",
     #                 title="Missing API Version",
@@ -228,7 +298,9 @@ class SecurityValidator:
     #             )
     #         )
     #
-    # def _check_unsafe_api_consumption(self, spec: Dict[str, Any]) -> None:
+    # def _check_unsafe_api_consumption(
+    #     self, spec: Dict[str, Any], ctx: ValidationContext
+    # ) -> None:
     #     """Check for Unsafe API Consumption"""
     #     paths = spec.get("paths", {})
     #     for path, path_item in paths.items():
@@ -236,7 +308,7 @@ class SecurityValidator:
     #             # Check for proper content type validation
     #             if method.lower() in ["post", "put", "patch"]:
     #                 if not operation.get("requestBody", {}).get("content"):
-    #                     self.issues.append(
+    #                     ctx.emit(
     #                         SecurityIssue(
     #                             rule_id="CONS-001",
     #                             title="Missing Content Type Validation",
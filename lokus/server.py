@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+import hashlib
+import http.client
+import json
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from lokus import __version__
+from lokus.api import Ruleset, ScanError
+from lokus.config_loader import load_config
+from lokus.positions import REPORT_SECTIONS, PositionIndex
+from lokus.yaml_parser import parse_swagger_spec
+
+DEFAULT_PORT = 8765
+
+# Number of scan results kept in memory by a running server
+MAX_CACHED_RESULTS = 256
+MAX_CACHED_RULESETS = 32
+
+
+def _mtime(file_path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+
+def _selectors(request: Dict[str, Any], name: str) -> Optional[List[str]]:
+    value = request.get(name)
+    if value is not None and not (
+        isinstance(value, list) and all(isinstance(item, str) for item in value)
+    ):
+        raise ValueError(f"'{name}' must be a list of rule selectors")
+    return value
+
+
+class ScanService:
+    """
+    Warm state shared by every request of a `lokus serve` process.
+
+    Parsed configurations are kept until their file changes, rulesets are
+    compiled once per set of scan settings, and scan results are kept in an
+    LRU cache keyed by the spec content and the scan settings, so repeated
+    requests for an unchanged spec are answered without parsing or scanning
+    it again.
+    """
+
+    def __init__(
+        self,
+        default_config_path: str,
+        max_cached_results: int = MAX_CACHED_RESULTS,
+        max_cached_rulesets: int = MAX_CACHED_RULESETS,
+    ):
+        self.default_config_path = default_config_path
+        self.max_cached_results = max_cached_results
+        self.max_cached_rulesets = max_cached_rulesets
+        # Per configuration: the mtime of every file in its chain, and its data
+        self._configs: Dict[str, Tuple[Dict[str, Optional[float]], Dict[str, Any]]] = {}
+        self._rulesets: "OrderedDict[Tuple[Any, ...], Ruleset]" = OrderedDict()
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def config(self, config_path: str) -> Dict[str, Any]:
+        """
+        Returns the parsed configuration, reloading it only when its file or
+        a file it extends changed.
+        """
+        if not os.path.isfile(config_path):
+            raise ValueError(f"Configuration file not found at {config_path}")
+
+        with self._lock:
+            cached = self._configs.get(config_path)
+        if cached is not None and all(
+            _mtime(file_path) == mtime for file_path, mtime in cached[0].items()
+        ):
+            return cached[1]
+
+        config_files: List[str] = []
+        config_data = load_config(config_path, files=config_files)
+        if config_data is None:
+            raise ValueError(f"Invalid configuration file {config_path}")
+        mtimes = {
+            file_path: _mtime(file_path) for file_path in config_files or [config_path]
+        }
+        with self._lock:
+            self._configs[config_path] = (mtimes, config_data)
+            # Rulesets compiled from the previous version are stale now
+            self._rulesets = OrderedDict(
+                (key, ruleset)
+                for key, ruleset in self._rulesets.items()
+                if key[0] != config_path
+            )
+        return config_data
+
+    def ruleset(
+        self,
+        config_path: str,
+        config_data: Dict[str, Any],
+        only: Optional[List[str]] = None,
+        skip: Optional[List[str]] = None,
+        min_severity: Optional[str] = None,
+    ) -> Ruleset:
+        """
+        Returns the compiled ruleset for these settings, compiling it only
+        once. Selectors are sorted and de-duplicated, so requests listing the
+        same rules in another order share a ruleset; the least recently used
+        rulesets are dropped past `max_cached_rulesets`.
+        """
+        only = sorted(set(only or ()))
+        skip = sorted(set(skip or ()))
+        key = (config_path, id(config_data), tuple(only), tuple(skip), min_severity)
+        with self._lock:
+            ruleset = self._rulesets.get(key)
+            if ruleset is not None:
+                self._rulesets.move_to_end(key)
+        if ruleset is None:
+            try:
+                ruleset = Ruleset(config_data, only, skip, min_severity)
+            except ScanError as e:
+                raise ValueError(str(e))
+            with self._lock:
+                self._rulesets[key] = ruleset
+                while len(self._rulesets) > self.max_cached_rulesets:
+                    self._rulesets.popitem(last=False)
+        return ruleset
+
+    def scan(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Scans the spec of a request and returns the JSON report.
+
+        The request holds either `spec` (the document text) or `path` (a
+        file readable by the server), and optionally `source`, `config`,
+        `only`, `skip`, `min_severity` and `positions` (add the line and
+        column of each entry).
+
+        Raises:
+            ValueError: If the request, the configuration or the spec is invalid.
+        """
+        config_path = request.get("config") or self.default_config_path
+        config_data = self.config(config_path)
+        min_severity = request.get("min_severity")
+        if min_severity is not None and not isinstance(min_severity, str):
+            raise ValueError("'min_severity' must be a string")
+
+        ruleset = self.ruleset(
+            config_path,
+            config_data,
+            _selectors(request, "only"),
+            _selectors(request, "skip"),
+            min_severity,
+        )
+
+        if isinstance(request.get("spec"), str):
+            spec_text = request["spec"]
+            source = request.get("source") or "<request>"
+        elif isinstance(request.get("path"), str):
+            source = request.get("source") or request["path"]
+            try:
+                with open(request["path"], "r", encoding="utf-8") as f:
+                    spec_text = f.read()
+            except OSError as e:
+                raise ValueError(f"Could not read {request['path']}: {e}")
+        else:
+            raise ValueError("Request must contain 'spec' or 'path'")
+
+        cache_key = (
+            hashlib.sha256(spec_text.encode("utf-8")).hexdigest() + ruleset.settings_key
+        )
+        with self._lock:
+            result = self._results.get(cache_key)
+            if result is not None:
+                self._results.move_to_end(cache_key)
+        cached = result is not None
+
+        if result is None:
+            spec_data = parse_swagger_spec(spec_text, source, ruleset.limits)
+            scan_result = ruleset.scan(spec_data)
+            result = scan_result.to_dict()
+            # Partial results depend on timing; scan again next time
+            if not scan_result.limits_exceeded:
+                with self._lock:
+                    self._results[cache_key] = result
+                    while len(self._results) > self.max_cached_results:
+                        self._results.popitem(last=False)
+
+        response = {
+            "swagger_file": source,
+            "config_file": config_path,
+            **result,
+            "cached": cached,
+        }
+        if request.get("positions"):
+            # Annotate copies; the cached entries stay position-free
+            for section in REPORT_SECTIONS:
+                response[section] = [dict(entry) for entry in response[section]]
+            PositionIndex(spec_text).annotate(response)
+        return response
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front-end of a ScanService: GET /health and POST /scan."""
+
+    server_version = f"lokus/{__version__}"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "version": __version__})
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/scan":
+            self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            self._send_json(200, self.server.service.scan(request))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"Unexpected error: {e}"})
+
+
+class ScanHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: ScanService, verbose: bool = False):
+        self.service = service
+        self.verbose = verbose
+        super().__init__(address, ScanRequestHandler)
+
+
+class UnixScanHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ScanService, verbose: bool = False):
+        self.service = service
+        self.verbose = verbose
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, ScanRequestHandler)
+
+
+def create_server(
+    service: ScanService,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """Creates a TCP server, or a Unix socket server when socket_path is given."""
+    if socket_path:
+        return UnixScanHTTPServer(socket_path, service, verbose)
+    return ScanHTTPServer((host, port), service, verbose)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def remote_scan(
+    url: str, request: Dict[str, Any], timeout: float = 60.0
+) -> Dict[str, Any]:
+    """
+    Sends a scan request to a running `lokus serve` and returns its JSON report.
+
+    `url` is either http://host:port or unix:///path/to/socket.
+
+    Raises:
+        ValueError: If the server rejected the request.
+        OSError: If the server could not be reached.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "unix":
+        connection = _UnixHTTPConnection(parsed.path, timeout)
+    elif parsed.scheme == "http":
+        connection = http.client.HTTPConnection(
+            parsed.hostname or "127.0.0.1", parsed.port or DEFAULT_PORT, timeout=timeout
+        )
+    else:
+        raise ValueError(f"Unsupported server URL '{url}' (use http:// or unix://)")
+
+    body = json.dumps(request).encode("utf-8")
+    try:
+        connection.request("POST", "/scan", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        payload = json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise ValueError(payload.get("error", f"Server returned {response.status}"))
+    return payload
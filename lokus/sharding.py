@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lokus.api import Ruleset
+from lokus.parallel import (
+    build_chunk,
+    merge_results,
+    part_ruleset,
+    partition_units,
+    scan_whole_spec_rules,
+)
+from lokus.scanner import ScanResult
+
+PARTIAL_VERSION = 1
+
+# A partial result covers either a share of many spec files or a share of
+# the units of a single spec
+MODE_FILES = "files"
+MODE_SPEC = "spec"
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parses 'INDEX/COUNT' (1-based index).
+
+    Raises:
+        ValueError: If the value is malformed or the index is out of range.
+    """
+    try:
+        index_text, count_text = value.split("/")
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected INDEX/COUNT (e.g. 1/4)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', INDEX must be between 1 and COUNT")
+    return index, count
+
+
+def shard_of(key: str, count: int) -> int:
+    """Returns the 1-based shard of a key; stable across runs, machines and Python versions."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return int(digest[:16], 16) % count + 1
+
+
+def _file_key(file_path: str) -> str:
+    # Runners check out the repository at different locations
+    return os.path.relpath(file_path).replace(os.sep, "/")
+
+
+def shard_files(files: Iterable[str], index: int, count: int) -> List[str]:
+    """Keeps the spec files assigned to shard `index` of `count`."""
+    return [
+        file_path
+        for file_path in files
+        if shard_of(_file_key(file_path), count) == index
+    ]
+
+
+def _unit_shard(unit: Tuple[Any, ...], count: int) -> int:
+    if len(unit) == 1:
+        return 1
+    return shard_of("\0".join(str(part) for part in unit), count)
+
+
+def shard_spec(spec_data: Dict[str, Any], index: int, count: int) -> Dict[str, Any]:
+    """
+    Keeps the path items and component entries assigned to shard `index`.
+
+    Other top-level keys (info, servers, ...) belong to the first shard.
+    """
+    units = [
+        (unit, value)
+        for unit, value in partition_units(spec_data)
+        if _unit_shard(unit, count) == index
+    ]
+    return build_chunk(units)
+
+
+def scan_spec_shard(
+    spec_data: Dict[str, Any], ruleset: Ruleset, index: int, count: int
+) -> ScanResult:
+    """Scans one shard of a single spec; whole-spec rules run on the first shard."""
+    result = part_ruleset(ruleset).scan(shard_spec(spec_data, index, count))
+    if index == 1:
+        result = merge_results([result, scan_whole_spec_rules(spec_data, ruleset)])
+    return result
+
+
+def build_partial(
+    results: Dict[str, ScanResult],
+    index: int,
+    count: int,
+    mode: str,
+    config_file_path: str,
+) -> Dict[str, Any]:
+    """Builds the JSON document one shard emits for `lokus merge`."""
+    return {
+        "lokus_partial": PARTIAL_VERSION,
+        "shard": {"index": index, "count": count},
+        "mode": mode,
+        "config_file": config_file_path,
+        "reports": [
+            {"swagger_file": spec_file, **result.to_dict()}
+            for spec_file, result in results.items()
+        ],
+    }
+
+
+def load_partial(partial_path: str) -> Optional[Dict[str, Any]]:
+    """Loads a partial result written by a `--shard` run."""
+    try:
+        with open(partial_path, "r", encoding="utf-8") as f:
+            partial = json.load(f)
+    except FileNotFoundError:
+        print(f"Error: Partial result file not found at {partial_path}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read partial result {partial_path}: {e}")
+        return None
+
+    if not isinstance(partial, dict) or partial.get("lokus_partial") != PARTIAL_VERSION:
+        print(f"Error: {partial_path} is not a Lokus partial result.")
+        return None
+    return partial
+
+
+def merge_partials(
+    partials: List[Dict[str, Any]],
+) -> Optional[Tuple[str, str, Dict[str, ScanResult]]]:
+    """
+    Combines the partial results of every shard of one run.
+
+    Returns:
+        (mode, config file, results by spec file), or None if the partials
+        do not form one complete run.
+    """
+    counts = {partial["shard"]["count"] for partial in partials}
+    modes = {partial["mode"] for partial in partials}
+    if len(counts) != 1 or len(modes) != 1:
+        print("Error: Partial results come from different shard runs.")
+        return None
+    count = counts.pop()
+    indexes = sorted(partial["shard"]["index"] for partial in partials)
+    if indexes != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(indexes))
+        duplicated = sorted({i for i in indexes if indexes.count(i) > 1})
+        if missing:
+            print(f"Error: Missing partial results for shard(s) {missing} of {count}.")
+        if duplicated:
+            print(f"Error: Duplicate partial results for shard(s) {duplicated}.")
+        return None
+
+    parts: Dict[str, List[ScanResult]] = {}
+    for partial in sorted(partials, key=lambda partial: partial["shard"]["index"]):
+        for report in partial["reports"]:
+            parts.setdefault(report["swagger_file"], []).append(
+                ScanResult.from_dict(report)
+            )
+
+    # Files are scanned by exactly one shard; a single spec is split across all
+    results = {
+        spec_file: (
+            merge_results(parts[spec_file])
+            if len(parts[spec_file]) > 1
+            else parts[spec_file][0]
+        )
+        for spec_file in sorted(parts)
+    }
+    return modes.pop(), partials[0].get("config_file"), results
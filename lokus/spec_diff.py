@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set, Tuple
+
+from lokus.schema_index import HTTP_METHODS
+
+# Swagger 2.0 top-level sections holding named, referenceable entries
+SWAGGER2_SECTIONS = ("definitions", "parameters", "responses", "securityDefinitions")
+
+# A unit is the smallest part of a spec compared and rescanned on its own:
+#   ("paths", "/users", "get")      one operation
+#   ("paths", "/users", None)       path-level keys (parameters, servers, ...)
+#   ("components", "schemas", "X")  one component
+#   ("definitions", "X")            one Swagger 2.0 entry
+#   ("info",)                       any other top-level key
+Unit = Tuple[Any, ...]
+
+
+def split_units(spec: Dict[str, Any]) -> Dict[Unit, Any]:
+    """Splits a spec into independently comparable units."""
+    units: Dict[Unit, Any] = {}
+    for key, value in spec.items():
+        if key == "paths" and isinstance(value, dict):
+            for path_name, path_item in value.items():
+                if not isinstance(path_item, dict):
+                    units[("paths", path_name, None)] = path_item
+                    continue
+                shared = {}
+                for method, operation in path_item.items():
+                    if str(method).lower() in HTTP_METHODS:
+                        units[("paths", path_name, method)] = operation
+                    else:
+                        shared[method] = operation
+                units[("paths", path_name, None)] = shared
+        elif key == "components" and isinstance(value, dict):
+            for section, entries in value.items():
+                if isinstance(entries, dict):
+                    for name, entry in entries.items():
+                        units[("components", section, name)] = entry
+                else:
+                    units[("components", section)] = entries
+        elif key in SWAGGER2_SECTIONS and isinstance(value, dict):
+            for name, entry in value.items():
+                units[(key, name)] = entry
+        else:
+            units[(key,)] = value
+    return units
+
+
+def ref_to_unit(ref: str) -> Unit:
+    """Maps a local $ref to the unit holding its target, or () if it is external."""
+    if not isinstance(ref, str) or not ref.startswith("#/"):
+        return ()
+    parts = [part.replace("~1", "/").replace("~0", "~") for part in ref[2:].split("/")]
+    if parts[0] == "components" and len(parts) >= 3:
+        return ("components", parts[1], parts[2])
+    if parts[0] in SWAGGER2_SECTIONS and len(parts) >= 2:
+        return (parts[0], parts[1])
+    if parts[0] == "paths" and len(parts) >= 2:
+        method = (
+            parts[2] if len(parts) >= 3 and parts[2].lower() in HTTP_METHODS else None
+        )
+        return ("paths", parts[1], method)
+    return (parts[0],)
+
+
+def _is_path_unit(unit: Unit) -> bool:
+    # A malformed `paths` (not a mapping) is a plain ("paths",) unit
+    return len(unit) == 3 and unit[0] == "paths"
+
+
+def collect_refs(value: Any) -> Set[Unit]:
+    """Returns the units referenced by local $refs anywhere inside a value."""
+    refs: Set[Unit] = set()
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                unit = ref_to_unit(ref)
+                if unit:
+                    refs.add(unit)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return refs
+
+
+def build_spec(units: Dict[Unit, Any], selected: Set[Unit]) -> Dict[str, Any]:
+    """Reassembles a partial spec from the selected units, keeping their paths."""
+    spec: Dict[str, Any] = {}
+    for unit, value in units.items():
+        if unit not in selected:
+            continue
+        if _is_path_unit(unit):
+            path_name, method = unit[1], unit[2]
+            path_item = spec.setdefault("paths", {}).setdefault(path_name, {})
+            if method is None:
+                if isinstance(value, dict):
+                    path_item.update(value)
+                else:
+                    spec["paths"][path_name] = value
+            else:
+                path_item[method] = value
+        elif len(unit) == 1:
+            spec[unit[0]] = value
+        else:
+            target = spec
+            for part in unit[:-1]:
+                target = target.setdefault(part, {})
+            target[unit[-1]] = value
+    return spec
+
+
+@dataclass
+class SpecDiff:
+    """The changed units of two spec versions and the partial specs to rescan."""
+
+    changed: Set[Unit] = field(default_factory=set)
+    added: Set[Unit] = field(default_factory=set)
+    removed: Set[Unit] = field(default_factory=set)
+    scanned: Set[Unit] = field(default_factory=set)
+    old_spec: Dict[str, Any] = field(default_factory=dict)
+    new_spec: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.changed or self.added or self.removed)
+
+
+def _reverse_refs(units: Dict[Unit, Any]) -> Dict[Unit, Set[Unit]]:
+    referrers: Dict[Unit, Set[Unit]] = {}
+    for unit, value in units.items():
+        for ref in collect_refs(value):
+            referrers.setdefault(ref, set()).add(unit)
+    return referrers
+
+
+def _operations_of(units: Dict[Unit, Any], path_name: Any) -> List[Unit]:
+    return [
+        unit
+        for unit in units
+        if _is_path_unit(unit) and unit[1] == path_name and unit[2] is not None
+    ]
+
+
+def diff_specs(old_spec: Dict[str, Any], new_spec: Dict[str, Any]) -> SpecDiff:
+    """
+    Computes which parts of the new spec need rescanning.
+
+    Changed, added and removed units are rescanned together with every unit
+    that (transitively) references them, so findings that depend on a
+    shared component are re-evaluated. The units those depend on are
+    included as well so $refs still resolve. Both partial specs contain the
+    same units, so unchanged findings cancel out when compared.
+    """
+    old_units = split_units(old_spec)
+    new_units = split_units(new_spec)
+
+    diff = SpecDiff()
+    for unit, value in new_units.items():
+        if unit not in old_units:
+            diff.added.add(unit)
+        elif old_units[unit] != value:
+            diff.changed.add(unit)
+    diff.removed = {unit for unit in old_units if unit not in new_units}
+
+    affected = diff.changed | diff.added | diff.removed
+
+    # Path-level keys (e.g. shared parameters) apply to every operation below them
+    for unit in list(affected):
+        if _is_path_unit(unit) and unit[2] is None:
+            affected.update(_operations_of(new_units, unit[1]))
+            affected.update(_operations_of(old_units, unit[1]))
+
+    # Anything referencing an affected unit may produce different findings now.
+    # Operations are never $ref targets in practice, so skip the graph for them.
+    if any(not _is_path_unit(unit) for unit in affected):
+        referrers = _reverse_refs(new_units)
+        for ref, units in _reverse_refs(old_units).items():
+            referrers.setdefault(ref, set()).update(units)
+        pending = list(affected)
+        while pending:
+            for referrer in referrers.get(pending.pop(), ()):
+                if referrer not in affected:
+                    affected.add(referrer)
+                    pending.append(referrer)
+
+    # Operations always carry their path-level keys
+    scanned = set(affected)
+    scanned.update(("paths", unit[1], None) for unit in affected if _is_path_unit(unit))
+
+    # Pull in what the scanned units depend on, so their $refs resolve
+    pending = list(scanned)
+    while pending:
+        unit = pending.pop()
+        for units in (new_units, old_units):
+            if unit not in units:
+                continue
+            for ref in collect_refs(units[unit]):
+                if ref not in scanned and (ref in new_units or ref in old_units):
+                    scanned.add(ref)
+                    pending.append(ref)
+
+    diff.scanned = scanned
+    diff.old_spec = build_spec(old_units, scanned)
+    diff.new_spec = build_spec(new_units, scanned)
+    return diff
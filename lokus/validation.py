@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lokus.baseline import FindingFilter
+from lokus.limits import LimitExceeded, ScanBudget
+
+
+def _no_budget() -> None:
+    pass
+
+
+class ValidationContext:
+    """
+    Per-call state of a validator run.
+
+    Validators keep only their compiled rules; the issues of one
+    validate_spec call are collected here, so a single validator instance
+    can serve concurrent calls without their results interleaving.
+    """
+
+    def __init__(
+        self,
+        finding_filter: Optional[FindingFilter] = None,
+        budget: Optional[ScanBudget] = None,
+    ):
+        self.finding_filter = finding_filter
+        self.budget = budget
+        self.issues: List[Any] = []
+        # Called by checks once per traversed node; a no-op without a budget
+        self.tick: Callable[[], None] = (
+            budget.tick if budget is not None else _no_budget
+        )
+
+    def emit(self, issue: Any) -> None:
+        """Records an issue unless the severity threshold or baseline drops it"""
+        if self.finding_filter is None or self.finding_filter.accepts(
+            issue.rule_id,
+            issue.path,
+            getattr(issue, "key", ""),
+            severity=issue.severity.value,
+        ):
+            self.issues.append(issue)
+
+
+def run_checks(
+    checks: List[Tuple[str, Callable[[Dict[str, Any], ValidationContext], None]]],
+    spec: Dict[str, Any],
+    ctx: ValidationContext,
+) -> List[Any]:
+    """
+    Runs (rule ID, check) pairs in order and returns the issues emitted.
+
+    With a time budget, a check that runs out keeps the issues it emitted so
+    far, and no further check starts once the whole scan is out of time.
+    """
+    budget = ctx.budget
+    for rule_id, check in checks:
+        if budget is not None and not budget.start_rule(rule_id):
+            break
+        try:
+            check(spec, ctx)
+        except LimitExceeded as e:
+            budget.record(e)
+    return ctx.issues
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from lokus.api import Ruleset
+from lokus.config_loader import load_config
+from lokus.incremental import iter_candidate_files
+from lokus.scanner import ScanResult
+from lokus.yaml_parser import is_openapi_document, load_swagger_spec
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.2
+
+# (modification time in ns, size) of a watched file
+Stamp = Tuple[int, int]
+
+
+def _stamp(file_path: str) -> Optional[Stamp]:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _print_entries(marker: str, summaries: List[Dict[str, Any]]) -> None:
+    for summary in summaries:
+        print(
+            f"  {marker} [{summary['rule_id']}] {summary['path']}: {summary['description']}"
+        )
+
+
+class SpecWatcher:
+    """
+    Polls specs for changes and revalidates only the files that changed.
+
+    The configuration is compiled once into a Ruleset and kept in memory;
+    it is only recompiled when its own file or a file it extends changes.
+    Each rescan prints the findings that appeared and disappeared since the
+    previous result of that file.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        config_path: str,
+        ruleset: Ruleset,
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        config_files: Optional[List[str]] = None,
+    ):
+        self.paths = list(paths)
+        self.config_path = config_path
+        self.ruleset = ruleset
+        self.interval = interval
+        self.debounce = debounce
+        self.results: Dict[str, ScanResult] = {}
+        self._stamps: Dict[str, Optional[Stamp]] = {}
+        self._explicit: Set[str] = set()
+        # The configuration and every file it extends
+        self._config_stamps = {
+            file_path: _stamp(file_path) for file_path in config_files or [config_path]
+        }
+
+    def _snapshot(self) -> Dict[str, Tuple[Optional[Stamp], bool]]:
+        return {
+            file_path: (_stamp(file_path), explicit)
+            for file_path, explicit in iter_candidate_files(self.paths)
+        }
+
+    def _changed(self, snapshot: Dict[str, Tuple[Optional[Stamp], bool]]) -> List[str]:
+        changed = [
+            file_path
+            for file_path, (stamp, _) in snapshot.items()
+            if self._stamps.get(file_path) != stamp
+        ]
+        changed.extend(
+            file_path for file_path in self._stamps if file_path not in snapshot
+        )
+        return sorted(changed)
+
+    def _scan_file(self, file_path: str) -> Optional[ScanResult]:
+        spec_data = load_swagger_spec(file_path, self.ruleset.limits)
+        if spec_data is None:
+            # load_swagger_spec already prints error messages
+            return None
+        result = self.ruleset.scan(spec_data)
+        for message in result.limits_exceeded:
+            print(f"{file_path}: {message}")
+        return result
+
+    def start(self) -> None:
+        """Scans every watched spec once and prints its current issues."""
+        snapshot = self._snapshot()
+        for file_path, (stamp, explicit) in snapshot.items():
+            self._stamps[file_path] = stamp
+            if explicit:
+                self._explicit.add(file_path)
+            if explicit or is_openapi_document(file_path):
+                result = self._scan_file(file_path)
+                if result is not None:
+                    self.results[file_path] = result
+                    print(f"{file_path}: {len(result.summaries())} issue(s)")
+                    _print_entries("*", result.summaries())
+        print(
+            f"Watching {len(self.results)} spec(s) for changes. Press Ctrl+C to stop."
+        )
+
+    def wait_for_changes(self) -> List[str]:
+        """Blocks until files change and stay unchanged for the debounce period."""
+        while True:
+            time.sleep(self.interval)
+            if any(
+                _stamp(file_path) != stamp
+                for file_path, stamp in self._config_stamps.items()
+            ):
+                self._reload_config()
+                return sorted(self.results)
+            snapshot = self._snapshot()
+            changed = self._changed(snapshot)
+            if not changed:
+                continue
+            # Editors often write a file in several steps; wait for it to settle
+            while True:
+                time.sleep(self.debounce)
+                settled = self._snapshot()
+                if settled == snapshot:
+                    break
+                snapshot = settled
+            changed = self._changed(snapshot)
+            self._stamps = {
+                file_path: stamp for file_path, (stamp, _) in snapshot.items()
+            }
+            self._explicit = {
+                file_path for file_path, (_, explicit) in snapshot.items() if explicit
+            }
+            return changed
+
+    def _reload_config(self) -> None:
+        config_files: List[str] = []
+        config_data = load_config(self.config_path, files=config_files)
+        self._config_stamps = {
+            file_path: _stamp(file_path)
+            for file_path in config_files or [self.config_path]
+        }
+        if config_data is None:
+            # load_config already prints error messages
+            print("Warning: Keeping the previous configuration.")
+            return
+        # Rule selectors, severity threshold and baseline stay as given
+        self.ruleset = Ruleset(
+            config_data,
+            self.ruleset.only,
+            self.ruleset.skip,
+            self.ruleset.min_severity,
+            self.ruleset.baseline,
+        )
+        for warning in self.ruleset.warnings:
+            print(f"Warning: {warning}")
+        print(f"Configuration {self.config_path} reloaded.")
+
+    def rescan(self, files: Iterable[str]) -> Dict[str, Tuple[ScanResult, ScanResult]]:
+        """
+        Revalidates the given files and prints the delta of their findings.
+
+        Returns:
+            For each file with a delta, the (new, resolved) issues.
+        """
+        deltas = {}
+        for file_path in files:
+            started = time.perf_counter()
+            previous = self.results.get(file_path, ScanResult())
+
+            if not os.path.exists(file_path):
+                self.results.pop(file_path, None)
+                result = ScanResult()
+            elif file_path in self._explicit or is_openapi_document(file_path):
+                result = self._scan_file(file_path)
+                if result is None:
+                    # Keep the last good result until the file parses again
+                    continue
+                self.results[file_path] = result
+            else:
+                continue
+
+            new = result.excluding(previous.fingerprints())
+            resolved = previous.excluding(result.fingerprints())
+            elapsed = time.perf_counter() - started
+            if not (new.has_issues or resolved.has_issues):
+                print(f"{file_path}: no changes in findings ({elapsed:.2f}s)")
+                continue
+            print(
+                f"{file_path}: {len(new.summaries())} new, "
+                f"{len(resolved.summaries())} resolved, "
+                f"{len(result.summaries())} total ({elapsed:.2f}s)"
+            )
+            _print_entries("+", new.summaries())
+            _print_entries("-", resolved.summaries())
+            deltas[file_path] = (new, resolved)
+        return deltas
+
+    def run(self) -> None:
+        """Watches until interrupted."""
+        self.start()
+        try:
+            while True:
+                self.rescan(self.wait_for_changes())
+        except KeyboardInterrupt:
+            print("Stopped watching.")
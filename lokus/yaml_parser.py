@@ -1,15 +1,95 @@
 #!/usr/bin/env python3
+import os
+import re
+
 import yaml
 
+from lokus.limits import LimitExceeded, ScanLimits, safe_load_limited
+
+SPEC_FILE_EXTENSIONS = (".yaml", ".yml", ".json")
+
+# Bytes read from the start of a file when sniffing for an OpenAPI document
+SNIFF_BYTES = 4096
+
+# Top-level "openapi:"/"swagger:" key in YAML, or "openapi": in JSON
+_OPENAPI_MARKER = re.compile(rb"""^[\s{,]*["']?(?:openapi|swagger)["']?\s*:""", re.M)
+
+# Guardrails for parsing a file whose start did not give it away
+SNIFF_PARSE_LIMITS = ScanLimits(
+    max_bytes=8 * 1024 * 1024, max_nodes=1_000_000, max_depth=200
+)
 
-def load_swagger_spec(swagger_file_path):
-    """Loads the Swagger/OpenAPI specification from a YAML file."""
+
+def is_openapi_document(file_path):
+    """
+    Checks whether a file looks like an OpenAPI/Swagger document.
+
+    The start of the file is searched for a top-level version key first.
+    Files where it comes later (after a long `info` block, or in minified
+    JSON) and that mention it at all are parsed, within SNIFF_PARSE_LIMITS,
+    to look at their top-level keys.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+            if _OPENAPI_MARKER.search(head):
+                return True
+            size = os.fstat(f.fileno()).st_size
+            if size > SNIFF_PARSE_LIMITS.max_bytes:
+                return False
+            content = head + f.read()
+    except OSError:
+        return False
+    if b"openapi" not in content and b"swagger" not in content:
+        return False
+    try:
+        data = safe_load_limited(content, SNIFF_PARSE_LIMITS, file_path)
+    except (yaml.YAMLError, LimitExceeded, UnicodeDecodeError):
+        return False
+    return isinstance(data, dict) and ("openapi" in data or "swagger" in data)
+
+
+def parse_swagger_spec(content, source="<string>", limits=None):
+    """
+    Parses Swagger/OpenAPI document content (str or bytes) without printing.
+
+    Raises:
+        ValueError: If the content is not valid YAML or not a dictionary.
+        LimitExceeded: If the content is over one of the ScanLimits.
+    """
+    limits = limits or ScanLimits()
+    if limits.max_bytes is not None:
+        size = len(content.encode("utf-8") if isinstance(content, str) else content)
+        limits.check_size(size, source)
+    try:
+        # CRITICAL: Always use yaml.safe_load() for untrusted input.
+        spec_data = safe_load_limited(content, limits, source)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing Swagger/OpenAPI file {source}: {e}")
+    if spec_data is None:
+        raise ValueError(f"Swagger/OpenAPI file {source} is empty.")
+    if not isinstance(spec_data, dict):
+        raise ValueError(
+            f"Swagger/OpenAPI file {source} is not a valid YAML dictionary."
+        )
+    return spec_data
+
+
+def load_swagger_spec(swagger_file_path, limits=None):
+    """
+    Loads the Swagger/OpenAPI specification from a YAML file.
+
+    With `limits`, oversized files are rejected before being read, and the
+    node and depth limits are enforced while parsing.
+    """
+    limits = limits or ScanLimits()
     try:
         with open(swagger_file_path, "r", encoding="utf-8") as f:
+            limits.check_size(os.fstat(f.fileno()).st_size, swagger_file_path)
             # CRITICAL: Always use yaml.safe_load() for untrusted input.
             # Swagger/OpenAPI files, especially from external sources or user-provided,
             # must be treated as untrusted.
-            spec_data = yaml.safe_load(f)
+            spec_data = safe_load_limited(f.read(), limits, swagger_file_path)
 
             if spec_data is None:  # Handles empty swagger file
                 print(f"Error: Swagger/OpenAPI file {swagger_file_path} is empty.")
@@ -24,6 +104,9 @@ def load_swagger_spec(swagger_file_path):
     except FileNotFoundError:
         print(f"Error: Swagger/OpenAPI file not found at {swagger_file_path}")
         return None
+    except LimitExceeded as e:
+        print(f"Error: {e}")
+        return None
     except yaml.YAMLError as e:
         # This will catch syntax errors in the YAML file.
         print(f"Error parsing Swagger/OpenAPI file {swagger_file_path}: {e}")
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import lokus
+from lokus.aio import AsyncScanner
+from lokus.api import Ruleset, ScanError
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+CLEAN_SPEC = os.path.join(SAMPLES_DIR, "sample_clean_spec.yaml")
+
+
+def test_ascan_matches_scan():
+    expected = lokus.scan(PROBLEM_SPEC, CONFIG_FILE)
+    result = asyncio.run(lokus.ascan(PROBLEM_SPEC, CONFIG_FILE))
+
+    assert result.to_dict() == expected.to_dict()
+
+
+def test_ascan_on_process_pool():
+    ruleset = Ruleset.from_file(CONFIG_FILE)
+    expected = ruleset.scan(lokus.api.read_spec(PROBLEM_SPEC))
+
+    async def run():
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            scanner = AsyncScanner(ruleset, pool)
+            return await asyncio.gather(
+                scanner.scan(PROBLEM_SPEC), scanner.scan(PROBLEM_SPEC)
+            )
+
+    for result in asyncio.run(run()):
+        assert result.to_dict() == expected.to_dict()
+
+
+def test_ascan_errors():
+    with pytest.raises(ScanError, match="Could not read"):
+        asyncio.run(lokus.ascan("missing.yaml", CONFIG_FILE))
+    with pytest.raises(ScanError, match="not a valid YAML dictionary"):
+        asyncio.run(lokus.ascan(b"- a\n", CONFIG_FILE))
+
+
+class _CountingRuleset(Ruleset):
+    """Records how many scans run at the same time."""
+
+    def __init__(self):
+        super().__init__({})
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def scan(self, spec_data):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return super().scan(spec_data)
+
+
+def test_scan_many_bounds_concurrency_and_pulls_lazily():
+    ruleset = _CountingRuleset()
+    pulled = []
+
+    async def uploads():
+        for i in range(12):
+            pulled.append(i)
+            yield CLEAN_SPEC if i % 2 else b"- not a dict\n"
+
+    async def run():
+        results = []
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            scanner = AsyncScanner(ruleset, pool, max_concurrency=3)
+            async for spec, result in scanner.scan_many(uploads()):
+                # Never more than the in-flight limit taken from the source
+                assert len(pulled) - len(results) <= 3
+                results.append((spec, result))
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(results) == 12
+    assert ruleset.peak <= 3
+    errors = [result for _, result in results if isinstance(result, ScanError)]
+    assert len(errors) == 6
@@ -0,0 +1,69 @@
+import os
+import pathlib
+
+import pytest
+
+import lokus
+from lokus.api import Ruleset, ScanError
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+
+def test_scan_path_returns_result_without_printing(capsys):
+    result = lokus.scan(PROBLEM_SPEC, CONFIG_FILE)
+
+    assert isinstance(result, lokus.ScanResult)
+    assert result.findings
+    assert result.security_issues
+    assert capsys.readouterr().out == ""
+
+
+def test_scan_accepts_parsed_spec_bytes_and_pathlike():
+    ruleset = Ruleset.from_file(CONFIG_FILE)
+    with open(PROBLEM_SPEC, "rb") as f:
+        content = f.read()
+
+    from_path = lokus.scan(pathlib.Path(PROBLEM_SPEC), ruleset)
+    from_bytes = lokus.scan(content, ruleset)
+
+    assert from_path.to_dict() == from_bytes.to_dict()
+
+
+def test_reused_ruleset_matches_fresh_config():
+    ruleset = Ruleset.from_file(CONFIG_FILE, only=["deep_search", "BOLA-*"])
+
+    first = lokus.scan(PROBLEM_SPEC, ruleset)
+    second = lokus.scan(PROBLEM_SPEC, ruleset)
+    fresh = lokus.scan(PROBLEM_SPEC, CONFIG_FILE, rules=["deep_search", "BOLA-*"])
+
+    assert first.to_dict() == second.to_dict() == fresh.to_dict()
+    assert not first.lgpd_issues
+    assert {issue.rule_id for issue in first.security_issues} <= {"BOLA-001"}
+
+
+def test_without_config_only_validators_run():
+    result = lokus.scan(PROBLEM_SPEC)
+
+    assert result.findings == []
+    assert result.security_issues
+
+
+def test_min_severity():
+    result = lokus.scan(PROBLEM_SPEC, CONFIG_FILE, min_severity="high")
+
+    assert all(issue.severity.value == "HIGH" for issue in result.lgpd_issues)
+
+
+def test_errors_raise_scan_error(tmp_path):
+    with pytest.raises(ScanError, match="Could not read"):
+        lokus.scan(str(tmp_path / "missing.yaml"), CONFIG_FILE)
+    with pytest.raises(ScanError, match="not a valid YAML dictionary"):
+        lokus.scan(b"- a\n- b\n", CONFIG_FILE)
+    with pytest.raises(ScanError):
+        lokus.scan(PROBLEM_SPEC, str(tmp_path / "missing-config.yaml"))
+    with pytest.raises(ScanError, match="Ruleset"):
+        lokus.scan(PROBLEM_SPEC, Ruleset({}), rules=["lgpd"])
+    with pytest.raises(ScanError, match="min_severity"):
+        Ruleset({}, min_severity="urgent")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+import json
+
+from lokus.baseline import (
+    FindingFilter,
+    fingerprint,
+    load_baseline,
+    normalize_path,
+    write_baseline,
+)
+from lokus.deep_search import deep_search_forbidden_keys
+from lokus.lgpd_validator import LGPDValidator
+from lokus.scanner import ScanResult
+from lokus.security_validator import SecurityValidator
+
+
+def test_fingerprint_is_stable_and_normalized():
+    assert normalize_path(".paths./users.get") == "paths./users.get"
+    assert fingerprint("BOLA-001", "paths./users.get") == fingerprint(
+        "BOLA-001", ".paths./users.get"
+    )
+    assert fingerprint("BOLA-001", "paths./users.get") != fingerprint(
+        "BFLA-001", "paths./users.get"
+    )
+    assert fingerprint("forbidden_key", "a.b", "b") != fingerprint(
+        "forbidden_key", "a.b", "c"
+    )
+
+
+def test_filter_severity_and_baseline():
+    known = fingerprint("BOLA-001", "paths./a.get")
+    finding_filter = FindingFilter("high", [known])
+    assert not finding_filter.accepts("RATE-001", "paths./a.get", severity="MEDIUM")
+    assert not finding_filter.accepts("BOLA-001", "paths./a.get", severity="HIGH")
+    assert finding_filter.accepts("BOLA-001", "paths./b.get", severity="HIGH")
+    assert finding_filter.suppressed == 1
+
+
+def test_validators_skip_rules_below_threshold(monkeypatch):
+    def fail(self, spec, ctx):
+        raise AssertionError("rule below threshold was run")
+
+    monkeypatch.setattr(
+        SecurityValidator, "_check_unrestricted_resource_consumption", fail
+    )
+    validator = SecurityValidator(finding_filter=FindingFilter("HIGH"))
+    issues = validator.validate_spec({"paths": {"/a": {"get": {}}}})
+    assert [issue.rule_id for issue in issues] == ["BOLA-001"]
+
+
+def test_deep_search_suppresses_baseline_findings():
+    config = {"forbidden_keys": ["password", "secret"]}
+    data = {"password": 1, "secret": 2}
+    finding_filter = FindingFilter(
+        baseline=[fingerprint("forbidden_key", "password", "password")]
+    )
+    findings = deep_search_forbidden_keys(
+        data, "", config, finding_filter=finding_filter
+    )
+    assert [finding["key"] for finding in findings] == ["secret"]
+    assert finding_filter.suppressed == 1
+
+
+def test_baseline_keeps_new_kinds_of_data_at_a_known_path():
+    validator = LGPDValidator()
+    before = {"info": {"description": "Contact maria@example.com"}}
+    after = {"info": {"description": "Contact maria@example.com, CPF 123.456.789-09"}}
+    known = ScanResult(lgpd_issues=validator.validate_spec(before)).fingerprints()
+
+    finding_filter = FindingFilter(baseline=known)
+    issues = validator.validate_spec(after, finding_filter)
+
+    keys = {issue.key for issue in issues}
+    assert "cpf" in keys
+    assert "email" not in keys
+    assert finding_filter.suppressed == 1
+
+
+def test_issue_key_survives_json_round_trip():
+    validator = LGPDValidator()
+    result = ScanResult(
+        lgpd_issues=validator.validate_spec(
+            {"info": {"description": "maria@example.com 123.456.789-09"}}
+        )
+    )
+
+    assert ScanResult.from_dict(result.to_dict()).fingerprints() == (
+        result.fingerprints()
+    )
+    assert len(result.fingerprints()) == len(result.lgpd_issues)
+
+
+def test_baseline_round_trip_and_json_report(tmp_path):
+    baseline_file = tmp_path / "baseline.json"
+    write_baseline(str(baseline_file), ["b", "a", "a"])
+    assert json.loads(baseline_file.read_text())["fingerprints"] == ["a", "b"]
+    assert load_baseline(str(baseline_file)) == {"a", "b"}
+
+    report_file = tmp_path / "report.json"
+    report_file.write_text(
+        json.dumps({"findings": [{"fingerprint": "x"}], "lgpd_issues": []})
+    )
+    assert load_baseline(str(report_file)) == {"x"}
+
+
+def test_load_baseline_missing_file(capsys):
+    assert load_baseline("non_existent_baseline.json") is None
+    assert "Error: Baseline file not found" in capsys.readouterr().out
+
+
+def test_load_baseline_reports_unreadable_paths(tmp_path, capsys):
+    assert load_baseline(str(tmp_path)) is None
+    assert "Could not read baseline file" in capsys.readouterr().out
+
+    binary = tmp_path / "baseline.json"
+    binary.write_bytes(b"\xff\xfe\x00")
+    assert load_baseline(str(binary)) is None
@@ -0,0 +1,106 @@
+import json
+
+import yaml
+from click.testing import CliRunner
+
+from benchmarks.cli import main
+from benchmarks.compare import compare_results
+from benchmarks.generator import SpecGenerator
+from benchmarks.suite import PHASES, run_suite
+from lokus.config_loader import load_config
+
+CONFIG_FILE = "tests/samples/config.yaml"
+
+
+def test_generator_is_deterministic_and_sized():
+    text = SpecGenerator(10, depth=2, anchor_reuse=0.5, seed=3).to_yaml()
+
+    assert text == SpecGenerator(10, depth=2, anchor_reuse=0.5, seed=3).to_yaml()
+    assert text != SpecGenerator(10, depth=2, anchor_reuse=0.5, seed=4).to_yaml()
+    # Shared responses are written once and referenced by alias
+    assert "&id" in text and "*id" in text
+    spec = yaml.safe_load(text)
+    operations = sum(len(path_item) for path_item in spec["paths"].values())
+    assert operations == 10
+    assert len(spec["components"]["schemas"]) == 2
+
+
+def test_suite_measures_every_phase(tmp_path):
+    results = run_suite(
+        load_config(CONFIG_FILE), (8,), PHASES, repeat=2, spec_dir=str(tmp_path)
+    )
+
+    [scenario] = results["scenarios"]
+    assert set(scenario["phases"]) == set(PHASES)
+    for measurement in scenario["phases"].values():
+        assert len(measurement["seconds"]) == 2
+        assert measurement["peak_memory_bytes"] > 0
+    assert scenario["entries"]["security_issues"] > 0
+
+
+def test_cli_prints_json(tmp_path):
+    result = CliRunner().invoke(
+        main,
+        [
+            "run",
+            "--size",
+            "4",
+            "--phase",
+            "deep_search",
+            "--no-memory",
+            "--config",
+            CONFIG_FILE,
+            "--spec-dir",
+            str(tmp_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    phases = json.loads(result.stdout)["scenarios"][0]["phases"]
+    assert list(phases) == ["deep_search"]
+    assert "peak_memory_bytes" not in phases["deep_search"]
+
+
+def _results(seconds, memory=None):
+    measurement = {
+        "seconds": seconds,
+        "median_seconds": sorted(seconds)[len(seconds) // 2],
+    }
+    if memory:
+        measurement["peak_memory_bytes"] = memory
+    return {"scenarios": [{"operations": 1000, "phases": {"lgpd": measurement}}]}
+
+
+def test_compare_ignores_noise_and_flags_regressions():
+    baseline = _results([0.9, 1.1, 1.0, 0.85, 1.15], memory=100)
+
+    # 15% slower, but within the noise of the baseline
+    [time_check, memory_check] = compare_results(
+        baseline, _results([1.15, 1.14, 1.16], memory=110)
+    )
+    assert not time_check.regressed and not memory_check.regressed
+
+    [time_check, memory_check] = compare_results(
+        baseline, _results([1.6, 1.62, 1.59], memory=150)
+    )
+    assert time_check.regressed and memory_check.regressed
+
+
+def test_cli_compare_exit_codes(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_results([1.0, 1.0, 1.01])))
+    same = tmp_path / "same.json"
+    same.write_text(json.dumps(_results([1.01, 1.0, 1.02])))
+    slower = tmp_path / "slower.json"
+    slower.write_text(json.dumps(_results([2.0, 2.1, 2.0])))
+
+    def compare(results):
+        return CliRunner().invoke(
+            main, ["compare", "--baseline", str(baseline), "--results", str(results)]
+        )
+
+    assert compare(same).exit_code == 0
+    result = compare(slower)
+    assert result.exit_code == 1
+    assert "REGRESSION" in result.output
+    assert compare(tmp_path / "missing.json").exit_code == 2
@@ -1,3 +1,4 @@
+import json
 import os
 
 import pytest
@@ -86,3 +87,101 @@ def test_version_flag(runner: CliRunner):
     result = runner.invoke(main, ["--version"])
     assert result.exit_code == 0
     assert "lokus, version " in result.output
+
+
+def test_only_option_limits_rules(runner: CliRunner, invalid_swagger_file):
+    """Test that --only restricts the report to the selected rules."""
+    result = runner.invoke(main, [invalid_swagger_file, "--json", "--only", "BOLA-*"])
+
+    output = json.loads(result.output)
+    assert output["findings"] == []
+    assert output["lgpd_issues"] == []
+    assert {issue["rule_id"] for issue in output["security_issues"]} == {"BOLA-001"}
+
+
+def test_skip_option_disables_validator(runner: CliRunner, invalid_swagger_file):
+    """Test that --skip accepts a validator name."""
+    result = runner.invoke(main, [invalid_swagger_file, "--json", "--skip", "lgpd"])
+
+    output = json.loads(result.output)
+    assert output["lgpd_issues"] == []
+    assert output["security_issues"]
+
+
+def test_baseline_suppresses_known_findings(
+    runner: CliRunner, invalid_swagger_file, tmp_path
+):
+    """Test that findings written to a baseline are suppressed on the next run."""
+    baseline_file = str(tmp_path / "baseline.json")
+    runner.invoke(main, [invalid_swagger_file, "--write-baseline", baseline_file])
+    result = runner.invoke(
+        main, [invalid_swagger_file, "--json", "--baseline", baseline_file]
+    )
+
+    output = json.loads(result.output)
+    assert output["findings"] == []
+    assert output["security_issues"] == []
+    assert output["lgpd_issues"] == []
+    assert output["suppressed_issues"] > 0
+
+
+def test_diff_reports_new_and_resolved_issues(
+    runner: CliRunner, valid_swagger_file, invalid_swagger_file
+):
+    """Test --diff between two specs."""
+    result = runner.invoke(
+        main, ["--json", "--diff", valid_swagger_file, invalid_swagger_file]
+    )
+
+    output = json.loads(result.output)
+    assert output["security_issues"] or output["lgpd_issues"] or output["findings"]
+    assert "resolved_issues" in output
+
+
+def test_diff_of_identical_specs_passes(runner: CliRunner, valid_swagger_file):
+    """Test --diff with no changes reports nothing."""
+    result = runner.invoke(main, ["--diff", valid_swagger_file, valid_swagger_file])
+
+    assert result.exit_code == 0
+    assert "STATUS: VALIDATION PASSED" in result.output
+
+
+def test_diff_rejects_swagger_file(runner: CliRunner, valid_swagger_file):
+    """Test that --diff cannot be combined with SWAGGER_FILE."""
+    result = runner.invoke(
+        main, [valid_swagger_file, "--diff", valid_swagger_file, valid_swagger_file]
+    )
+    assert result.exit_code == 2
+
+
+def test_pre_commit_scans_only_openapi_files(
+    runner: CliRunner, valid_swagger_file, invalid_swagger_file, config_file
+):
+    """Test that pre-commit skips non-OpenAPI files and prints one line per issue."""
+    result = runner.invoke(
+        main,
+        [
+            "pre-commit",
+            "--config",
+            config_file,
+            valid_swagger_file,
+            invalid_swagger_file,
+            config_file,
+            "README.md",
+        ],
+    )
+
+    lines = result.output.splitlines()
+    assert result.exit_code == 1
+    assert lines
+    assert all(line.startswith(f"{invalid_swagger_file}:") for line in lines)
+    # file:line:column, so editors can jump to each issue
+    assert lines[0].split(": [")[0].count(":") == 2
+
+
+def test_pre_commit_without_specs_passes(runner: CliRunner, config_file):
+    """Test that pre-commit is silent when no OpenAPI document is staged."""
+    result = runner.invoke(main, ["pre-commit", config_file, "README.md"])
+
+    assert result.exit_code == 0
+    assert result.output == ""
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 import os
+import sys
 
 import pytest
 import yaml  # For creating test fixture content
+from click.testing import CliRunner
 
+from lokus import config_loader
+from lokus.cli import main
 from lokus.config_loader import load_config
 
 FIXTURES_DIR = "tests/fixtures"
@@ -159,3 +163,107 @@ def test_load_config_missing_section(tmp_path):
     assert config["forbidden_key_patterns"] == []  # Should default to empty list
     assert config["forbidden_keys_at_paths"] == []
     assert config["allowed_exceptions"] == []
+
+
+def test_extends_builtin_profile(tmp_path):
+    with open("templates/configs/enterprise.yaml", encoding="utf-8") as f:
+        enterprise = yaml.safe_load(f)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "extends: enterprise\nforbidden_keys: [legacyToken, apiKey]\n"
+    )
+
+    config = load_config(str(config_file), cache_dir=None)
+
+    assert config["forbidden_key_patterns"] == enterprise["forbidden_key_patterns"]
+    assert config["forbidden_keys"][-1] == "legacyToken"
+    # Entries already in the profile are not repeated
+    assert config["forbidden_keys"].count("apiKey") == 1
+    assert "extends" not in config
+
+
+def test_extends_local_files_in_order(tmp_path):
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "base.yaml").write_text(
+        "forbidden_keys: [baseKey]\nlimits: {rule_timeout: 10, max_depth: 50}\n"
+    )
+    (tmp_path / "team.yaml").write_text(
+        "extends: shared/base.yaml\nforbidden_keys: [teamKey]\nrules: {skip: [LGPD-005]}\n"
+    )
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "extends: [team.yaml]\nforbidden_keys: [ownKey]\nlimits: {rule_timeout: 2}\n"
+    )
+
+    config = load_config(str(config_file), cache_dir=None)
+
+    assert config["forbidden_keys"] == ["baseKey", "teamKey", "ownKey"]
+    assert config["limits"] == {"rule_timeout": 2, "max_depth": 50}
+    assert config["rules"] == {"skip": ["LGPD-005"]}
+
+
+def test_extends_cycle_is_an_error(tmp_path, capsys):
+    (tmp_path / "a.yaml").write_text("extends: b.yaml\n")
+    (tmp_path / "b.yaml").write_text("extends: a.yaml\n")
+
+    assert load_config(str(tmp_path / "a.yaml"), cache_dir=None) is None
+    assert "extends itself" in capsys.readouterr().out
+
+
+def test_extends_unknown_entry_is_an_error(tmp_path, capsys):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("extends: enterprize\n")
+
+    assert load_config(str(config_file), cache_dir=None) is None
+    assert "neither a file nor a built-in profile" in capsys.readouterr().out
+
+
+def test_extended_config_is_cached_until_a_file_changes(tmp_path, monkeypatch, capsys):
+    cache_dir = str(tmp_path / "cache")
+    base = tmp_path / "base.yaml"
+    base.write_text("forbidden_keys: [baseKey]\nunknown: 1\n")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("extends: base.yaml\n")
+
+    files = []
+    first = load_config(str(config_file), cache_dir, files=files)
+    first_output = capsys.readouterr().out
+    assert sorted(files) == sorted(
+        os.path.realpath(str(path)) for path in (base, config_file)
+    )
+
+    def fail(*args):
+        raise AssertionError("the chain was loaded again")
+
+    monkeypatch.setattr(config_loader, "_load_config_chain", fail)
+    assert load_config(str(config_file), cache_dir) == first
+    # The warnings of the first load are repeated
+    assert capsys.readouterr().out == first_output
+    assert "Unknown top-level key 'unknown'" in first_output
+
+    monkeypatch.undo()
+    base.write_text("forbidden_keys: [otherKey]\n")
+    assert load_config(str(config_file), cache_dir)["forbidden_keys"] == ["otherKey"]
+
+
+def test_extended_config_is_not_cached_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "base.yaml").write_text("forbidden_keys: [baseKey]\n")
+    (tmp_path / "config.yaml").write_text("extends: base.yaml\n")
+
+    assert load_config("config.yaml")["forbidden_keys"] == ["baseKey"]
+    assert sorted(os.listdir(tmp_path)) == ["base.yaml", "config.yaml"]
+
+
+def test_cli_caches_extended_config_per_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(sys, "platform", "linux")
+    (tmp_path / "base.yaml").write_text("forbidden_keys: [baseKey]\n")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("extends: base.yaml\n")
+
+    CliRunner().invoke(
+        main, ["tests/samples/sample_clean_spec.yaml", "--config", str(config_file)]
+    )
+
+    assert os.listdir(tmp_path / "cache" / "lokus" / "configs")
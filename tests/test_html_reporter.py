@@ -0,0 +1,83 @@
+import io
+import os
+import time
+
+from click.testing import CliRunner
+
+from lokus.cli import main
+from lokus.html_reporter import write_html
+from lokus.security_validator import SecurityIssue, SecurityIssueSeverity
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+
+def _issues(count, rules=("BOLA-001", "AUTH-001")):
+    return [
+        SecurityIssue(
+            rule_id=rules[i % len(rules)],
+            title="Missing <Authorization>",
+            description=f"Endpoint /users{i} lacks authorization",
+            severity=SecurityIssueSeverity.HIGH,
+            path=f"paths./users{i}.get",
+            recommendation="Add security requirements",
+            reference="javascript:alert(1)",
+        )
+        for i in range(count)
+    ]
+
+
+def test_sections_per_rule_and_escaping():
+    out = io.StringIO()
+    findings = [
+        {"type": "forbidden_key", "path": "a", "message": "m"},
+        {"type": "forbidden_key_pattern", "path": "b", "message": "m"},
+        {"type": "forbidden_key", "path": "c", "message": "m"},
+    ]
+
+    write_html(out, "api.yaml", findings, _issues(5), [])
+
+    html = out.getvalue()
+    # Interleaved entries still get a single section per rule
+    assert html.count("<details>") == 4
+    assert (
+        "forbidden_key (2)" in html
+        and "BOLA-001: Missing &lt;Authorization&gt; (3)" in html
+    )
+    assert 'href="javascript' not in html
+    assert html.rstrip().endswith("</html>")
+
+
+def test_entries_can_be_generators():
+    out = io.StringIO()
+    findings = ({"type": "forbidden_key", "path": p, "message": "m"} for p in "ab")
+
+    write_html(out, "api.yaml", findings, iter(_issues(3)), iter([]))
+
+    html = out.getvalue()
+    assert "forbidden_key (2)" in html
+    assert "BOLA-001: Missing &lt;Authorization&gt; (2)" in html
+    assert "<tr><th>Total Security Issues</th><td>3</td></tr>" in html
+    assert "No LGPD compliance issues identified." in html
+
+
+def test_large_report_is_fast():
+    start = time.perf_counter()
+    out = io.StringIO()
+
+    write_html(out, "api.yaml", [], _issues(100000, [f"R-{i}" for i in range(20)]))
+
+    assert time.perf_counter() - start < 10
+    assert out.getvalue().count("<tr>") >= 100000
+
+
+def test_cli_writes_html_report(tmp_path):
+    report = tmp_path / "report.html"
+
+    result = CliRunner().invoke(
+        main, [PROBLEM_SPEC, "--config", CONFIG_FILE, "--html", str(report)]
+    )
+
+    assert result.exit_code == 1  # Issues found
+    assert "BOLA-001" in report.read_text(encoding="utf-8")
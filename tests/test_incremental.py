@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+import os
+import subprocess
+
+import pytest
+import yaml
+
+from lokus.incremental import (
+    ResultCache,
+    external_ref_files,
+    find_spec_files,
+    git_changed_files,
+    scan_settings_key,
+)
+from lokus.limits import ScanLimits
+from lokus.scanner import ScanResult
+from lokus.security_validator import SecurityIssue, SecurityIssueSeverity
+
+
+@pytest.fixture
+def spec_tree(tmp_path):
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "openapi.yaml").write_text(
+        yaml.dump(
+            {
+                "openapi": "3.0.0",
+                "paths": {
+                    "/users": {"get": {"$ref": "../shared/operations.yaml#/getUsers"}}
+                },
+            }
+        )
+    )
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "operations.yaml").write_text(
+        yaml.dump({"getUsers": {"$ref": "schemas.yaml#/User"}})
+    )
+    (tmp_path / "shared" / "schemas.yaml").write_text(yaml.dump({"User": {}}))
+    (tmp_path / "config.yaml").write_text(yaml.dump({"forbidden_keys": []}))
+    return tmp_path
+
+
+def _sample_result():
+    return ScanResult(
+        findings=[{"path": "a", "key": "a", "type": "forbidden_key", "message": "m"}],
+        security_issues=[
+            SecurityIssue(
+                rule_id="BOLA-001",
+                title="Missing Authorization",
+                description="d",
+                severity=SecurityIssueSeverity.HIGH,
+                path="paths./a.get",
+                recommendation="r",
+                reference="ref",
+            )
+        ],
+    )
+
+
+def test_find_spec_files_sniffs_directories(spec_tree):
+    assert find_spec_files([str(spec_tree)]) == [
+        str(spec_tree / "api" / "openapi.yaml")
+    ]
+
+
+def test_find_spec_files_sniffs_late_version_keys(tmp_path):
+    minified = tmp_path / "minified.json"
+    minified.write_text('{"info":{"title":"t"},"openapi":"3.0.0","paths":{}}')
+    long_info = tmp_path / "long_info.yaml"
+    long_info.write_text(
+        yaml.dump(
+            {"info": {"description": "x" * 8192}, "openapi": "3.0.0"},
+            sort_keys=False,
+        )
+    )
+    # Mentions openapi, but not as a top-level key
+    (tmp_path / "other.yaml").write_text("tools: [{name: lint, openapi: true}]\n")
+
+    assert find_spec_files([str(tmp_path)]) == [str(long_info), str(minified)]
+
+
+def test_external_ref_files_are_transitive(spec_tree):
+    spec_path = spec_tree / "api" / "openapi.yaml"
+    spec_data = yaml.safe_load(spec_path.read_text())
+    assert external_ref_files(spec_data, str(spec_path)) == [
+        os.path.realpath(spec_tree / "shared" / "operations.yaml"),
+        os.path.realpath(spec_tree / "shared" / "schemas.yaml"),
+    ]
+
+
+def test_external_ref_files_respects_limits(spec_tree):
+    spec_path = spec_tree / "api" / "openapi.yaml"
+    spec_data = yaml.safe_load(spec_path.read_text())
+    (spec_tree / "shared" / "operations.yaml").write_text(
+        yaml.dump({"getUsers": {"$ref": "schemas.yaml#/User"}, "padding": "x" * 4096})
+    )
+
+    # The oversized fragment is tracked but not followed
+    assert external_ref_files(
+        spec_data, str(spec_path), ScanLimits(max_bytes=1024)
+    ) == [os.path.realpath(spec_tree / "shared" / "operations.yaml")]
+
+
+def test_result_cache_round_trip_and_invalidation(spec_tree):
+    spec_path = str(spec_tree / "api" / "openapi.yaml")
+    ref_file = str(spec_tree / "shared" / "schemas.yaml")
+    cache = ResultCache(str(spec_tree / ".cache"), scan_settings_key({}))
+
+    assert cache.get(spec_path) is None
+    cache.put(spec_path, [ref_file], _sample_result())
+    assert cache.get(spec_path) == _sample_result()
+
+    # Changing a referenced file invalidates the entry
+    (spec_tree / "shared" / "schemas.yaml").write_text("User: {type: object}\n")
+    assert cache.get(spec_path) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_scan_settings_key_depends_on_settings():
+    assert scan_settings_key({"a": 1}) == scan_settings_key({"a": 1})
+    assert scan_settings_key({"a": 1}) != scan_settings_key({"a": 2})
+    assert scan_settings_key({}, min_severity="HIGH") != scan_settings_key({})
+
+
+def test_git_changed_files(spec_tree):
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=spec_tree,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+    (spec_tree / "shared" / "schemas.yaml").write_text("User: {}\nOther: {}\n")
+    (spec_tree / "new.yaml").write_text("openapi: 3.0.0\n")
+
+    changed = git_changed_files("HEAD", str(spec_tree))
+    assert changed == {
+        os.path.realpath(spec_tree / "shared" / "schemas.yaml"),
+        os.path.realpath(spec_tree / "new.yaml"),
+    }
+
+
+def test_git_changed_files_bad_ref(spec_tree, capsys):
+    subprocess.run(["git", "init", "-q"], cwd=spec_tree, check=True)
+    assert git_changed_files("no-such-ref", str(spec_tree)) is None
+    assert "Error: git failed" in capsys.readouterr().out
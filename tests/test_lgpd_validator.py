@@ -2,6 +2,7 @@
 import pytest
 
 from lokus.lgpd_validator import LGPDValidator
+from lokus.schema_index import SchemaIndex
 
 
 @pytest.fixture
@@ -169,3 +170,114 @@ def test_clean_spec(lgpd_validator):
     }
     issues = lgpd_validator.validate_spec(spec)
     assert len(issues) == 0
+
+
+def test_data_minimization_attributes_referenced_schema_usages(lgpd_validator):
+    spec = {
+        "paths": {
+            "/users": {
+                "post": {
+                    "description": "Create a user",
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/User"}
+                            }
+                        }
+                    },
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "User": {
+                    "type": "object",
+                    "properties": {"nickname": {"type": "string"}},
+                }
+            }
+        },
+    }
+    issues = lgpd_validator.validate_spec(spec)
+    assert len(issues) == 1
+    assert issues[0].path == "components.schemas.User.properties.nickname"
+    assert (
+        "paths./users.post.requestBody.content.application/json.schema"
+        in issues[0].description
+    )
+
+
+def test_data_minimization_all_of_required_and_non_dict_properties(lgpd_validator):
+    spec = {
+        "components": {
+            "schemas": {
+                "Base": {
+                    "type": "object",
+                    "properties": {"id": {"type": "string", "description": "ID"}},
+                },
+                "Extended": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Base"},
+                        {
+                            "type": "object",
+                            "properties": {
+                                "code": {"type": "string"},
+                                "flag": True,
+                            },
+                        },
+                    ],
+                    "required": ["code"],
+                },
+            }
+        }
+    }
+    issues = lgpd_validator.validate_spec(spec)
+    assert [issue.path for issue in issues] == [
+        "components.schemas.Extended.allOf[1].properties.flag"
+    ]
+
+
+def test_data_minimization_only_checks_declared_objects(lgpd_validator):
+    spec = {
+        "components": {
+            "schemas": {
+                "Untyped": {"properties": {"nickname": {"type": "string"}}},
+                "Nullable": {
+                    "type": ["object", "null"],
+                    "properties": {"nickname": {"type": "string"}},
+                },
+            }
+        }
+    }
+    assert lgpd_validator.validate_spec(spec) == []
+
+
+def test_schema_index_records_each_usage_once():
+    shared = {"$ref": "#/components/schemas/Error"}
+    spec = {
+        "paths": {
+            f"/r{i}": {"get": {"responses": {"500": {"schema": shared}}}}
+            for i in range(3)
+        },
+        "components": {"schemas": {"Error": {"type": "object"}}},
+    }
+    spec["paths"]["/r0"]["post"] = {"responses": {"500": {"schema": shared}}}
+
+    entry = SchemaIndex(spec).get(spec["components"]["schemas"]["Error"])
+    assert list(entry.usages) == [
+        "paths./r0.get.responses.500.schema",
+        "paths./r0.post.responses.500.schema",
+        "paths./r1.get.responses.500.schema",
+        "paths./r2.get.responses.500.schema",
+    ]
+
+
+def test_data_minimization_ignores_examples(lgpd_validator):
+    spec = {
+        "components": {
+            "examples": {
+                "Sample": {"value": {"type": "object", "properties": {"a": {}}}}
+            }
+        }
+    }
+    issues = lgpd_validator.validate_spec(spec)
+    assert issues == []
@@ -0,0 +1,115 @@
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from lokus import limits as limits_module
+from lokus.api import Ruleset, ScanError, read_spec
+from lokus.cli import main
+from lokus.config_loader import load_config
+from lokus.limits import LimitExceeded, ScanLimits
+from lokus.yaml_parser import load_swagger_spec, parse_swagger_spec
+
+SAMPLES_DIR = "tests/samples"
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+BILLION_LAUGHS = """
+openapi: 3.0.0
+a: &a [x, x, x, x, x, x, x, x, x, x]
+b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a, *a]
+c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b, *b]
+d: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c, *c]
+e: [*d, *d, *d, *d, *d, *d, *d, *d, *d, *d]
+"""
+
+
+@pytest.fixture
+def every_tick_checks_time(monkeypatch):
+    monkeypatch.setattr(limits_module, "CHECK_INTERVAL", 1)
+
+
+def test_max_bytes_rejects_file_before_parsing(capsys):
+    limits = ScanLimits(max_bytes=100)
+
+    assert load_swagger_spec(PROBLEM_SPEC, limits) is None
+    assert "Limit exceeded" in capsys.readouterr().out
+    with pytest.raises(ScanError, match="max_bytes"):
+        read_spec(PROBLEM_SPEC, limits)
+
+
+def test_aliases_count_as_expanded_nodes():
+    # About 70 nodes as written, over 120000 once the aliases expand
+    with pytest.raises(LimitExceeded) as error:
+        parse_swagger_spec(BILLION_LAUGHS, limits=ScanLimits(max_nodes=100000))
+    assert error.value.limit == "max_nodes"
+
+    assert parse_swagger_spec(BILLION_LAUGHS, limits=ScanLimits(max_nodes=200000))
+
+
+def test_max_depth():
+    nested = "openapi: 3.0.0\nx: " + "[" * 50 + "]" * 50
+
+    with pytest.raises(LimitExceeded, match="max_depth"):
+        parse_swagger_spec(nested, limits=ScanLimits(max_depth=20))
+    assert parse_swagger_spec(nested, limits=ScanLimits(max_depth=60))
+
+
+def test_config_limits_are_validated(tmp_path, capsys):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "limits:\n  max_bytes: 1000\n  max_nodes: -1\n  scan_timeout: 0.5\n  bogus: 1\n"
+    )
+
+    config_data = load_config(str(config_file))
+
+    assert config_data["limits"] == {"max_bytes": 1000, "scan_timeout": 0.5}
+    assert "limits.max_nodes" in capsys.readouterr().out
+    assert Ruleset(config_data).limits == ScanLimits(max_bytes=1000, scan_timeout=0.5)
+
+
+def test_rule_timeout_keeps_partial_results(every_tick_checks_time):
+    spec = read_spec(PROBLEM_SPEC)
+    full = Ruleset({}).scan(spec)
+
+    result = Ruleset({"limits": {"rule_timeout": 1e-9}}).scan(spec)
+
+    assert result.limits_exceeded
+    assert "rule_timeout" in result.limits_exceeded[0]
+    # Each rule keeps what it found before running out of time
+    assert len(result.security_issues) < len(full.security_issues)
+    assert result.to_dict()["status"] == "limit_exceeded"
+
+
+def test_rule_timeout_cuts_off_security_rules(every_tick_checks_time):
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {f"/items/{i}": {"get": {"responses": {}}} for i in range(100)},
+    }
+    full = Ruleset({}, only=["BOLA-001"]).scan(spec)
+
+    result = Ruleset({"limits": {"rule_timeout": 1e-9}}, only=["BOLA-001"]).scan(spec)
+
+    assert len(full.security_issues) == 100
+    assert len(result.security_issues) < 100
+    assert any("BOLA-001" in message for message in result.limits_exceeded)
+
+
+def test_scan_timeout_stops_remaining_rules(every_tick_checks_time):
+    result = Ruleset({"limits": {"scan_timeout": 1e-9}}).scan(read_spec(PROBLEM_SPEC))
+
+    assert not result.security_issues
+    assert any("were not run" in message for message in result.limits_exceeded)
+
+
+def test_cli_reports_limit_exceeded(tmp_path, every_tick_checks_time):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("limits:\n  scan_timeout: 0.000001\n")
+
+    result = CliRunner().invoke(
+        main, [PROBLEM_SPEC, "--config", str(config_file), "--json"]
+    )
+
+    output = json.loads(result.output)
+    assert output["status"] == "limit_exceeded"
+    assert output["limits_exceeded"]
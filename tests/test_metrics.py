@@ -0,0 +1,115 @@
+import json
+import os
+
+from click.testing import CliRunner
+
+from lokus.api import Ruleset
+from lokus.cli import main
+from lokus.config_loader import load_config
+from lokus.metrics import RunMetrics, resolve_metrics_format
+from lokus.yaml_parser import load_swagger_spec
+
+SAMPLES_DIR = "tests/samples"
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+CONFIG = os.path.join(SAMPLES_DIR, "config.yaml")
+
+
+def _scan_with_metrics():
+    metrics = RunMetrics()
+    ruleset = Ruleset(load_config(CONFIG))
+    result = ruleset.scan(load_swagger_spec(PROBLEM_SPEC), metrics)
+    return metrics, result
+
+
+def test_scan_collects_rules_phases_and_findings():
+    metrics, result = _scan_with_metrics()
+
+    assert metrics.specs_scanned == 1
+    assert metrics.nodes_visited > 0
+    assert {"deep_search", "security", "lgpd"} <= set(metrics.phase_seconds)
+    assert "deep_search" in metrics.rule_seconds
+    assert "BOLA-001" in metrics.rule_seconds
+    reported = (
+        len(result.findings) + len(result.security_issues) + len(result.lgpd_issues)
+    )
+    assert sum(metrics.findings.values()) == reported
+    assert metrics.scan_seconds.count == 1
+
+
+def test_prometheus_output():
+    metrics, _ = _scan_with_metrics()
+    text = metrics.to_prometheus()
+
+    assert "# TYPE lokus_specs_scanned_total counter" in text
+    assert "lokus_specs_scanned_total 1" in text
+    assert 'lokus_rule_seconds_total{rule="deep_search"}' in text
+    assert 'lokus_scan_seconds_bucket{le="+Inf"} 1' in text
+    assert "lokus_scan_seconds_count 1" in text
+
+
+def test_metrics_format_follows_extension():
+    assert resolve_metrics_format("out.json") == "json"
+    assert resolve_metrics_format("out.prom") == "prometheus"
+    assert resolve_metrics_format("out.json", "prometheus") == "prometheus"
+
+
+def test_cli_writes_metrics_file(tmp_path):
+    path = tmp_path / "metrics.json"
+    result = CliRunner().invoke(
+        main,
+        ["scan", PROBLEM_SPEC, "--config", CONFIG, "--metrics-file", str(path)],
+    )
+
+    assert result.exit_code == 1, result.output
+    data = json.loads(path.read_text())
+    assert data["specs_scanned"] == 1
+    assert data["nodes_visited"] > 0
+    assert {"load", "deep_search", "report"} <= set(data["phase_seconds"])
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_cli_diff_counts_one_spec(tmp_path):
+    path = tmp_path / "metrics.json"
+    clean_spec = os.path.join(SAMPLES_DIR, "sample_clean_spec.yaml")
+    result = CliRunner().invoke(
+        main,
+        [
+            "scan",
+            "--diff",
+            PROBLEM_SPEC,
+            clean_spec,
+            "--config",
+            CONFIG,
+            "--metrics-file",
+            str(path),
+        ],
+    )
+
+    data = json.loads(path.read_text())
+    assert data["specs_scanned"] == 1, result.output
+    assert "diff_old" in data["phase_seconds"]
+
+
+def test_pattern_profile_counts_calls_and_hits():
+    metrics = RunMetrics(profile_patterns=True)
+    config_data = {"forbidden_key_patterns": [".*_token$", ".*unused.*"]}
+    spec = {"openapi": "3.0.0", "info": {"access_token": "x", "other": "y"}}
+
+    Ruleset(config_data, only=("deep_search",)).scan(spec, metrics)
+
+    token = metrics.patterns[".*_token$"]
+    assert token.hits == 1
+    assert token.calls == metrics.patterns[".*unused.*"].calls > 0
+    assert metrics.patterns[".*unused.*"].hits == 0
+    assert "pattern_hits_total" in metrics.to_prometheus()
+    assert ".*_token$" in metrics.format_profile()
+
+
+def test_cli_profile_goes_to_stderr():
+    result = CliRunner().invoke(
+        main, ["scan", PROBLEM_SPEC, "--config", CONFIG, "--json", "--profile"]
+    )
+
+    assert result.exit_code == 1, result.output
+    json.loads(result.stdout)
+    assert "Profile: forbidden key pattern cost" in result.stderr
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from lokus import parallel
+from lokus.api import Ruleset, read_spec
+from lokus.cli import main
+from lokus.config_loader import load_config
+from lokus.parallel import partition_units, scan_parallel, split_spec
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+
+@pytest.fixture
+def large_spec():
+    """The problem sample plus many operations sharing a few schemas."""
+    spec = read_spec(PROBLEM_SPEC)
+    for i in range(60):
+        spec["paths"][f"/users{i}/{{id}}"] = {
+            "get": {
+                "description": "Contact joe@example.com",
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/User{i % 5}"}
+                            }
+                        },
+                    }
+                },
+            },
+            "put": {"security": [{"key": []}], "responses": {"429": {}}},
+        }
+    schemas = spec.setdefault("components", {}).setdefault("schemas", {})
+    for i in range(5):
+        schemas[f"User{i}"] = {
+            "type": "object",
+            "properties": {
+                "password": {"type": "string", "example": "123.456.789-00"},
+                "secretKey": {"type": "string"},
+            },
+        }
+    return spec
+
+
+def test_split_spec_keeps_paths_and_order(large_spec):
+    chunks = split_spec(large_spec, 7)
+
+    assert len(chunks) == 7
+    rejoined = [unit for chunk in chunks for unit in partition_units(chunk)]
+    assert rejoined == partition_units(large_spec)
+
+
+@pytest.mark.parametrize("options", [{}, {"only": ["lgpd"]}, {"min_severity": "HIGH"}])
+def test_parallel_matches_single_process(large_spec, options):
+    ruleset = Ruleset(load_config(CONFIG_FILE), **options)
+
+    expected = ruleset.scan(large_spec)
+    result = scan_parallel(large_spec, ruleset, workers=2)
+
+    assert result.to_dict() == expected.to_dict()
+
+
+def test_parallel_applies_baseline_once(large_spec):
+    config_data = load_config(CONFIG_FILE)
+    known = Ruleset(config_data).scan(large_spec).fingerprints()
+    ruleset = Ruleset(config_data, baseline=known)
+
+    expected = ruleset.scan(large_spec)
+    result = scan_parallel(large_spec, ruleset, workers=2)
+
+    assert not result.has_issues
+    assert result.suppressed_count == expected.suppressed_count
+
+
+def test_cli_jobs_matches_default(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_UNITS", 1)
+    runner = CliRunner()
+    args = [PROBLEM_SPEC, "--config", CONFIG_FILE, "--json"]
+
+    assert (
+        runner.invoke(main, args + ["--jobs", "2"]).output
+        == runner.invoke(main, args).output
+    )
@@ -0,0 +1,60 @@
+import pytest
+import yaml
+
+from lokus import pattern_check
+from lokus.config_loader import load_config
+from lokus.pattern_check import adversarial_keys, check_pattern
+
+
+@pytest.mark.parametrize(
+    "pattern", [r"(a+)+", r"(\w+\s?)*$", r"(\w+_)*x", r"api_([a-z]+)*$"]
+)
+def test_nested_quantifiers_are_flagged(pattern):
+    problems = check_pattern(pattern)
+
+    assert any("nested quantifiers" in problem for problem in problems)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r".*_token$", r"^api_.*_secret$", r"(\.[a-z]+)*", r"([a-z]+\.)*com", r"[a-z]+"],
+)
+def test_common_patterns_pass(pattern):
+    assert check_pattern(pattern) == ()
+
+
+def test_builtin_templates_pass():
+    for name in ("basic-config", "enterprise", "lgpd-focused", "strict-security"):
+        with open(f"templates/configs/{name}.yaml", encoding="utf-8") as f:
+            patterns = yaml.safe_load(f).get("forbidden_key_patterns", [])
+        assert all(check_pattern(pattern) == () for pattern in patterns)
+
+
+def test_slow_pattern_is_timed(monkeypatch):
+    # Bounded repeats are not flagged statically, only by their timing
+    monkeypatch.setattr(pattern_check, "SLOW_PATTERN_SECONDS", 0.0)
+
+    problems = pattern_check.check_pattern.__wrapped__(r"(.*a){3}")
+
+    assert len(problems) == 1
+    assert "ms to reject" in problems[0]
+
+
+def test_adversarial_keys_follow_literal_prefix():
+    keys = adversarial_keys(r"api_(a+)+")
+
+    assert keys[0].startswith("api_aaaaaa")
+    assert adversarial_keys(r".*_token$") == []
+
+
+def test_load_config_warns_about_slow_patterns(tmp_path, capsys):
+    config = tmp_path / "config.yaml"
+    config.write_text('forbidden_key_patterns: ["(a+)+b", ".*_token$"]\n')
+
+    config_data = load_config(str(config))
+
+    out = capsys.readouterr().out
+    assert "Warning: Pattern '(a+)+b' at index 0" in out
+    assert ".*_token$" not in out
+    # The pattern is still applied
+    assert config_data["forbidden_key_patterns"] == ["(a+)+b", ".*_token$"]
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from lokus.cli import main
+from lokus.pdf_jobs import PdfRenderer, validate_pdf_name
+from lokus.scanner import ScanResult
+from lokus.security_validator import SecurityIssue, SecurityIssueSeverity
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+
+def _result():
+    return ScanResult(
+        findings=[{"path": "a", "key": "a", "type": "forbidden_key", "message": "m"}],
+        security_issues=[
+            SecurityIssue(
+                rule_id="BOLA-001",
+                title="Missing Authorization",
+                description="d",
+                severity=SecurityIssueSeverity.HIGH,
+                path="paths./a.get",
+                recommendation="r",
+                reference="ref",
+            )
+        ],
+    )
+
+
+def test_pdf_name_templates():
+    validate_pdf_name("{stem}-{timestamp}.pdf")
+    with pytest.raises(ValueError, match="Unknown field"):
+        validate_pdf_name("{spec}.pdf")
+    with pytest.raises(ValueError, match="Invalid"):
+        validate_pdf_name("{stem.pdf")
+
+    renderer = PdfRenderer("out", "{stem}.pdf")
+    assert renderer.output_path("a/api.yaml") == os.path.join("out", "api.pdf")
+    assert renderer.output_path("b/api.yaml") == os.path.join("out", "api-2.pdf")
+
+
+def test_batch_reports_render_on_workers(tmp_path):
+    renderer = PdfRenderer(str(tmp_path / "reports"), batch=True, workers=2)
+
+    paths = [renderer.submit(spec, _result()) for spec in ("a.yaml", "b.yaml")]
+
+    assert renderer.wait()
+    assert [os.path.basename(path).split("-")[1] for path in paths] == ["a", "b"]
+    for path in paths:
+        with open(path, "rb") as f:
+            assert f.read(5) == b"%PDF-"
+
+
+def test_cli_writes_pdf_to_output_dir(tmp_path):
+    out_dir = tmp_path / "reports"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            PROBLEM_SPEC,
+            "--config",
+            CONFIG_FILE,
+            "--pdf",
+            "--pdf-dir",
+            str(out_dir),
+            "--pdf-name",
+            "{stem}.pdf",
+        ],
+    )
+
+    assert result.exit_code == 1  # Issues found, PDF written
+    assert os.listdir(out_dir) == ["sample_problem_spec.pdf"]
+    # The text report comes first; the PDF is only waited for at the end
+    assert result.output.index("PDF report") > result.output.index("BOLA-001")
+
+
+def test_cli_failed_pdf_is_an_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(PdfRenderer, "wait", lambda self: False)
+    clean_spec = os.path.join(SAMPLES_DIR, "sample_clean_spec.yaml")
+
+    result = CliRunner().invoke(
+        main,
+        [clean_spec, "--config", CONFIG_FILE, "--pdf", "--pdf-dir", str(tmp_path)],
+    )
+
+    assert result.exit_code == 1
@@ -0,0 +1,80 @@
+import glob
+import io
+import os
+import re
+
+import pytest
+
+from lokus import pdf_reporter as pdf_module
+from lokus.pdf_reporter import pdf_reporter, render_pdf, write_pdf
+from lokus.scanner import ScanResult
+from lokus.security_validator import SecurityIssue, SecurityIssueSeverity
+
+
+def _issues(count):
+    return [
+        SecurityIssue(
+            rule_id="BOLA-001",
+            title="Missing Authorization",
+            description=f"Endpoint /users{i}/{{id}} GET lacks proper authorization requirements",
+            severity=SecurityIssueSeverity.HIGH,
+            path=f"paths./users{i}/{{id}}.get",
+            recommendation="Add security requirements to the endpoint",
+            reference="https://owasp.org/API-Security/editions/2023/en/0xa1-broken-object-level-authorization/",
+        )
+        for i in range(count)
+    ]
+
+
+def _page_count(tmp_path):
+    [report] = glob.glob(str(tmp_path / "lokus_report-*.pdf"))
+    with open(report, "rb") as f:
+        pages = len(re.findall(rb"/Type /Page\b", f.read()))
+    return pages
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_pdf_is_generated(tmp_path, monkeypatch, compact):
+    monkeypatch.chdir(tmp_path)
+    findings = [{"path": "info.contact.email", "key": "email", "type": "forbidden_key"}]
+
+    pdf_reporter("api.yaml", findings, _issues(3), [], compact=compact)
+
+    assert _page_count(tmp_path) >= 4
+
+
+def test_compact_mode_is_chosen_above_threshold(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pdf_module, "COMPACT_THRESHOLD", 10)
+
+    pdf_reporter("api.yaml", [], _issues(60), [])
+
+    # 60 cards take about twenty pages; grouped rows fit in a few
+    assert _page_count(tmp_path) <= 6
+
+
+def test_assets_are_built_once_and_logo_comes_from_the_package(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pdf_module._logo.cache_clear()
+
+    pdf_reporter("api.yaml", [], _issues(1), [])
+    pdf_reporter("api.yaml", [], _issues(1), [])
+
+    # Found outside the repository root, and parsed only on the first report
+    assert pdf_module._logo() is not None
+    assert pdf_module._logo.cache_info().misses == 1
+    assert pdf_module._paragraph_styles() is pdf_module._paragraph_styles()
+    assert pdf_module._table_style("summary") is pdf_module._table_style("summary")
+
+
+def test_render_pdf_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = ScanResult(security_issues=_issues(2))
+
+    data = render_pdf(result)
+    stream = io.BytesIO()
+    write_pdf(result, stream, "api.yaml")
+
+    assert data.startswith(b"%PDF-") and stream.getvalue().startswith(b"%PDF-")
+    # Nothing is written to disk
+    assert os.listdir(tmp_path) == []
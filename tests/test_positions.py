@@ -0,0 +1,61 @@
+import json
+import os
+
+from click.testing import CliRunner
+
+from lokus.cli import main
+from lokus.positions import PositionIndex
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+SPEC = """openapi: 3.0.0
+paths:
+  /v1.0/users:
+    get:
+      parameters:
+        - name: cpf
+          in: query
+      responses:
+        "200":
+          description: OK
+"""
+
+
+def test_locate_keys_with_dots_and_list_items():
+    index = PositionIndex(SPEC)
+
+    assert index.locate("paths./v1.0/users.get") == (4, 5)
+    assert index.locate("paths./v1.0/users.get.parameters[0].name") == (6, 11)
+    assert index.locate("paths./v1.0/users.get.responses.200") == (9, 9)
+
+
+def test_locate_falls_back_to_deepest_known_part():
+    index = PositionIndex(SPEC)
+
+    assert index.locate("paths./v1.0/users.get.security") == (4, 5)
+    assert index.locate("servers") is None
+
+
+def test_index_is_composed_only_on_lookup(tmp_path):
+    index = PositionIndex(file_path=str(tmp_path / "missing.yaml"))
+
+    # Nothing is read until a position is needed, and failures are not fatal
+    assert index.content is None
+    assert index.locate("paths") is None
+
+
+def test_cli_positions_in_json_report():
+    result = CliRunner().invoke(
+        main, [PROBLEM_SPEC, "--config", CONFIG_FILE, "--json", "--positions"]
+    )
+
+    output = json.loads(result.output)
+    entries = output["findings"] + output["security_issues"] + output["lgpd_issues"]
+    assert entries
+    assert all(isinstance(entry["line"], int) for entry in entries)
+    email = next(e for e in output["findings"] if e["path"] == "info.contact.email")
+    with open(PROBLEM_SPEC, encoding="utf-8") as f:
+        line = f.read().splitlines()[email["line"] - 1]
+    assert line[email["column"] - 1 :].startswith("email:")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from lokus.deep_search import deep_search_forbidden_keys
+from lokus.lgpd_validator import LGPDValidator
+from lokus.rules import RuleSelection
+from lokus.security_validator import SecurityValidator
+
+
+def test_empty_selection_enables_everything():
+    selection = RuleSelection()
+    assert selection.is_enabled("BOLA-001", "security")
+    assert selection.is_enabled("forbidden_key", "deep_search")
+
+
+def test_only_by_family_and_validator():
+    selection = RuleSelection(only=["bola-*", "lgpd"])
+    assert selection.is_enabled("BOLA-001", "security")
+    assert not selection.is_enabled("RATE-001", "security")
+    assert selection.is_enabled("LGPD-003", "lgpd")
+    assert not selection.validator_enabled("deep_search", ["forbidden_key"])
+
+
+def test_skip_wins_over_only():
+    selection = RuleSelection(only=["LGPD-*"], skip=["LGPD-005"])
+    assert selection.is_enabled("LGPD-001", "lgpd")
+    assert not selection.is_enabled("LGPD-005", "lgpd")
+
+
+def test_from_options_merges_config_and_cli():
+    config = {"rules": {"only": ["security"], "skip": ["RATE-001"]}}
+    selection = RuleSelection.from_options(config, only=(), skip=("AUTH-001,BFLA-001",))
+    assert selection.only == ["security"]
+    assert selection.skip == ["RATE-001", "AUTH-001", "BFLA-001"]
+
+    selection = RuleSelection.from_options(config, only=("lgpd",))
+    assert selection.only == ["lgpd"]
+
+
+def test_unmatched_selectors():
+    selection = RuleSelection(only=["BOLA-*", "NOPE-*"], skip=["lgpd"])
+    known = {"security": ["BOLA-001"], "lgpd": ["LGPD-001"]}
+    assert selection.unmatched(known) == ["NOPE-*"]
+
+
+def test_validators_only_run_selected_checks(monkeypatch):
+    def fail(self, spec, ctx):
+        raise AssertionError("disabled check was run")
+
+    monkeypatch.setattr(LGPDValidator, "_check_sensitive_data_in_examples", fail)
+    spec = {"paths": {"/users": {"post": {"summary": "Create user"}}}}
+
+    lgpd_issues = LGPDValidator(RuleSelection(only=["LGPD-006"])).validate_spec(spec)
+    assert [issue.rule_id for issue in lgpd_issues] == ["LGPD-006"]
+
+    security_issues = SecurityValidator(RuleSelection(skip=["RATE-001"])).validate_spec(
+        spec
+    )
+    assert {issue.rule_id for issue in security_issues} == {"BFLA-001"}
+
+
+def test_deep_search_skips_disabled_rule_types():
+    config = {
+        "forbidden_keys": ["password"],
+        "forbidden_key_patterns": [".*_token$"],
+        "forbidden_keys_at_paths": [],
+        "allowed_exceptions": [],
+    }
+    data = {"password": 1, "auth_token": 2}
+    findings = deep_search_forbidden_keys(
+        data, "", config, selection=RuleSelection(skip=["forbidden_key_pattern"])
+    )
+    assert [finding["type"] for finding in findings] == ["forbidden_key"]
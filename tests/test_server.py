@@ -0,0 +1,142 @@
+import os
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from lokus.cli import main
+from lokus.server import ScanService, create_server, remote_scan
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+
+
+@pytest.fixture
+def server():
+    """Runs a lokus server on a free local port for the duration of a test."""
+    server = create_server(ScanService(CONFIG_FILE), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_scan_spec_body_is_cached(server):
+    service, url = server[0].service, server[1]
+    request = {"spec": _read(PROBLEM_SPEC), "source": PROBLEM_SPEC}
+
+    first = remote_scan(url, request)
+    second = remote_scan(url, request)
+
+    assert first["swagger_file"] == PROBLEM_SPEC
+    assert first["findings"]
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["findings"] == first["findings"]
+    assert len(service._results) == 1
+
+
+def test_scan_path_honours_rule_selection(server):
+    url = server[1]
+    report = remote_scan(url, {"path": PROBLEM_SPEC, "only": ["deep_search"]})
+
+    assert report["findings"]
+    assert report["security_issues"] == []
+    assert report["lgpd_issues"] == []
+
+
+def test_positions_do_not_leak_into_cache():
+    service = ScanService(CONFIG_FILE)
+    request = {"spec": _read(PROBLEM_SPEC)}
+
+    located = service.scan({**request, "positions": True})
+    plain = service.scan(request)
+
+    assert all("line" in finding for finding in located["findings"])
+    assert plain["cached"] is True
+    assert all("line" not in finding for finding in plain["findings"])
+
+
+def test_rulesets_are_normalized_and_bounded():
+    service = ScanService(CONFIG_FILE, max_cached_rulesets=2)
+    config_data = service.config(CONFIG_FILE)
+
+    first = service.ruleset(CONFIG_FILE, config_data, ["lgpd", "deep_search"])
+    same = service.ruleset(CONFIG_FILE, config_data, ["deep_search", "lgpd", "lgpd"])
+    assert same is first
+
+    service.ruleset(CONFIG_FILE, config_data, ["lgpd"])
+    service.ruleset(CONFIG_FILE, config_data, ["deep_search"])
+    assert len(service._rulesets) == 2
+    # The least recently used ruleset was dropped
+    assert (
+        service.ruleset(CONFIG_FILE, config_data, ["lgpd", "deep_search"]) is not first
+    )
+
+
+def test_invalid_request_is_rejected(server):
+    url = server[1]
+    with pytest.raises(ValueError, match="'spec' or 'path'"):
+        remote_scan(url, {})
+    # A string would otherwise be read as one selector per character
+    with pytest.raises(ValueError, match="'only' must be a list"):
+        remote_scan(url, {"path": PROBLEM_SPEC, "only": "lgpd"})
+    with pytest.raises(ValueError, match="not a valid YAML dictionary"):
+        remote_scan(url, {"spec": "- a list"})
+
+
+def test_unix_socket(tmp_path):
+    socket_path = str(tmp_path / "lokus.sock")
+    server = create_server(ScanService(CONFIG_FILE), socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        report = remote_scan(f"unix://{socket_path}", {"path": PROBLEM_SPEC})
+        assert report["findings"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cli_remote_matches_local_scan(server):
+    url = server[1]
+    runner = CliRunner()
+
+    local = runner.invoke(main, [PROBLEM_SPEC, "--config", CONFIG_FILE, "--json"])
+    remote = runner.invoke(
+        main, [PROBLEM_SPEC, "--config", CONFIG_FILE, "--json", "--remote", url]
+    )
+
+    assert local.exit_code == remote.exit_code == 1
+    assert remote.output == local.output
+
+
+def test_cli_remote_unreachable():
+    runner = CliRunner()
+    result = runner.invoke(
+        main, [PROBLEM_SPEC, "--remote", "unix:///nonexistent/lokus.sock"]
+    )
+
+    assert result.exit_code == 1
+    assert "Could not reach lokus server" in result.output
+
+
+def test_config_reloads_when_an_extended_file_changes(tmp_path):
+    base = tmp_path / "base.yaml"
+    base.write_text("forbidden_keys: [firstKey]\n")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("extends: base.yaml\n")
+    service = ScanService(str(config_file))
+
+    assert service.config(str(config_file))["forbidden_keys"] == ["firstKey"]
+    base.write_text("forbidden_keys: [secondKey]\n")
+    os.utime(base, (0, 0))
+
+    assert service.config(str(config_file))["forbidden_keys"] == ["secondKey"]
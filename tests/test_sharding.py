@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from lokus.api import Ruleset, read_spec
+from lokus.cli import main
+from lokus.config_loader import load_config
+from lokus.parallel import partition_units
+from lokus.sharding import (
+    MODE_SPEC,
+    build_partial,
+    merge_partials,
+    parse_shard,
+    scan_spec_shard,
+    shard_files,
+    shard_spec,
+)
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+PROBLEM_SPEC = os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml")
+CLEAN_SPEC = os.path.join(SAMPLES_DIR, "sample_clean_spec.yaml")
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("0/4", "5/4", "1", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_shards_cover_every_file_once():
+    files = [f"specs/service{i}/openapi.yaml" for i in range(50)]
+
+    shards = [shard_files(files, index, 3) for index in (1, 2, 3)]
+
+    assert sorted(f for shard in shards for f in shard) == sorted(files)
+    assert shards == [shard_files(files, index, 3) for index in (1, 2, 3)]
+
+
+def test_spec_shards_cover_every_unit_once():
+    spec = read_spec(PROBLEM_SPEC)
+
+    units = [
+        unit
+        for index in (1, 2, 3)
+        for unit, _ in partition_units(shard_spec(spec, index, 3))
+    ]
+
+    assert sorted(map(str, units)) == sorted(
+        str(unit) for unit, _ in partition_units(spec)
+    )
+
+
+def test_merged_spec_shards_match_full_scan():
+    spec = read_spec(PROBLEM_SPEC)
+    ruleset = Ruleset(load_config(CONFIG_FILE))
+    partials = [
+        build_partial(
+            {PROBLEM_SPEC: scan_spec_shard(spec, ruleset, index, 3)},
+            index,
+            3,
+            MODE_SPEC,
+            CONFIG_FILE,
+        )
+        for index in (1, 2, 3)
+    ]
+
+    mode, config_file, results = merge_partials(json.loads(json.dumps(partials)))
+
+    expected = ruleset.scan(spec)
+    assert (mode, config_file) == (MODE_SPEC, CONFIG_FILE)
+    assert set(results[PROBLEM_SPEC].fingerprints()) == set(expected.fingerprints())
+
+
+def test_merge_rejects_incomplete_runs(capsys):
+    partial = build_partial({}, 1, 2, MODE_SPEC, CONFIG_FILE)
+
+    assert merge_partials([partial]) is None
+    assert "Missing partial results for shard(s) [2]" in capsys.readouterr().out
+    assert merge_partials([partial, partial]) is None
+
+
+def test_cli_shard_and_merge_round_trip(tmp_path):
+    specs_dir = tmp_path / "specs"
+    specs_dir.mkdir()
+    for i in range(4):
+        sample = PROBLEM_SPEC if i % 2 else CLEAN_SPEC
+        shutil.copy(sample, specs_dir / f"api{i}.yaml")
+
+    runner = CliRunner()
+    partial_files = []
+    for index in (1, 2):
+        result = runner.invoke(
+            main,
+            [str(specs_dir), "--config", CONFIG_FILE, "--shard", f"{index}/2"],
+        )
+        assert result.exit_code == 0, result.output
+        partial_file = tmp_path / f"shard{index}.json"
+        partial_file.write_text(result.output)
+        partial_files.append(str(partial_file))
+
+    merged = runner.invoke(main, ["merge", "--json"] + partial_files)
+
+    assert merged.exit_code == 1
+    reports = json.loads(merged.output)["reports"]
+    assert [os.path.basename(report["swagger_file"]) for report in reports] == [
+        f"api{i}.yaml" for i in range(4)
+    ]
+    ruleset = Ruleset(load_config(CONFIG_FILE))
+    for report in reports:
+        expected = ruleset.scan(read_spec(report["swagger_file"])).to_dict()
+        assert {key: report[key] for key in expected} == expected
+
+    missing = runner.invoke(main, ["merge", partial_files[0]])
+    assert missing.exit_code == 2
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+import copy
+
+import pytest
+
+from lokus.spec_diff import diff_specs, ref_to_unit, split_units
+
+
+@pytest.fixture
+def old_spec():
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Test API", "version": "1.0.0"},
+        "paths": {
+            "/users": {
+                "parameters": [{"name": "tenant", "in": "header"}],
+                "get": {
+                    "responses": {
+                        "200": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/User"}
+                                }
+                            }
+                        }
+                    }
+                },
+                "post": {"description": "Create a user"},
+            },
+            "/health": {"get": {"security": [{"key": []}]}},
+        },
+        "components": {
+            "schemas": {
+                "User": {"type": "object", "properties": {"id": {"type": "string"}}},
+                "Unused": {"type": "object"},
+            }
+        },
+    }
+
+
+def test_split_units(old_spec):
+    units = split_units(old_spec)
+    assert ("paths", "/users", "get") in units
+    assert units[("paths", "/users", None)] == {
+        "parameters": [{"name": "tenant", "in": "header"}]
+    }
+    assert ("components", "schemas", "User") in units
+    assert ("info",) in units
+
+
+def test_ref_to_unit():
+    assert ref_to_unit("#/components/schemas/User/properties/id") == (
+        "components",
+        "schemas",
+        "User",
+    )
+    assert ref_to_unit("#/definitions/User") == ("definitions", "User")
+    assert ref_to_unit("other.yaml#/User") == ()
+
+
+def test_identical_specs_scan_nothing(old_spec):
+    diff = diff_specs(old_spec, copy.deepcopy(old_spec))
+    assert diff.is_empty
+    assert diff.new_spec == {}
+
+
+def test_changed_operation_only(old_spec):
+    new_spec = copy.deepcopy(old_spec)
+    new_spec["paths"]["/health"]["get"]["description"] = "Health check"
+    diff = diff_specs(old_spec, new_spec)
+    assert diff.changed == {("paths", "/health", "get")}
+    assert list(diff.new_spec["paths"]) == ["/health"]
+    assert "components" not in diff.new_spec
+
+
+def test_changed_component_rescans_referrers(old_spec):
+    new_spec = copy.deepcopy(old_spec)
+    new_spec["components"]["schemas"]["User"]["properties"]["email"] = {
+        "type": "string"
+    }
+    diff = diff_specs(old_spec, new_spec)
+    assert ("paths", "/users", "get") in diff.scanned
+    assert ("paths", "/users", "post") not in diff.scanned
+    assert "Unused" not in diff.new_spec["components"]["schemas"]
+    # Operations keep their path-level keys
+    assert "parameters" in diff.new_spec["paths"]["/users"]
+
+
+def test_removed_operation_only_in_old_spec(old_spec):
+    new_spec = copy.deepcopy(old_spec)
+    del new_spec["paths"]["/users"]["post"]
+    diff = diff_specs(old_spec, new_spec)
+    assert diff.removed == {("paths", "/users", "post")}
+    assert "post" in diff.old_spec["paths"]["/users"]
+    assert "post" not in diff.new_spec["paths"]["/users"]
+
+
+def test_malformed_paths_are_a_plain_unit():
+    old_spec = {"openapi": "3.0.0", "paths": []}
+    new_spec = {"openapi": "3.0.0", "paths": {"/a": {}}}
+    diff = diff_specs(old_spec, new_spec)
+    assert diff.removed == {("paths",)}
+    assert diff.added == {("paths", "/a", None)}
+    assert diff.old_spec == {"paths": []}
+    assert diff.new_spec == {"paths": {"/a": {}}}
+    assert diff_specs(new_spec, old_spec).new_spec == {"paths": []}
@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from lokus.baseline import FindingFilter, fingerprint
+from lokus.lgpd_validator import LGPDValidator
+from lokus.security_validator import SecurityValidator
+from lokus.validation import ValidationContext
+
+THREADS = 8
+ROUNDS = 25
+
+
+def _spec(n):
+    """A spec whose every issue path is unique to `n`."""
+    paths = {
+        f"/tenant{n}/users/{{id}}/op{i}": {
+            "get": {"responses": {"200": {"description": "OK"}}},
+            "delete": {"responses": {"204": {"description": "Gone"}}},
+        }
+        for i in range(20)
+    }
+    return {
+        "openapi": "3.0.0",
+        "paths": paths,
+        "components": {
+            "schemas": {
+                f"User{n}": {
+                    "type": "object",
+                    "properties": {"cpf": {"type": "string"}, "nickname": {}},
+                }
+            }
+        },
+    }
+
+
+def _keys(issues):
+    return [(issue.rule_id, issue.path) for issue in issues]
+
+
+def test_shared_validators_do_not_interleave_results():
+    validators = [SecurityValidator(), LGPDValidator()]
+    specs = [_spec(n) for n in range(THREADS)]
+    expected = {
+        (v, n): _keys(validator.validate_spec(specs[n]))
+        for v, validator in enumerate(validators)
+        for n in range(THREADS)
+    }
+    barrier = threading.Barrier(THREADS)
+
+    def work(n):
+        barrier.wait()
+        results = []
+        for _ in range(ROUNDS):
+            for v, validator in enumerate(validators):
+                results.append((v, _keys(validator.validate_spec(specs[n]))))
+        return n, results
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        for n, results in pool.map(work, range(THREADS)):
+            for v, keys in results:
+                assert keys == expected[(v, n)]
+                assert all(
+                    f"tenant{n}" in path or f"User{n}" in path for _, path in keys
+                )
+
+
+def test_per_call_filter_counts_are_separate():
+    validator = SecurityValidator()
+    spec = _spec(0)
+    baseline = {
+        fingerprint("RATE-001", f"paths./tenant0/users/{{id}}/op{i}.get.responses")
+        for i in range(20)
+    }
+    first, second = FindingFilter(baseline=baseline), FindingFilter()
+
+    suppressed = validator.validate_spec(spec, first)
+    unfiltered = validator.validate_spec(spec, second)
+
+    assert first.suppressed == 20
+    assert second.suppressed == 0
+    assert len(unfiltered) - len(suppressed) == 20
+
+
+def test_context_emit_applies_filter():
+    ctx = ValidationContext(FindingFilter("HIGH"))
+    validator = LGPDValidator()
+    issues = validator.validate_spec(_spec(1))
+    for issue in issues:
+        ctx.emit(issue)
+    assert ctx.issues == [i for i in issues if i.severity.value == "HIGH"]
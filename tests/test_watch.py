@@ -0,0 +1,107 @@
+import os
+import shutil
+
+from lokus.api import Ruleset
+from lokus.config_loader import load_config
+from lokus.watch import SpecWatcher
+
+SAMPLES_DIR = "tests/samples"
+CONFIG_FILE = os.path.join(SAMPLES_DIR, "config.yaml")
+
+
+def _watcher(paths):
+    return SpecWatcher(
+        paths,
+        CONFIG_FILE,
+        Ruleset(load_config(CONFIG_FILE)),
+        interval=0.01,
+        debounce=0.01,
+    )
+
+
+def _touch_later(file_path, content):
+    # Make sure the new version gets a different stamp than the old one
+    stat = os.stat(file_path)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_only_changed_file_is_rescanned_with_delta(tmp_path, capsys):
+    clean = tmp_path / "clean.yaml"
+    problem = tmp_path / "problem.yaml"
+    shutil.copy(os.path.join(SAMPLES_DIR, "sample_clean_spec.yaml"), clean)
+    shutil.copy(os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml"), problem)
+
+    watcher = _watcher([str(tmp_path)])
+    watcher.start()
+    before = watcher.results[str(problem)]
+    capsys.readouterr()
+
+    content = problem.read_text(encoding="utf-8")
+    _touch_later(str(problem), content.replace("secretKey", "publicKey"))
+
+    changed = watcher.wait_for_changes()
+    assert changed == [str(problem)]
+
+    deltas = watcher.rescan(changed)
+    new, resolved = deltas[str(problem)]
+    assert [s["rule_id"] for s in resolved.summaries()] == ["forbidden_key"]
+    assert not new.has_issues
+    assert len(watcher.results[str(problem)].findings) == len(before.findings) - 1
+
+    output = capsys.readouterr().out
+    assert "0 new, 1 resolved" in output
+    assert str(clean) not in output
+
+
+def test_unchanged_findings_print_no_delta(tmp_path, capsys):
+    problem = tmp_path / "problem.yaml"
+    shutil.copy(os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml"), problem)
+
+    watcher = _watcher([str(problem)])
+    watcher.start()
+    _touch_later(str(problem), problem.read_text(encoding="utf-8") + "\n# comment\n")
+
+    assert watcher.rescan(watcher.wait_for_changes()) == {}
+    assert "no changes in findings" in capsys.readouterr().out
+
+
+def test_new_and_deleted_specs(tmp_path):
+    watcher = _watcher([str(tmp_path)])
+    watcher.start()
+    assert watcher.results == {}
+
+    spec = tmp_path / "new.yaml"
+    shutil.copy(os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml"), spec)
+    new, _ = watcher.rescan(watcher.wait_for_changes())[str(spec)]
+    assert new.has_issues
+
+    spec.unlink()
+    _, resolved = watcher.rescan(watcher.wait_for_changes())[str(spec)]
+    assert resolved.has_issues
+    assert str(spec) not in watcher.results
+
+
+def test_config_change_recompiles_rules(tmp_path, capsys):
+    config = tmp_path / "config.yaml"
+    config.write_text("forbidden_keys: []\n")
+    spec = tmp_path / "spec.yaml"
+    shutil.copy(os.path.join(SAMPLES_DIR, "sample_problem_spec.yaml"), spec)
+
+    watcher = SpecWatcher(
+        [str(spec)],
+        str(config),
+        Ruleset(load_config(str(config)), only=["deep_search"]),
+        interval=0.01,
+        debounce=0.01,
+    )
+    watcher.start()
+    assert not watcher.results[str(spec)].has_issues
+
+    _touch_later(str(config), 'forbidden_keys: ["secretKey"]\n')
+    new, _ = watcher.rescan(watcher.wait_for_changes())[str(spec)]
+    assert [s["rule_id"] for s in new.summaries()] == ["forbidden_key"]
+    # The rule selection given on the command line is kept
+    assert watcher.ruleset.only == ["deep_search"]
+    assert "reloaded" in capsys.readouterr().out